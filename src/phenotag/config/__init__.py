@@ -4,6 +4,8 @@
 PhenoTag Config module
 """
 
+import copy
+import functools
 from pathlib import Path
 from typing import Dict, Optional
 from phenotag.io_tools import load_yaml
@@ -18,7 +20,9 @@ def load_config_files(stations_path: Optional[str] = None, flags_path: Optional[
         flags_path: Optional path to flags.yaml for phenocams. If not provided, will look in default locations.
         
     Returns:
-        Dict containing the loaded configuration data with keys 'stations' and 'flags'
+        Dict containing the loaded configuration data with keys 'stations' and 'flags'.
+        The files are parsed once per process; every call returns its own deep copy,
+        so callers may modify it.
         
     Raises:
         FileNotFoundError: If the configuration files cannot be found
@@ -32,6 +36,12 @@ def load_config_files(stations_path: Optional[str] = None, flags_path: Optional[
     assert Path(stations_path).exists(), f"Stations file not found at {stations_path}"    
     assert Path(flags_path).exists(), f"Flags file not found at {flags_path}"
     
+    return copy.deepcopy(_load_config_cached(str(stations_path), str(flags_path)))
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(stations_path: str, flags_path: str) -> Dict:
+    """Parse the stations and flags configuration files (cached per pair of paths)."""
     # Load configurations
     config = {
         'stations': load_yaml(stations_path),
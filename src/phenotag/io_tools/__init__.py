@@ -12,10 +12,21 @@ from typing import Union, Dict, List, Optional, Tuple, Any
 import requests
 import yaml
 import os
+import logging
 import cv2
 import numpy as np
 from collections import defaultdict
 
+# Prefer the libyaml C bindings, falling back to the pure-Python implementations.
+# Other modules import SafeLoader/SafeDumper from here, so they are defined
+# before the submodule imports below.
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+logger = logging.getLogger(__name__)
+
 # Import the directory scanner
 from .directory_scanner import (
     get_available_years,
@@ -82,7 +93,7 @@ def load_yaml(filepath: Union[str, Path]) -> dict:
         try:
             response = requests.get(filepath)
             response.raise_for_status()  # Raises a HTTPError if the response status is 4xx, 5xx
-            yaml_data = yaml.safe_load(response.text)
+            yaml_data = yaml.load(response.text, Loader=SafeLoader)
             return yaml_data
         except requests.RequestException as e:
             raise requests.RequestException(f"Error fetching the YAML file from {filepath}: {e}")
@@ -94,24 +105,33 @@ def load_yaml(filepath: Union[str, Path]) -> dict:
             raise FileNotFoundError(f"The file {filepath} does not exist.")
         try:
             with open(path, 'r', encoding='utf-8') as file:
-                return yaml.safe_load(file)
+                return yaml.load(file, Loader=SafeLoader)
         except FileNotFoundError as e:
             raise FileNotFoundError(f"The file {filepath} was not found: {e}")
         except yaml.YAMLError as e:
             raise yaml.YAMLError(f"Error parsing the YAML file from {filepath}: {e}")
 
 
-def save_yaml(data: Dict[str, Any], filepath: Union[str, Path]) -> bool:
+def save_yaml(data: Dict[str, Any], filepath: Union[str, Path], fsync: bool = False,
+              default_flow_style: Optional[bool] = False) -> bool:
     """
     Saves data to a YAML file.
     
+    The YAML is written to a temporary file next to the target and moved into
+    place with os.replace(), so readers never see a partially written file.
+    
     Parameters:
         data (dict): The data to save.
         filepath (str or Path): The path to save the YAML file to.
+        fsync (bool): Flush the file, and on POSIX its directory entry, to disk.
+            Slower, but the saved data survives a crash or power loss.
+        default_flow_style (bool or None): Passed to the YAML dumper. None writes
+            collections of plain scalars (such as flag lists) inline, e.g. [a, b].
         
     Returns:
         bool: True if successful, False otherwise.
     """
+    tmp_path = None
     try:
         # Convert to Path if it's a string
         if isinstance(filepath, str):
@@ -120,13 +140,29 @@ def save_yaml(data: Dict[str, Any], filepath: Union[str, Path]) -> bool:
         # Create directory if it doesn't exist
         filepath.parent.mkdir(parents=True, exist_ok=True)
         
-        # Write YAML file
-        with open(filepath, 'w', encoding='utf-8') as file:
-            yaml.dump(data, file, default_flow_style=False, sort_keys=False)
+        # Stream the YAML straight to the file; with an encoding set the emitter
+        # writes UTF-8 bytes in chunks, bypassing a text-mode wrapper
+        tmp_path = filepath.with_name(filepath.name + '.tmp')
+        with open(tmp_path, 'wb', buffering=1 << 20) as file:
+            yaml.dump(data, file, Dumper=SafeDumper, encoding='utf-8',
+                      default_flow_style=default_flow_style, sort_keys=False)
+            if fsync:
+                file.flush()
+                os.fsync(file.fileno())
+        os.replace(tmp_path, filepath)
+        if fsync and os.name == 'posix':
+            # The rename is only durable once the directory itself is flushed
+            dir_fd = os.open(filepath.parent, os.O_RDONLY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
         
         return True
     except Exception as e:
-        print(f"Error saving YAML file to {filepath}: {e}")
+        logger.error("Error saving YAML file to %s: %s", filepath, e)
+        if tmp_path is not None and tmp_path.exists():
+            tmp_path.unlink()
         return False
 
 
@@ -192,10 +228,10 @@ def load_annotations(base_dir: str, station_name: str,
         if annotations_file.exists():
             return load_yaml(annotations_file)
         else:
-            print(f"No annotations file found at {annotations_file}")
+            logger.debug("No annotations file found at %s", annotations_file)
             return {}
     except Exception as e:
-        print(f"Error loading annotations: {e}")
+        logger.error("Error loading annotations: %s", e)
         return {}
 
 
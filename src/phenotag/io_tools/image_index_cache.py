@@ -19,6 +19,7 @@ The index structure:
 }
 """
 
+import os
 import re
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union
@@ -144,29 +145,34 @@ def build_year_index(
 
     index: Dict[str, Dict[str, str]] = defaultdict(dict)
 
+    # List the year directory once. Entries are filtered by name before
+    # is_dir()/is_file(), which reuse the type scandir reported where available.
+    with os.scandir(year_dir) as entries:
+        year_entries = list(entries)
+
     # Check if this year has DOY subdirectories or flat files
-    has_doy_dirs = any(item.is_dir() and item.name.isdigit() for item in year_dir.iterdir())
+    doy_dirs = [entry for entry in year_entries if entry.name.isdigit() and entry.is_dir()]
 
-    if has_doy_dirs:
+    if doy_dirs:
         # Nested structure: /L1/year/doy/*.jpg
-        for doy_dir in year_dir.iterdir():
-            if doy_dir.is_dir() and doy_dir.name.isdigit():
-                doy = doy_dir.name.zfill(3)
-                for file_path in doy_dir.iterdir():
-                    if file_path.is_file() and file_path.name.lower().endswith(('.jpg', '.jpeg')):
-                        timestamp = extract_timestamp_from_filename(file_path.name)
+        for doy_dir in doy_dirs:
+            doy = doy_dir.name.zfill(3)
+            with os.scandir(doy_dir.path) as entries:
+                for entry in entries:
+                    if entry.name.lower().endswith(('.jpg', '.jpeg')) and entry.is_file():
+                        timestamp = extract_timestamp_from_filename(entry.name)
                         if timestamp:
-                            index[doy][timestamp] = str(file_path)
+                            index[doy][timestamp] = entry.path
                         else:
                             # Fallback: use filename as timestamp
-                            index[doy][file_path.stem] = str(file_path)
+                            index[doy][os.path.splitext(entry.name)[0]] = entry.path
     else:
         # Flat structure: /L1/year/*.jpg
-        for file_path in year_dir.iterdir():
-            if file_path.is_file() and file_path.name.lower().endswith(('.jpg', '.jpeg')):
-                parsed = parse_filename(file_path.name)
+        for entry in year_entries:
+            if entry.name.lower().endswith(('.jpg', '.jpeg')) and entry.is_file():
+                parsed = parse_filename(entry.name)
                 if parsed:
-                    index[parsed['doy']][parsed['timestamp']] = str(file_path)
+                    index[parsed['doy']][parsed['timestamp']] = entry.path
 
     # Convert defaultdict to regular dict and sort timestamps within each DOY
     return {doy: dict(sorted(timestamps.items())) for doy, timestamps in sorted(index.items())}
@@ -2,10 +2,15 @@
 Functions for loading annotations
 """
 
+import logging
 from pathlib import Path
 from typing import Union, Dict, Any
 import yaml
 
+from phenotag.io_tools import SafeLoader
+
+logger = logging.getLogger(__name__)
+
 
 def load_yaml(filepath: Union[str, Path]) -> dict:
     """
@@ -26,7 +31,7 @@ def load_yaml(filepath: Union[str, Path]) -> dict:
         raise FileNotFoundError(f"The file {filepath} does not exist.")
     try:
         with open(path, 'r', encoding='utf-8') as file:
-            return yaml.safe_load(file)
+            return yaml.load(file, Loader=SafeLoader)
     except yaml.YAMLError as e:
         raise yaml.YAMLError(f"Error parsing the YAML file from {filepath}: {e}")
 
@@ -58,7 +63,7 @@ def load_annotations(base_dir: str, station_name: str,
         # First check for day status file (most recent format)
         day_status_file = annotations_dir / f'day_status_{day}.yaml'
         if day_status_file.exists():
-            print(f"Found day status file: {day_status_file}")
+            logger.debug("Found day status file: %s", day_status_file)
             day_status = load_yaml(day_status_file)
             
             # If day status exists, look for individual image annotation files
@@ -74,7 +79,7 @@ def load_annotations(base_dir: str, station_name: str,
                         if 'annotations' in img_data:
                             per_image_annotations[image_filename] = img_data['annotations']
                     except Exception as img_err:
-                        print(f"Error loading per-image annotation file {img_annotation_file}: {img_err}")
+                        logger.error("Error loading per-image annotation file %s: %s", img_annotation_file, img_err)
             
             # Return per-image annotations if found
             if per_image_annotations:
@@ -93,22 +98,22 @@ def load_annotations(base_dir: str, station_name: str,
                 if 'annotations' in img_data and 'filename' in img_data:
                     per_image_annotations[img_data['filename']] = img_data['annotations']
             except Exception as img_err:
-                print(f"Error loading per-image annotation file {img_annotation_file}: {img_err}")
+                logger.error("Error loading per-image annotation file %s: %s", img_annotation_file, img_err)
         
         # Return per-image annotations if found
         if per_image_annotations:
-            print(f"Loaded {len(per_image_annotations)} per-image annotation files from {annotations_dir}")
+            logger.debug("Loaded %s per-image annotation files from %s", len(per_image_annotations), annotations_dir)
             return {'annotations': per_image_annotations}
             
         # Finally fallback to the old day-level annotation file
         old_annotation_file = annotations_dir / f'annotations_{day}.yaml'
         if old_annotation_file.exists():
-            print(f"Using legacy day-level annotation file: {old_annotation_file}")
+            logger.debug("Using legacy day-level annotation file: %s", old_annotation_file)
             return load_yaml(old_annotation_file)
             
         # No annotation files found
-        print(f"No annotation files found in {annotations_dir}")
+        logger.debug("No annotation files found in %s", annotations_dir)
         return {}
     except Exception as e:
-        print(f"Error loading annotations: {e}")
+        logger.error("Error loading annotations: %s", e)
         return {}
\ No newline at end of file
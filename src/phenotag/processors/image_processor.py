@@ -7,6 +7,8 @@ import os
 from io import BytesIO
 import gc  # Garbage collector for explicit memory management
 
+from phenotag.io_tools import SafeLoader
+
 class ImageProcessor:
     def __init__(self, image_path: str = None, downscale_factor: float = 1.0):
         """
@@ -434,7 +436,7 @@ class ImageProcessor:
             
         try:
             with open(yaml_path, 'r') as file:
-                data = yaml.safe_load(file)
+                data = yaml.load(file, Loader=SafeLoader)
                 
             if 'rois' not in data or not data['rois']:
                 print("No ROIs found in YAML file, creating default ROI")
@@ -1082,7 +1084,7 @@ class ImageProcessor:
         if yaml_path and os.path.exists(yaml_path):
             try:
                 with open(yaml_path, 'r') as file:
-                    data = yaml.safe_load(file)
+                    data = yaml.load(file, Loader=SafeLoader)
                 if 'rois' in data:
                     rois_dict = data['rois']
             except Exception as e:
@@ -1,3 +1,4 @@
+import logging
 import streamlit as st
 import pandas as pd
 import numpy as np
@@ -5,6 +6,8 @@ import datetime
 import calendar
 from typing import Dict, List, Optional, Tuple, Union
 
+logger = logging.getLogger(__name__)
+
 def generate_month_calendar(year: int, month: int, image_counts: Dict[str, int] = None) -> pd.DataFrame:
     """
     Generate a calendar dataframe for the specified month with day of year and image counts.
@@ -57,10 +60,10 @@ def generate_month_calendar(year: int, month: int, image_counts: Dict[str, int]
                 
                 # Debug output for specific days (like day 90)
                 if doy in [90]:
-                    print(f"Calendar - Day {doy} search:")
-                    print(f"  - Checking formats: {doy_padded}, {doy_unpadded}, {doy_as_int}")
+                    logger.debug("Calendar - Day %s search:", doy)
+                    logger.debug("  - Checking formats: %s, %s, %s", doy_padded, doy_unpadded, doy_as_int)
                     if image_counts:
-                        print(f"  - Available keys in image_counts: {list(image_counts.keys())[:10]}")
+                        logger.debug("  - Available keys in image_counts: %s", list(image_counts.keys())[:10])
 
                 # Try all formats to be more resilient
                 img_count = 0
@@ -69,18 +72,18 @@ def generate_month_calendar(year: int, month: int, image_counts: Dict[str, int]
                     if doy_padded in image_counts:
                         img_count = image_counts[doy_padded]
                         if doy in [90]:
-                            print(f"  - Found in padded format: {img_count} images")
+                            logger.debug("  - Found in padded format: %s images", img_count)
                     elif doy_unpadded in image_counts:
                         img_count = image_counts[doy_unpadded]
                         if doy in [90]:
-                            print(f"  - Found in unpadded format: {img_count} images")
+                            logger.debug("  - Found in unpadded format: %s images", img_count)
                     elif doy_as_int in image_counts:
                         img_count = image_counts[doy_as_int]
                         if doy in [90]:
-                            print(f"  - Found in int format: {img_count} images")
+                            logger.debug("  - Found in int format: %s images", img_count)
                     else:
                         if doy in [90]:
-                            print(f"  - Not found in any format")
+                            logger.debug("  - Not found in any format")
                 
                 # Store metadata
                 day_metadata[(week_idx, day_idx)] = {
@@ -164,7 +167,7 @@ def style_calendar_cell(day: Optional[int], metadata: Dict, max_images: int) ->
                 if status_color:
                     color = status_color
     except Exception as e:
-        print(f"Error getting annotation status for styling: {str(e)}")
+        logger.error("Error getting annotation status for styling: %s", e)
     
     style = {
         "backgroundColor": color,
@@ -207,8 +210,8 @@ def create_calendar(year: int, month: int, image_data: Dict, on_select=None):
     
     if str(year) in image_data:
         # Debug output of raw data
-        print(f"Calendar image data for year {year}, month {month}:")
-        print(f"Available days in data: {list(image_data[str(year)].keys())[:10]}")
+        logger.debug("Calendar image data for year %s, month %s:", year, month)
+        logger.debug("Available days in data: %s", list(image_data[str(year)].keys())[:10])
 
         for doy, files in image_data[str(year)].items():
             # Support both full file data and placeholder metadata
@@ -218,25 +221,25 @@ def create_calendar(year: int, month: int, image_data: Dict, on_select=None):
                     # Use the stored count
                     img_count = files["_image_count"]
                     image_counts[doy] = img_count
-                    print(f"Calendar: Found stored count for day {doy}: {img_count}")
+                    logger.debug("Calendar: Found stored count for day %s: %s", doy, img_count)
                 else:
                     # Default to 1 if no count is available
                     image_counts[doy] = 1
-                    print(f"Calendar: Using default count for day {doy}: 1")
+                    logger.debug("Calendar: Using default count for day %s: 1", doy)
             else:
                 # Normal case - count the actual files
                 img_count = len(files)
                 image_counts[doy] = img_count
-                print(f"Calendar: Counted {img_count} files for day {doy}")
+                logger.debug("Calendar: Counted %s files for day %s", img_count, doy)
                 
         # Double-check if we have data for days in March (specifically around day 90)
         month_3_days = [d for d in range(60, 92)]  # Days in March
         for d in month_3_days:
             d_padded = f"{d:03d}"
             if d_padded in image_counts:
-                print(f"Calendar: Found day {d_padded} with {image_counts[d_padded]} images")
+                logger.debug("Calendar: Found day %s with %s images", d_padded, image_counts[d_padded])
             elif str(d) in image_counts:
-                print(f"Calendar: Found day {d} with {image_counts[str(d)]} images")
+                logger.debug("Calendar: Found day %s with %s images", d, image_counts[str(d)])
     
     # Generate calendar dataframe and metadata
     calendar_df, day_metadata = generate_month_calendar(year, month, image_counts)
@@ -356,7 +359,7 @@ def create_calendar(year: int, month: int, image_data: Dict, on_select=None):
                             if status_icon:
                                 button_text = f"{button_text} {status_icon}"
                         except Exception as e:
-                            print(f"Error getting annotation status: {str(e)}")
+                            logger.error("Error getting annotation status: %s", e)
                             
                         # Current selected day (single selection)
                         is_selected = st.session_state.get('selected_day') == str(doy)
@@ -369,7 +372,7 @@ def create_calendar(year: int, month: int, image_data: Dict, on_select=None):
                                      type=button_type, disabled=disabled):
                             # No auto-save when changing day
                             if 'image_annotations' in st.session_state and st.session_state.image_annotations:
-                                print(f"No auto-save when changing day to {doy}")
+                                logger.debug("No auto-save when changing day to %s", doy)
                             
                             # Set this day as the selected day (single selection)
                             st.session_state.selected_day = str(doy)
@@ -401,7 +404,7 @@ def create_calendar(year: int, month: int, image_data: Dict, on_select=None):
     if st.button("Clear Selection", key=f"clear_{year}_{month}"):
         # No auto-save when clearing selection
         if 'image_annotations' in st.session_state and st.session_state.image_annotations:
-            print("No auto-save when clearing day selection")
+            logger.debug("No auto-save when clearing day selection")
             
         # Clear both single selection and multi-selection for backward compatibility
         st.session_state.selected_day = None
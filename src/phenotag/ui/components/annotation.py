@@ -5,23 +5,86 @@ This module provides functionality for annotating images, including
 ROI management and quality flag assignment.
 """
 import os
+import copy
+import mmap
+import logging
 import streamlit as st
 import datetime
-import pandas as pd
+import calendar
 import re
 import time
 import yaml
 import glob
+import functools
+import itertools
+import hashlib
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Tuple, Optional
 
-from phenotag.config import load_config_files
-from phenotag.io_tools import save_yaml
+from phenotag.io_tools import load_yaml, save_yaml, SafeLoader
 
 # Import ROI utilities
 from phenotag.ui.components.roi_utils import serialize_polygons, deserialize_polygons
 from phenotag.ui.components.flags_processor import FlagsProcessor
 
+logger = logging.getLogger(__name__)
+
+# Day directories are named by day of year (1 to 3 ASCII digits)
+_DOY_RE = re.compile(r'[0-9]{1,3}\Z')
+
+@st.cache_resource
+def get_flags_processor() -> FlagsProcessor:
+    """
+    Get a FlagsProcessor for the quality flags configuration.
+
+    The configuration files ship with the package, so they are read and processed
+    once per server process instead of on every rerun. Call
+    get_flags_processor.clear() to pick up edited configuration files.
+
+    Returns:
+        FlagsProcessor: Processor for the configured quality flags
+    """
+    from phenotag.config import load_config_files
+    config = load_config_files()
+    return FlagsProcessor(config.get('flags', {}))
+
+@st.cache_resource
+def get_cached_flag_options() -> List[Dict[str, Any]]:
+    """
+    Get the formatted quality flag options for UI display.
+
+    The list is shared between reruns and sessions and must not be modified.
+
+    Returns:
+        list: Flag option dictionaries from FlagsProcessor.get_flag_options()
+    """
+    return get_flags_processor().get_flag_options()
+
+@st.cache_resource
+def get_flag_display_options() -> Tuple[List[str], Dict[str, str]]:
+    """
+    Get the quality flag values and labels for the annotation widgets.
+
+    Computed once from the cached flag options; the returned containers are shared
+    between reruns and must not be modified.
+
+    Returns:
+        tuple: (multiselect_values, label_by_value) where multiselect_values lists
+        flag values ordered by category and label_by_value maps each flag value
+        to its "value (category)" label
+    """
+    # A stable sort keeps the flag order within each category
+    options = sorted(get_cached_flag_options(), key=lambda option: option.get("category", "Other"))
+    multiselect_values = [option["value"] for option in options]
+    label_by_value = {
+        option["value"]: f"{option['value']} ({option.get('category', 'Other')})"
+        for option in options
+    }
+    return multiselect_values, label_by_value
+
 # Helper functions for annotation file management
+@functools.lru_cache(maxsize=4096)
 def get_annotation_file_path(image_path: str) -> str:
     """
     Generate the file path for an image's annotation file.
@@ -38,40 +101,466 @@ def get_annotation_file_path(image_path: str) -> str:
     base_name = os.path.splitext(img_filename)[0]
     return os.path.join(img_dir, f"{base_name}_annotations.yaml")
 
-def scan_day_annotation_files(day_dir: str) -> Dict[str, str]:
+@functools.lru_cache(maxsize=4096)
+def get_image_path_parts(image_path: str) -> Tuple[str, str, str]:
+    """
+    Split an image path into the parts used to group annotations by day.
+
+    Images live in .../L1/year/day/image.jpg, so the day of year is the name of
+    the image's directory. The result is cached since the same paths are split
+    on every save.
+
+    Args:
+        image_path (str): Path to the image
+
+    Returns:
+        tuple: (image directory, image filename, day of year)
+    """
+    img_dir = os.path.dirname(image_path)
+    return img_dir, os.path.basename(image_path), os.path.basename(img_dir)
+
+@functools.lru_cache(maxsize=1024)
+def doy_to_month(year, doy) -> int:
+    """
+    Get the calendar month of a day of year.
+
+    Args:
+        year (int or str): The year
+        doy (int or str): Day of year (1-366)
+
+    Returns:
+        int: Month number (1-12)
+
+    Raises:
+        ValueError: If the day of year is outside the given year
+    """
+    year, doy = int(year), int(doy)
+    if not 1 <= doy <= (366 if calendar.isleap(year) else 365):
+        raise ValueError(f"Day of year {doy} is out of range for {year}")
+    return (datetime.date(year, 1, 1) + datetime.timedelta(days=doy - 1)).month
+
+@functools.lru_cache(maxsize=64)
+def get_base_dir_from_day_dir(day_dir: str) -> str:
+    """
+    Get the data base directory from a day directory.
+
+    Day directories are laid out as base_dir/station/phenocams/products/instrument/L1/year/day,
+    so the base directory is seven levels up.
+
+    Args:
+        day_dir (str): Path to the day directory
+
+    Returns:
+        str: Path to the base directory
+    """
+    return os.sep.join(day_dir.split(os.sep)[:-7])
+
+def _annotation_file_stamp(file_path: str) -> Tuple[int, int]:
+    """
+    Get the (modification time, size) stamp used to validate cached annotation files.
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    stat_result = os.stat(file_path)
+    return stat_result.st_mtime_ns, stat_result.st_size
+
+def read_annotation_yaml(file_path: str) -> Optional[Dict]:
+    """
+    Read an annotation YAML file, reusing the parsed data while the file is unchanged.
+
+    Parsed files are cached in session state and validated against the file's
+    modification time and size, so switching days or tabs only costs a stat().
+
+    Args:
+        file_path (str): Path to the annotation YAML file
+
+    Returns:
+        dict: Parsed file contents (None for an empty file)
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    stamp = _annotation_file_stamp(file_path)
+
+    cache = st.session_state.setdefault('_ann_yaml_cache', {})
+    cached = cache.get(file_path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    if stamp[1] == 0:
+        # mmap cannot map an empty file; an empty YAML document parses to None
+        data = None
+    else:
+        # Hand libyaml the raw bytes of the mapped file, skipping the text-mode decode copy
+        with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            data = yaml.load(mapped, Loader=SafeLoader)
+
+    cache[file_path] = (stamp, data)
+    return data
+
+def invalidate_annotation_yaml(file_path: str) -> None:
+    """
+    Drop a file from the parsed annotation cache after it has been rewritten.
+
+    Args:
+        file_path (str): Path to the annotation YAML file
+    """
+    st.session_state.setdefault('_ann_yaml_cache', {}).pop(file_path, None)
+
+def remember_annotation_yaml(file_path: str, data: Dict) -> None:
+    """
+    Store data that was just written to an annotation file in the parsed file cache.
+
+    The entry is stamped with the file's new modification time and size, so the
+    next read of the file is a cache hit instead of a re-parse. A copy of the ROI
+    list is cached, since the in-memory annotations keep changing after the save.
+
+    Args:
+        file_path (str): Path to the annotation YAML file
+        data (dict): The annotation data written to the file
+    """
+    try:
+        stamp = _annotation_file_stamp(file_path)
+    except OSError:
+        invalidate_annotation_yaml(file_path)
+        return
+
+    snapshot = dict(data)
+    if isinstance(snapshot.get('annotations'), list):
+        snapshot['annotations'] = [
+            {**roi, 'flags': list(roi.get('flags', []))} for roi in snapshot['annotations']
+        ]
+    st.session_state.setdefault('_ann_yaml_cache', {})[file_path] = (stamp, snapshot)
+
+def read_annotation_header(file_path: str) -> Dict:
+    """
+    Read the top-level scalar fields of an annotation file, such as 'created' and
+    'annotation_time_minutes'.
+
+    The file is read through read_annotation_yaml, so the parsed file is cached
+    and a later load of its ROI data does not parse it again.
+
+    Args:
+        file_path (str): Path to the annotation YAML file
+
+    Returns:
+        dict: Top-level scalar fields of the file (the 'annotations' list and other nested values are left out)
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    data = read_annotation_yaml(file_path) or {}
+    return {
+        k: v for k, v in data.items()
+        if k != 'annotations' and not isinstance(v, (dict, list))
+    }
+
+def _normalize_annotation_list(annotations_list: List[Dict]) -> List[Dict]:
+    """
+    Normalize ROI annotations read from disk so every required field exists.
+
+    Older files may store the annotations as a dict keyed by ROI name; these are
+    converted to the list format (one dict per ROI) here, once per image, so the
+    rest of the code only has to handle lists.
+
+    Args:
+        annotations_list (list or dict): ROI annotation dicts as stored in the file
+
+    Returns:
+        list: Normalized copies of the ROI annotation dicts
+    """
+    if isinstance(annotations_list, dict):
+        annotations_list = [
+            {**roi_data, 'roi_name': roi_name}
+            for roi_name, roi_data in annotations_list.items()
+            if isinstance(roi_data, dict)
+        ]
+    
+    processed_annotations = []
+    for anno in annotations_list:
+        # Create a clean copy, dropping the UI-only column older versions saved to disk.
+        # The parsed dicts belong to the annotation file cache, so they are never
+        # modified in place.
+        processed_anno = anno.copy()
+        processed_anno.pop('_flag_selector', None)
+
+        # Ensure all fields exist
+        processed_anno.setdefault('roi_name', "ROI_00")
+        processed_anno.setdefault('discard', False)
+        processed_anno.setdefault('snow_presence', False)
+        processed_anno.setdefault('not_needed', False)
+
+        # Make sure flags is a new list of unique strings, once at load time; a dict
+        # keeps the stored order, which a set would lose. The parser normally returns
+        # strings already, so they are only converted when needed.
+        flags = processed_anno.get('flags') or ()
+        if not all(type(flag) is str for flag in flags):
+            flags = [str(flag) for flag in flags]
+        processed_anno['flags'] = list(dict.fromkeys(flags))
+
+        # Add to processed list
+        processed_annotations.append(processed_anno)
+
+    return processed_annotations
+
+def annotation_signature(annotations: List[Dict]) -> tuple:
+    """
+    Build a hashable signature of an image's ROI annotations for change detection.
+
+    The signature ignores ROI order and flag order, so two annotation lists that
+    would be saved with the same content compare equal. Flags are expected to be
+    strings already: files are normalized when loaded and the widgets only offer
+    string options.
+
+    Args:
+        annotations (list): ROI annotation dictionaries
+
+    Returns:
+        tuple: Sorted per-ROI tuples of the annotated fields
+    """
+    return tuple(sorted(
+        (
+            str(annotation.get('roi_name', '')),
+            bool(annotation.get('discard', False)),
+            bool(annotation.get('snow_presence', False)),
+            tuple(sorted(annotation.get('flags') or [])),
+            bool(annotation.get('not_needed', False)),
+        )
+        for annotation in annotations or []
+    ))
+
+def get_image_annotations(filepath: str) -> Optional[List[Dict]]:
+    """
+    Get the in-memory annotations for an image, materializing them on first access.
+
+    load_day_annotations only registers which images have an annotation file in
+    st.session_state.pending_annotation_files; the ROI data of an image is parsed
+    and moved into st.session_state.image_annotations the first time it is needed.
+
+    Args:
+        filepath (str): Path to the image
+
+    Returns:
+        list: ROI annotations for the image, or None if it has none
+    """
+    if 'image_annotations' not in st.session_state:
+        st.session_state.image_annotations = {}
+
+    annotations = st.session_state.image_annotations.get(filepath)
+    if annotations is not None:
+        return annotations
+
+    pending = st.session_state.get('pending_annotation_files', {})
+    annotation_file_path = pending.pop(filepath, None)
+    if annotation_file_path is None:
+        return None
+
+    annotations = _read_pending_annotations(filepath, annotation_file_path)
+    if annotations is not None:
+        st.session_state.image_annotations[filepath] = annotations
+        # Remember what is on disk so an unchanged image is not rewritten on save
+        st.session_state.setdefault('last_saved_signatures', {})[filepath] = annotation_signature(annotations)
+    return annotations
+
+def _read_pending_annotations(filepath: str, annotation_file_path: str) -> Optional[List[Dict]]:
+    """Read and normalize the ROI annotations of one registered annotation file."""
+    try:
+        annotation_data = read_annotation_yaml(annotation_file_path)
+    except Exception as e:
+        logger.error("Error loading annotation file %s: %s", annotation_file_path, e)
+        return None
+
+    if not annotation_data or 'annotations' not in annotation_data:
+        logger.debug("No annotations data in file: %s", annotation_file_path)
+        return None
+
+    annotations = _normalize_annotation_list(annotation_data['annotations'])
+    logger.debug("Loaded annotations for %s: %d ROIs", os.path.basename(filepath), len(annotations))
+    return annotations
+
+def load_pending_annotations(filepaths=None) -> None:
+    """
+    Materialize lazily registered annotations into st.session_state.image_annotations.
+
+    The annotations are collected in a local dict and merged into session state
+    with a single update.
+
+    Args:
+        filepaths (iterable, optional): Images to materialize; all pending images if omitted
+    """
+    pending = st.session_state.get('pending_annotation_files', {})
+    if not pending:
+        return
+    if filepaths is None:
+        filepaths = list(pending)
+
+    if 'image_annotations' not in st.session_state:
+        st.session_state.image_annotations = {}
+    image_annotations = st.session_state.image_annotations
+
+    new_entries = {}
+    for filepath in filepaths:
+        annotation_file_path = pending.pop(filepath, None)
+        if annotation_file_path is None or filepath in image_annotations:
+            continue
+        annotations = _read_pending_annotations(filepath, annotation_file_path)
+        if annotations is not None:
+            new_entries[filepath] = annotations
+
+    image_annotations.update(new_entries)
+    st.session_state.setdefault('last_saved_signatures', {}).update(
+        (filepath, annotation_signature(annotations)) for filepath, annotations in new_entries.items()
+    )
+
+def get_day_annotation_paths(selected_day: str, first_filepath: str) -> Dict[str, str]:
+    """
+    Get the directory and day-level annotation file paths for a day.
+
+    Streamlit reruns the script on every interaction, so the paths are computed
+    once per (day, image directory) and cached in session state.
+
+    Args:
+        selected_day (str): The selected day
+        first_filepath (str): Path to any image of the day
+
+    Returns:
+        dict: 'img_dir', 'old_format_file' and 'day_status_file' paths
+    """
+    path_cache = st.session_state.setdefault('_ann_paths', {})
+    cache_key = (selected_day, first_filepath)
+    paths = path_cache.get(cache_key)
+    if paths is None:
+        img_dir = os.path.dirname(first_filepath)
+        paths = {
+            'img_dir': img_dir,
+            'old_format_file': os.path.join(img_dir, f"annotations_{selected_day}.yaml"),
+            'day_status_file': os.path.join(img_dir, f"day_status_{selected_day}.yaml"),
+        }
+        path_cache[cache_key] = paths
+    return paths
+
+def list_directory_names(directory: str) -> set:
+    """
+    List the entry names of a directory with a single os.scandir() call.
+
+    Args:
+        directory (str): Path to the directory
+
+    Returns:
+        set: Names of the entries in the directory (empty if it does not exist)
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except FileNotFoundError:
+        return set()
+
+def get_day_annotation_generation(day_dir: str) -> tuple:
+    """
+    Get a stamp that changes whenever a day's annotation files change on disk.
+
+    The stamp covers the name, modification time and size of every per-image
+    annotation file, day status and legacy day file in the directory,
+    so it changes when any of them is created, rewritten or removed.
+
+    Args:
+        day_dir (str): Path to the day directory
+
+    Returns:
+        tuple: Sorted (name, mtime_ns, size) entries for the annotation files
+    """
+    generation = []
+    try:
+        with os.scandir(day_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if (name.endswith("_annotations.yaml")
+                        or name.startswith(("day_status_", "annotations_"))):
+                    try:
+                        entry_stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    generation.append((name, entry_stat.st_mtime_ns, entry_stat.st_size))
+    except FileNotFoundError:
+        pass
+    return tuple(sorted(generation))
+
+def scan_day_annotation_files(day_dir: str, dir_names: Optional[set] = None) -> Dict[str, str]:
     """
     Scan a day directory for all annotation files.
     
     Args:
         day_dir (str): Path to the day directory
+        dir_names (set, optional): Entry names of day_dir, if already listed
         
     Returns:
         dict: Dictionary mapping image filenames to annotation file paths
     """
+    if dir_names is None:
+        dir_names = list_directory_names(day_dir)
+    
     annotation_files = {}
-    for file in glob.glob(os.path.join(day_dir, "*_annotations.yaml")):
-        # Extract the base name of the annotation file
-        annotation_filename = os.path.basename(file)
-        base_name = annotation_filename.replace("_annotations.yaml", "")
+    for annotation_filename in dir_names:
+        if not annotation_filename.endswith("_annotations.yaml"):
+            continue
+        base_name = annotation_filename[:-len("_annotations.yaml")]
         
         # Try to find the corresponding image file with different extensions
         for ext in ['.jpg', '.jpeg', '.png', '.tif', '.tiff']:
             img_filename = f"{base_name}{ext}"
-            img_path = os.path.join(day_dir, img_filename)
-            if os.path.exists(img_path):
-                annotation_files[img_filename] = file
+            if img_filename in dir_names:
+                annotation_files[img_filename] = os.path.join(day_dir, annotation_filename)
                 break
     
-    print(f"Found {len(annotation_files)} annotation files in {day_dir}")
+    logger.debug("Found %d annotation files in %s", len(annotation_files), day_dir)
     return annotation_files
 
-def update_day_status_file(day_dir: str, images_data: Dict[str, Dict]) -> bool:
+def count_day_images(day_dir: str) -> int:
+    """
+    Count the image files in a day directory.
+
+    Args:
+        day_dir (str): Path to the day directory
+
+    Returns:
+        int: Number of .jpg, .jpeg, .png, .tif and .tiff files
+    """
+    return sum(
+        1 for f in os.listdir(day_dir)
+        if f.lower().endswith(('.jpg', '.jpeg', '.png', '.tif', '.tiff'))
+    )
+
+def _roi_done(roi: Dict) -> bool:
+    """
+    Check whether an ROI has been annotated (any flag, or one of the boolean fields set).
+
+    Args:
+        roi (dict): ROI annotation entry
+
+    Returns:
+        bool: True if the ROI counts as annotated
+    """
+    # Flags are the most common annotation, so they are checked first
+    return bool(roi.get('flags') or roi.get('not_needed') or roi.get('snow_presence') or roi.get('discard'))
+
+def update_day_status_file(day_dir: str, images_data: Dict[str, Dict], expected_count: Optional[int] = None,
+                           statuses: Optional[Dict[str, str]] = None,
+                           digests: Optional[Dict[str, tuple]] = None) -> bool:
     """
     Update the day-level status file with aggregated information from all images.
     
     Args:
         day_dir (str): Path to the day directory
         images_data (dict): Dictionary with metadata from all image annotation files
+        expected_count (int, optional): Number of images in the day directory, if the
+            caller has already counted them
+        statuses (dict, optional): Status of each image the caller has already worked out
+            from its ROIs; the other images are checked here
+        digests (dict, optional): Digest of the last status written to each day status
+            file, with the file's modification time right after that write:
+            {status_file_path: (mtime_ns, digest)}. When given, a file that still holds
+            the same status is not rewritten, and the entry is updated after a write.
         
     Returns:
         bool: Success status
@@ -92,9 +581,8 @@ def update_day_status_file(day_dir: str, images_data: Dict[str, Dict]) -> bool:
     station = os.path.basename(station_dir)
     
     # Count expected images in the directory
-    image_files = [f for f in os.listdir(day_dir) 
-                  if f.lower().endswith(('.jpg', '.jpeg', '.png', '.tif', '.tiff'))]
-    expected_count = len(image_files)
+    if expected_count is None:
+        expected_count = count_day_images(day_dir)
     
     # Count annotated images
     annotated_count = len(images_data)
@@ -105,30 +593,21 @@ def update_day_status_file(day_dir: str, images_data: Dict[str, Dict]) -> bool:
     # Aggregated annotation time
     total_time = sum(data.get('annotation_time_minutes', 0) for data in images_data.values())
     
-    # Create file status mapping
-    file_status = {}
-    for img_name, data in images_data.items():
-        # Check if annotations exist for all ROIs
-        annotations = data.get('annotations', [])
-        all_annotated = True
-        for roi in annotations:
-            has_annotations = (
-                roi.get('discard', False) or
-                roi.get('snow_presence', False) or
-                len(roi.get('flags', [])) > 0 or
-                roi.get('not_needed', False)
-            )
-            if not has_annotations:
-                all_annotated = False
-                break
-        
-        # Set status based on annotation completeness
-        file_status[img_name] = "completed" if all_annotated else "in_progress"
+    # Create file status mapping, reusing the statuses the caller already worked out
+    # and otherwise checking that every ROI is annotated
+    statuses = statuses or {}
+    file_status = {
+        img_name: statuses.get(img_name) or (
+            "completed" if all(map(_roi_done, data.get('annotations', []))) else "in_progress"
+        )
+        for img_name, data in images_data.items()
+    }
     
     # Create the status data
+    modified_at = datetime.datetime.now().isoformat()
     status_data = {
-        "created": datetime.datetime.now().isoformat(),
-        "last_modified": datetime.datetime.now().isoformat(),
+        "created": modified_at,
+        "last_modified": modified_at,
         "day_of_year": day,
         "year": year,
         "station": station,
@@ -141,14 +620,34 @@ def update_day_status_file(day_dir: str, images_data: Dict[str, Dict]) -> bool:
         "image_annotations": list(images_data.keys())
     }
     
-    # Save the status file
+    # Save the status file, unless it already holds the same status. The timestamps
+    # are left out of the comparison since they change on every call.
     status_file_path = os.path.join(day_dir, f"day_status_{day}.yaml")
     try:
-        save_yaml(status_data, status_file_path)
-        print(f"Updated day status file: {status_file_path}")
+        if digests is not None:
+            digest = hashlib.blake2b(
+                repr({k: v for k, v in status_data.items() if k not in ('created', 'last_modified')}).encode(),
+                digest_size=16
+            ).digest()
+            previous = digests.get(status_file_path)
+            if previous is not None and previous[1] == digest:
+                try:
+                    if os.stat(status_file_path).st_mtime_ns == previous[0]:
+                        logger.debug("Day status unchanged, not rewriting %s", status_file_path)
+                        return True
+                except FileNotFoundError:
+                    pass
+        
+        if not save_yaml(status_data, status_file_path):
+            if digests is not None:
+                digests.pop(status_file_path, None)
+            return False
+        if digests is not None:
+            digests[status_file_path] = (os.stat(status_file_path).st_mtime_ns, digest)
+        logger.debug("Updated day status file: %s", status_file_path)
         return True
     except Exception as e:
-        print(f"Error updating day status file: {e}")
+        logger.error("Error updating day status file: %s", e)
         return False
 
 def migrate_day_annotations_to_per_image(day_annotations_file: str) -> List[str]:
@@ -164,10 +663,10 @@ def migrate_day_annotations_to_per_image(day_annotations_file: str) -> List[str]
     # Load the day annotations
     try:
         with open(day_annotations_file, 'r') as f:
-            day_data = yaml.safe_load(f)
+            day_data = yaml.load(f, Loader=SafeLoader)
             
         if not day_data:
-            print(f"No data found in day annotations file: {day_annotations_file}")
+            logger.debug("No data found in day annotations file: %s", day_annotations_file)
             return []
             
         # Extract the common metadata
@@ -211,14 +710,14 @@ def migrate_day_annotations_to_per_image(day_annotations_file: str) -> List[str]
             # Create or update the day status file
             update_day_status_file(os.path.dirname(day_annotations_file), images_data)
             
-            print(f"Migrated {len(created_files)} annotation files from {day_annotations_file}")
+            logger.debug("Migrated %s annotation files from %s", len(created_files), day_annotations_file)
             return created_files
         else:
-            print(f"No annotations found in day file: {day_annotations_file}")
+            logger.debug("No annotations found in day file: %s", day_annotations_file)
             return []
     
     except Exception as e:
-        print(f"Error migrating day annotations: {e}")
+        logger.error("Error migrating day annotations: %s", e)
         return []
 
 
@@ -230,45 +729,44 @@ def display_annotation_button(current_filepath):
         current_filepath (str): Path to the current image
     """
     if not current_filepath:
-        print("Cannot display annotation button - no current filepath")
+        logger.debug("Cannot display annotation button - no current filepath")
         return
     
     # Debug log for troubleshooting
     filename = os.path.basename(current_filepath)
-    print(f"Displaying annotation button for image: {filename}")
+    logger.debug("Displaying annotation button for image: %s", filename)
     
     # Make sure image_annotations is initialized
     if 'image_annotations' not in st.session_state:
-        print("WARNING: image_annotations not in session state, initializing it now")
+        logger.warning("image_annotations not in session state, initializing it now")
         st.session_state.image_annotations = {}
     
-    # Check if we have any annotations for this image in memory
-    has_annotations_in_memory = current_filepath in st.session_state.image_annotations
+    # Check if we have any annotations for this image in memory (materializing lazily loaded ones)
+    has_annotations_in_memory = get_image_annotations(current_filepath) is not None
     
     # Check if we have annotations on disk
     has_annotations_on_disk = False
     annotation_file_path = get_annotation_file_path(current_filepath)
+    has_image_annotation_file = os.path.exists(annotation_file_path)
     
-    if os.path.exists(annotation_file_path):
+    if has_image_annotation_file:
         has_annotations_on_disk = True
-        print(f"Found per-image annotation file on disk: {annotation_file_path}")
+        logger.debug("Found per-image annotation file on disk: %s", annotation_file_path)
     else:
         # Check for legacy day-level annotations
-        img_dir = os.path.dirname(current_filepath)
-        current_day = os.path.basename(img_dir)
-        img_filename = os.path.basename(current_filepath)
+        img_dir, img_filename, current_day = get_image_path_parts(current_filepath)
         old_annotations_file = os.path.join(img_dir, f"annotations_{current_day}.yaml")
         
         if os.path.exists(old_annotations_file):
             try:
                 # Check if this specific image has annotations in the legacy file
                 with open(old_annotations_file, 'r') as f:
-                    day_data = yaml.safe_load(f)
+                    day_data = yaml.load(f, Loader=SafeLoader)
                 if day_data and 'annotations' in day_data and img_filename in day_data['annotations']:
                     has_annotations_on_disk = True
-                    print(f"Found image in legacy day annotation file: {old_annotations_file}")
+                    logger.debug("Found image in legacy day annotation file: %s", old_annotations_file)
             except Exception as e:
-                print(f"Error checking legacy annotation file: {str(e)}")
+                logger.error("Error checking legacy annotation file: %s", e)
     
     # Combined annotation status (either in memory or on disk)
     has_annotations = has_annotations_in_memory or has_annotations_on_disk
@@ -276,63 +774,23 @@ def display_annotation_button(current_filepath):
     # Try to load annotations from disk if they're not in memory
     if not has_annotations_in_memory and has_annotations_on_disk:
         # First check for per-image annotation file
-        if os.path.exists(annotation_file_path):
-            print(f"Loading per-image annotation file into memory: {annotation_file_path}")
-            try:
-                # Load the annotation file
-                with open(annotation_file_path, 'r') as f:
-                    annotation_data = yaml.safe_load(f)
-                
-                if annotation_data and 'annotations' in annotation_data:
-                    # Process annotations
-                    annotations_list = annotation_data['annotations']
-                    
-                    # Normalize annotations
-                    processed_annotations = []
-                    for anno in annotations_list:
-                        # Create a clean copy
-                        processed_anno = anno.copy()
-                        
-                        # Ensure all fields exist
-                        if 'roi_name' not in processed_anno:
-                            processed_anno['roi_name'] = "ROI_00"
-                        if 'discard' not in processed_anno:
-                            processed_anno['discard'] = False
-                        if 'snow_presence' not in processed_anno:
-                            processed_anno['snow_presence'] = False
-                        if 'flags' not in processed_anno or processed_anno['flags'] is None:
-                            processed_anno['flags'] = []
-                        if 'not_needed' not in processed_anno:
-                            processed_anno['not_needed'] = False
-                            
-                        # Make sure flags is a list of strings
-                        processed_anno['flags'] = [str(flag) for flag in processed_anno['flags']]
-                        
-                        # Add to processed list
-                        processed_annotations.append(processed_anno)
-                    
-                    # Store in session state
-                    st.session_state.image_annotations[current_filepath] = processed_annotations
-                    has_annotations_in_memory = True
-                    print(f"Loaded individual annotation file for {filename} into memory")
-                else:
-                    print(f"No annotation data found in file: {annotation_file_path}")
-            except Exception as e:
-                print(f"Error loading individual annotation file: {str(e)}")
+        if has_image_annotation_file:
+            logger.debug("Loading per-image annotation file into memory: %s", annotation_file_path)
+            st.session_state.setdefault('pending_annotation_files', {})[current_filepath] = annotation_file_path
+            has_annotations_in_memory = get_image_annotations(current_filepath) is not None
         
         # If still no annotations in memory, check if old day file exists and load it
         if not has_annotations_in_memory:
-            img_dir = os.path.dirname(current_filepath)
-            current_day = os.path.basename(img_dir)
+            img_dir, _, current_day = get_image_path_parts(current_filepath)
             old_annotations_file = os.path.join(img_dir, f"annotations_{current_day}.yaml")
             
             if os.path.exists(old_annotations_file):
-                print(f"Loading legacy day annotation file: {old_annotations_file}")
+                logger.debug("Loading legacy day annotation file: %s", old_annotations_file)
                 
                 # Check if day is already loaded
                 day_load_key = f"annotations_loaded_day_{current_day}"
                 if not st.session_state.get(day_load_key, False):
-                    print(f"Old-format annotations file exists but not loaded in memory. Will load all day annotations.")
+                    logger.debug("Old-format annotations file exists but not loaded in memory. Will load all day annotations.")
                     
                     # Get file paths for this day
                     from phenotag.ui.components.image_display import get_filtered_file_paths
@@ -357,7 +815,7 @@ def display_annotation_button(current_filepath):
     if not has_annotations_in_memory and not has_annotations_on_disk:
         # Create default annotations just for the annotation panel - don't save to disk yet
         create_default_annotations(current_filepath, use_temp_storage=False)
-        print(f"Created default annotations for {filename} for annotation panel")
+        logger.debug("Created default annotations for %s for annotation panel", filename)
 
     # Show the annotation panel when the button is clicked
     show_annotation_panel(current_filepath)
@@ -397,45 +855,42 @@ def show_annotation_panel(current_filepath):
     
     # Ensure we have annotations in both storages for this image
     # Check permanent storage first
-    in_permanent_storage = current_filepath in st.session_state.image_annotations
+    in_permanent_storage = get_image_annotations(current_filepath) is not None
     in_temporary_storage = current_filepath in st.session_state.temp_annotations
     
-    print(f"DEBUG: Annotations for {filename} - in permanent storage: {in_permanent_storage}, in temporary storage: {in_temporary_storage}")
+    logger.debug("Annotations for %s - in permanent storage: %s, in temporary storage: %s", filename, in_permanent_storage, in_temporary_storage)
     if in_permanent_storage:
-        print(f"DEBUG: Permanent storage annotation data: {st.session_state.image_annotations[current_filepath]}")
+        logger.debug("Permanent storage annotation data: %s", st.session_state.image_annotations[current_filepath])
     if in_temporary_storage:
-        print(f"DEBUG: Temporary storage annotation data: {st.session_state.temp_annotations[current_filepath]}")
+        logger.debug("Temporary storage annotation data: %s", st.session_state.temp_annotations[current_filepath])
     
     # If in permanent but not temporary, copy to temporary
     if in_permanent_storage and not in_temporary_storage:
         # Deep copy to avoid reference issues
-        import copy
         st.session_state.temp_annotations[current_filepath] = copy.deepcopy(
             st.session_state.image_annotations[current_filepath]
         )
-        print(f"Copied annotations from permanent to temporary storage for {filename}")
+        logger.debug("Copied annotations from permanent to temporary storage for %s", filename)
     
     # If in temporary but not permanent, copy to permanent
     elif in_temporary_storage and not in_permanent_storage:
         # Deep copy to avoid reference issues
-        import copy
         st.session_state.image_annotations[current_filepath] = copy.deepcopy(
             st.session_state.temp_annotations[current_filepath]
         )
-        print(f"Copied annotations from temporary to permanent storage for {filename}")
+        logger.debug("Copied annotations from temporary to permanent storage for %s", filename)
     
     # If not in either storage, create default annotations in both
     elif not in_permanent_storage and not in_temporary_storage:
         # Create in permanent storage
         create_default_annotations(current_filepath, use_temp_storage=False)
-        print(f"Created default annotations in permanent storage for {filename}")
+        logger.debug("Created default annotations in permanent storage for %s", filename)
         
         # Copy to temporary storage
-        import copy
         st.session_state.temp_annotations[current_filepath] = copy.deepcopy(
             st.session_state.image_annotations[current_filepath]
         )
-        print(f"Copied default annotations to temporary storage for {filename}")
+        logger.debug("Copied default annotations to temporary storage for %s", filename)
     
     # Display the popover
     with st.popover(f'Annotation Panel - {filename}'):
@@ -460,20 +915,20 @@ def show_annotation_panel(current_filepath):
                 if 'image_annotations' not in st.session_state:
                     st.session_state.image_annotations = {}
                 
-                # Copy from temp to permanent storage and save directly
-                import copy
-                
+                # Copy from temp to permanent storage and save directly.
                 # First ensure the temporary annotations are updated with the latest UI values
-                print(f"Saving annotations for {filename} - copying from temporary to permanent storage")
+                logger.debug("Saving annotations for %s - copying from temporary to permanent storage", filename)
                 st.session_state.image_annotations[current_filepath] = copy.deepcopy(
                     st.session_state.temp_annotations[current_filepath]
                 )
                 
                 # Log the annotation data being saved
-                print(f"Annotation data being saved: {st.session_state.image_annotations[current_filepath]}")
+                logger.debug("Annotation data being saved: %s", st.session_state.image_annotations[current_filepath])
                 
-                # Save to disk explicitly - only triggered by Save button
-                save_all_annotations(force_save=True)
+                # Save to disk explicitly - only triggered by Save button. Only this image and
+                # images edited since the last save are written.
+                dirty_keys = st.session_state.setdefault('dirty_annotation_keys', set())
+                save_all_annotations(force_save=True, keys=dirty_keys | {current_filepath})
                 
                 # Show success message
                 st.success(f"Annotations for {filename} saved successfully!")
@@ -514,9 +969,7 @@ def display_raw_annotation_data(station_name, instrument_id, year, day):
         day (str): Day of year
     """
     import json
-    import yaml
     import pandas as pd
-    import glob
     from io import StringIO
     
     # Find the day directory path
@@ -535,7 +988,7 @@ def display_raw_annotation_data(station_name, instrument_id, year, day):
             )
             
             # Check if the directory exists
-            print(f"Looking for annotation files in directory: {day_dir}")
+            logger.debug("Looking for annotation files in directory: %s", day_dir)
             if os.path.exists(day_dir):
                 # Get all annotation files in the directory
                 per_image_files = glob.glob(os.path.join(day_dir, "*_annotations.yaml"))
@@ -561,12 +1014,12 @@ def display_raw_annotation_data(station_name, instrument_id, year, day):
                                 
                                 if has_day_status:
                                     with open(day_status_file, 'r') as f:
-                                        day_data = yaml.safe_load(f)
+                                        day_data = yaml.load(f, Loader=SafeLoader)
                                     st.success(f"Loaded day status file from {day_status_file}")
                                 elif has_old_format:
                                     # Fall back to old format file
                                     with open(old_format_file, 'r') as f:
-                                        day_data = yaml.safe_load(f)
+                                        day_data = yaml.load(f, Loader=SafeLoader)
                                     st.info(f"Loaded legacy day annotation file from {old_format_file}")
                                     
                                     # Show migration button if we have old format but no per-image files
@@ -637,11 +1090,11 @@ def display_raw_annotation_data(station_name, instrument_id, year, day):
                                         for file_path in per_image_files:
                                             try:
                                                 with open(file_path, 'r') as f:
-                                                    file_data = yaml.safe_load(f)
+                                                    file_data = yaml.load(f, Loader=SafeLoader)
                                                 if file_data and 'filename' in file_data:
                                                     image_data[file_data['filename']] = file_data
                                             except Exception as file_error:
-                                                print(f"Error loading {file_path}: {file_error}")
+                                                logger.error("Error loading %s: %s", file_path, file_error)
                                         
                                         # Display summary stats
                                         st.metric("Total Images", len(image_data))
@@ -684,11 +1137,9 @@ def display_raw_annotation_data(station_name, instrument_id, year, day):
                                 
                                 if 'image_annotations' in st.session_state:
                                     for img_path, annotations in st.session_state.image_annotations.items():
-                                        # Check if this image is for the current day
-                                        img_dir = os.path.dirname(img_path)
-                                        img_day = os.path.basename(img_dir)
+                                        # Check if this image is for the current day (path splits are cached)
+                                        _, img_name, img_day = get_image_path_parts(img_path)
                                         if img_day == day:
-                                            img_name = os.path.basename(img_path)
                                             memory_annotations[img_name] = annotations
                                             has_memory_annotations = True
                                 
@@ -764,7 +1215,7 @@ def display_raw_annotation_data(station_name, instrument_id, year, day):
                                             
                                             # Load the file data
                                             with open(annotation_file, 'r') as f:
-                                                file_data = yaml.safe_load(f)
+                                                file_data = yaml.load(f, Loader=SafeLoader)
                                             
                                             # If memory annotations exist, we need to handle both
                                             if image_data:
@@ -886,7 +1337,7 @@ def display_raw_annotation_data(station_name, instrument_id, year, day):
                                     elif has_old_format:
                                         # Display old format annotations
                                         with open(old_format_file, 'r') as f:
-                                            old_data = yaml.safe_load(f)
+                                            old_data = yaml.load(f, Loader=SafeLoader)
                                         
                                         if 'annotations' in old_data:
                                             # Get list of images
@@ -938,7 +1389,7 @@ def display_raw_annotation_data(station_name, instrument_id, year, day):
                     st.warning(f"No annotation files found for day {day}")
             else:
                 # Print debug info but don't show warning to user
-                print(f"Day directory not found: {day_dir}")
+                logger.warning("Day directory not found: %s", day_dir)
                 # Return silently instead of showing a warning
                 return
         else:
@@ -947,6 +1398,25 @@ def display_raw_annotation_data(station_name, instrument_id, year, day):
         st.warning("Scan info not available. Please scan for images first.")
 
 
+def _default_roi_entry(roi_name: str) -> Dict[str, Any]:
+    """
+    Build the annotation entry of an ROI that has not been annotated yet.
+
+    Args:
+        roi_name (str): Name of the ROI
+
+    Returns:
+        dict: Entry with no quality flags and neither discard nor snow set
+    """
+    return {
+        "roi_name": roi_name,
+        "discard": False,
+        "snow_presence": False,
+        "flags": [],  # Empty list for no flags selected
+        "not_needed": False  # No longer used but kept for compatibility
+    }
+
+
 def create_default_annotations(current_filepath, use_temp_storage=False):
     """
     Create default annotations for an image.
@@ -970,7 +1440,7 @@ def create_default_annotations(current_filepath, use_temp_storage=False):
     else:
         # Make sure image_annotations is initialized
         if 'image_annotations' not in st.session_state:
-            print("WARNING: image_annotations not in session state, initializing it now")
+            logger.warning("image_annotations not in session state, initializing it now")
             st.session_state.image_annotations = {}
         annotations_storage = st.session_state.image_annotations
     
@@ -985,43 +1455,22 @@ def create_default_annotations(current_filepath, use_temp_storage=False):
         try:
             from phenotag.ui.main import load_instrument_rois
             if load_instrument_rois():
-                print("ROIs loaded automatically for default annotations")
+                logger.debug("ROIs loaded automatically for default annotations")
                 # Update roi_names from the freshly loaded ROIs
                 if 'instrument_rois' in st.session_state:
                     roi_names = list(st.session_state.instrument_rois.keys())
         except Exception as e:
-            print(f"Error loading ROIs: {str(e)}")
-    
-    # Create default annotations
-    annotation_data = []
-
-    # If we have ROI names from instrument config, use those
-    # Otherwise fall back to just ROI_00
-    if roi_names:
-        # Use the instrument's ROI names (which should include ROI_00)
-        for roi_name in roi_names:
-            annotation_data.append({
-                "roi_name": roi_name,
-                "discard": False,
-                "snow_presence": False,
-                "flags": [],  # Empty list - no actual quality flags
-                "not_needed": False  # No longer used but kept for compatibility
-            })
-    else:
-        # Fallback: only ROI_00 if no instrument ROIs loaded
-        annotation_data.append({
-            "roi_name": "ROI_00",  # Default - Full Image
-            "discard": False,
-            "snow_presence": False,
-            "flags": [],  # Empty list - no actual quality flags
-            "not_needed": False  # No longer used but kept for compatibility
-        })
+            logger.error("Error loading ROIs: %s", e)
+    
+    # Create default annotations: the instrument's ROI names (which should
+    # include ROI_00), or only ROI_00 (Default - Full Image) if none are loaded
+    annotation_data = [_default_roi_entry(roi_name) for roi_name in roi_names or ["ROI_00"]]
     
     # Store in appropriate session state
     annotations_storage[current_filepath] = annotation_data
     
-    print(f"Created default annotations for {os.path.basename(current_filepath)}" + 
-          f" in {'temporary' if use_temp_storage else 'permanent'} storage")
+    logger.debug("Created default annotations for %s in %s storage",
+                 os.path.basename(current_filepath), 'temporary' if use_temp_storage else 'permanent')
     
     return annotation_data
 
@@ -1044,38 +1493,25 @@ def create_annotation_summary(current_filepath):
         
     # Make sure image_annotations is initialized
     if 'image_annotations' not in st.session_state:
-        print("WARNING: image_annotations not in session state, initializing it now")
+        logger.warning("image_annotations not in session state, initializing it now")
         st.session_state.image_annotations = {}
     
     # Create a unique key for this image
     image_key = current_filepath
     
-    # Check if we have annotations for this image
-    if image_key not in st.session_state.image_annotations:
+    # Get the annotation data (materializing lazily loaded annotations)
+    annotation_data = get_image_annotations(image_key)
+    if annotation_data is None:
         return None
     
-    # Get the annotation data
-    annotation_data = st.session_state.image_annotations[image_key]
-    
-    # Load config for quality flags
-    config = load_config_files()
-    
-    # Initialize the flags processor with the flags data
-    flags_processor = FlagsProcessor(config.get('flags', {}))
-    
-    # Get the formatted flag options for UI display
-    flag_options = flags_processor.get_flag_options()
-    
-    # Organize flags by category for better display
-    flags_by_category = {}
-    for option in flag_options:
-        category = option.get("category", "Other")
-        if category not in flags_by_category:
-            flags_by_category[category] = []
-        flags_by_category[category].append((option["value"], f"{option['value']} ({category})"))
+    # Get the "value (category)" display label of each flag (cached across reruns)
+    _, label_by_value = get_flag_display_options()
     
-    # Build summary data
+    # Build summary data, counting discarded and flagged ROIs in the same pass
     summary_data = []
+    filename = os.path.basename(current_filepath)
+    discarded_rois = 0
+    flagged_rois = 0
     
     for annotation in annotation_data:
         roi_name = annotation["roi_name"]
@@ -1084,20 +1520,18 @@ def create_annotation_summary(current_filepath):
         flags = annotation.get("flags", [])
         
         # Format the flags as a readable string with categories
-        formatted_flags = []
-        for flag in flags:
-            # Find the display name with category
-            for category, options in flags_by_category.items():
-                for value, label in options:
-                    if value == flag:
-                        formatted_flags.append(label)
-                        break
+        formatted_flags = [label_by_value.get(flag, flag) for flag in flags]
         
         flags_str = ", ".join(formatted_flags) if formatted_flags else "None"
         
+        if discard:
+            discarded_rois += 1
+        if flags:
+            flagged_rois += 1
+        
         # Add to summary data
         summary_data.append({
-            "Filename": os.path.basename(current_filepath),
+            "Filename": filename,
             "ROI": roi_name,
             "Discard": "Yes" if discard else "No",
             "Snow Present": "Yes" if snow_presence else "No",
@@ -1112,11 +1546,9 @@ def create_annotation_summary(current_filepath):
         total_rois = len(summary_data)
         metrics["total_rois"] = total_rois
         
-        discarded_rois = sum(1 for item in summary_data if item["Discard"] == "Yes")
         metrics["discarded_rois"] = discarded_rois
         metrics["discarded_pct"] = f"{100 * discarded_rois / total_rois:.1f}%" if total_rois > 0 else "0%"
         
-        flagged_rois = sum(1 for item in summary_data if item["Flag Count"] > 0)
         metrics["flagged_rois"] = flagged_rois
         metrics["flagged_pct"] = f"{100 * flagged_rois / total_rois:.1f}%" if total_rois > 0 else "0%"
     
@@ -1139,19 +1571,22 @@ def update_annotation_value(roi_name, field, value, annotations_storage, image_k
         sync_storages (bool): Whether to sync between temporary and permanent storage
     """
     if image_key not in annotations_storage:
-        print(f"Warning: Cannot update {field} for {roi_name}, image key not found")
+        logger.warning("Cannot update %s for %s, image key not found", field, roi_name)
         return
         
     # Find the ROI in the annotations
     for annotation in annotations_storage[image_key]:
         if annotation.get("roi_name") == roi_name:
             annotation[field] = value
-            print(f"Updated {field} to {value} for {roi_name} without rerun")
+            logger.debug("Updated %s to %s for %s without rerun", field, value, roi_name)
             break
     else:
-        print(f"Warning: ROI {roi_name} not found in annotations")
+        logger.warning("ROI %s not found in annotations", roi_name)
         return
     
+    # Remember the image so the next save writes its file
+    st.session_state.setdefault('dirty_annotation_keys', set()).add(image_key)
+    
     # Sync between temporary and permanent storage if requested
     if sync_storages:
         # Determine which storage we're working with
@@ -1173,34 +1608,106 @@ def update_annotation_value(roi_name, field, value, annotations_storage, image_k
         
         # Make sure other_storage is different from annotations_storage
         if other_storage is annotations_storage:
-            print(f"Warning: other_storage is the same as annotations_storage, skipping sync")
+            logger.warning("other_storage is the same as annotations_storage, skipping sync")
             return
         
         # Check if the image exists in the other storage
         if image_key in other_storage:
             # Find the same ROI and update the value
-            found_roi = False
             for other_anno in other_storage[image_key]:
                 if other_anno.get("roi_name") == roi_name:
                     # Deep copy for lists like flags
                     if field == 'flags' and isinstance(value, list):
-                        import copy
                         other_anno[field] = copy.deepcopy(value)
                     else:  
                         other_anno[field] = value
-                    found_roi = True
-                    print(f"Synced update to {'permanent' if is_temp_storage else 'temporary'} storage")
+                    logger.debug("Synced update to %s storage", 'permanent' if is_temp_storage else 'temporary')
                     break
-            
-            if not found_roi:
-                print(f"Warning: ROI {roi_name} not found in {'permanent' if is_temp_storage else 'temporary'} storage")
+            else:
+                logger.warning("ROI %s not found in %s storage", roi_name, 'permanent' if is_temp_storage else 'temporary')
         else:
             # Copy the entire annotations list to the other storage
             if image_key in annotations_storage:
                 # Create a deep copy to avoid reference issues
-                import copy
                 other_storage[image_key] = copy.deepcopy(annotations_storage[image_key])
-                print(f"Copied annotations to {'permanent' if is_temp_storage else 'temporary'} storage")
+                logger.debug("Copied annotations to %s storage", 'permanent' if is_temp_storage else 'temporary')
+
+@st.fragment
+def _render_roi_tab(roi_name, roi_data, roi_key, annotations_storage, image_key, multiselect_values, label_by_value):
+    """
+    Render the annotation widgets of one ROI tab.
+
+    Runs as a Streamlit fragment so that changing a widget reruns only this tab
+    instead of the whole annotation interface.
+    
+    Args:
+        roi_name (str): Name of the ROI
+        roi_data (dict): Current annotation values of the ROI
+        roi_key (str): Unique widget key prefix for this ROI and image
+        annotations_storage (dict): The storage dictionary containing annotations
+        image_key (str): The key for the current image
+        multiselect_values (list): Flag values offered by the multiselect
+        label_by_value (dict): Display label of each flag value
+    """
+    # Layout for the annotation controls - avoid nesting columns by putting all controls in a single area
+    # Create checkbox for discard with function callback
+    discard_key = f"discard_{roi_key}"
+    st.checkbox(
+        "Discard", 
+        value=roi_data.get('discard', False),
+        key=discard_key,
+        help="Mark this image/ROI as not suitable for analysis",
+        on_change=lambda roi=roi_name, dk=discard_key, as_=annotations_storage, ik=image_key: update_annotation_value(
+            roi, 
+            'discard', 
+            st.session_state[dk],  # Get current value from session state
+            as_, 
+            ik,
+            sync_storages=True  # Sync between temporary and permanent storage
+        )
+    )
+    
+    # Create checkbox for snow presence with function callback
+    snow_key = f"snow_{roi_key}"
+    st.checkbox(
+        "Snow Present", 
+        value=roi_data.get('snow_presence', False),
+        key=snow_key,
+        help="Mark if snow is present in this ROI",
+        on_change=lambda roi=roi_name, sk=snow_key, as_=annotations_storage, ik=image_key: update_annotation_value(
+            roi, 
+            'snow_presence', 
+            st.session_state[sk],  # Get current value from session state
+            as_, 
+            ik,
+            sync_storages=True  # Sync between temporary and permanent storage
+        )
+    )
+    
+    # Add a separator
+    st.markdown("---")
+    
+    # Get current flags for this ROI
+    current_flags = roi_data.get('flags', [])
+    
+    # Select flags with this multiselect with function callback
+    flags_key = f"flags_{roi_key}"
+    st.multiselect(
+        "Quality Flags",
+        options=multiselect_values,
+        format_func=lambda x: label_by_value.get(x, x),
+        default=current_flags,
+        key=flags_key,
+        help="Select quality flags applicable to this ROI",
+        on_change=lambda roi=roi_name, fk=flags_key, as_=annotations_storage, ik=image_key: update_annotation_value(
+            roi,
+            'flags',
+            st.session_state[fk],  # Get current value from session state
+            as_,
+            ik,
+            sync_storages=True  # Sync between temporary and permanent storage
+        )
+    )
 
 def _create_annotation_interface(current_filepath, use_temp_storage=False):
     """
@@ -1211,11 +1718,12 @@ def _create_annotation_interface(current_filepath, use_temp_storage=False):
         use_temp_storage (bool): Whether to use temporary storage instead of permanent
     """
     if not current_filepath:
-        print("Cannot create annotation interface - no current filepath")
+        logger.debug("Cannot create annotation interface - no current filepath")
         return
         
     # Create a unique key for this image
     image_key = current_filepath
+    image_basename = os.path.basename(current_filepath)
     
     # Choose the appropriate storage
     if use_temp_storage:
@@ -1227,7 +1735,7 @@ def _create_annotation_interface(current_filepath, use_temp_storage=False):
     else:
         # Initialize image_annotations if needed
         if 'image_annotations' not in st.session_state:
-            print("WARNING: image_annotations not in session state in _create_annotation_interface, initializing it now")
+            logger.warning("image_annotations not in session state in _create_annotation_interface, initializing it now")
             st.session_state.image_annotations = {}
         annotations_storage = st.session_state.image_annotations
         storage_name = "permanent"
@@ -1236,7 +1744,7 @@ def _create_annotation_interface(current_filepath, use_temp_storage=False):
     roi_names = []
     if 'instrument_rois' in st.session_state and st.session_state.instrument_rois:
         # Print debugging info about ROIs
-        print(f"Found instrument_rois in session state: {list(st.session_state.instrument_rois.keys())}")
+        logger.debug("Found instrument_rois in session state: %s", list(st.session_state.instrument_rois.keys()))
         roi_names = list(st.session_state.instrument_rois.keys())
     
     # Force ROI loading if not loaded yet
@@ -1245,170 +1753,73 @@ def _create_annotation_interface(current_filepath, use_temp_storage=False):
         try:
             from phenotag.ui.main import load_instrument_rois
             if load_instrument_rois():
-                print("ROIs loaded automatically for annotation")
+                logger.debug("ROIs loaded automatically for annotation")
                 # Update roi_names from the freshly loaded ROIs
                 if 'instrument_rois' in st.session_state:
                     roi_names = list(st.session_state.instrument_rois.keys())
-                    print(f"ROI names updated: {roi_names}")
+                    logger.debug("ROI names updated: %s", roi_names)
         except Exception as e:
-            print(f"Error loading ROIs: {str(e)}")
+            logger.error("Error loading ROIs: %s", e)
             
-    # Load config for quality flags
-    config = load_config_files()
-    
-    # Initialize the flags processor with the flags data
-    flags_processor = FlagsProcessor(config.get('flags', {}))
-    
-    # Get the formatted flag options for UI display
-    flag_options = flags_processor.get_flag_options()
+    # Get the flag values and labels for the widgets (cached across reruns)
+    multiselect_values, label_by_value = get_flag_display_options()
 
     # Create or retrieve annotations for current image
     if image_key not in annotations_storage:
+        # ROI_00 (Default - Full Image) followed by each custom ROI; also used for the tabs.
+        # The instrument's ROI names usually include ROI_00 already.
+        all_roi_names = ["ROI_00", *(roi_name for roi_name in roi_names if roi_name != "ROI_00")]
+        
         # Create default annotations for this image
-        annotation_data = [
-            {
-                "roi_name": "ROI_00",  #(Default - Full Image)
-                "discard": False,
-                "snow_presence": False,
-                "flags": [],  # Empty list for no flags selected - must be list for ListColumn
-                "not_needed": False  # Not marked as "not needed" by default
-            }
-        ]
-
-        # Add a row for each custom ROI
-        for roi_name in roi_names:
-            annotation_data.append({
-                "roi_name": roi_name,
-                "discard": False,
-                "snow_presence": False,
-                "flags": [],  # Empty list for no flags selected - must be list for ListColumn
-                "not_needed": False  # Not marked as "not needed" by default
-            })
+        annotation_data = [_default_roi_entry(roi_name) for roi_name in all_roi_names]
             
         # Debug message for new annotations
-        print(f"Created new default annotations for {os.path.basename(image_key)} in {storage_name} storage")
-        print(f"Default annotation data: {annotation_data}")
-        print(f"ROI names used: {roi_names}")
+        logger.debug("Created new default annotations for %s in %s storage", image_basename, storage_name)
+        logger.debug("Default annotation data: %s", annotation_data)
+        logger.debug("ROI names used: %s", roi_names)
     else:
         # Use existing annotations
         annotation_data = annotations_storage[image_key]
-        print(f"Loaded existing annotations for {os.path.basename(image_key)} from {storage_name} storage")
-        print(f"Existing annotation data: {annotation_data}")
-        print(f"ROI names that should be available: {roi_names}")
-        
-    # Add the flag selector column for UI purposes (not stored in annotations)
-    for row in annotation_data:
-        row['_flag_selector'] = ""  # Empty by default, not stored permanently
-    
-    # Convert to DataFrame
-    annotation_df = pd.DataFrame(annotation_data)
+        all_roi_names = [row["roi_name"] for row in annotation_data]
+        logger.debug("Loaded existing annotations for %s from %s storage", image_basename, storage_name)
+        logger.debug("Existing annotation data: %s", annotation_data)
+        logger.debug("ROI names that should be available: %s", roi_names)
     
     # Add a title for the annotation panel with image filename
-    filename = os.path.basename(current_filepath)
     st.markdown("### ROI Annotations")
-    st.caption(f"Image: **{filename}**")
+    st.caption(f"Image: **{image_basename}**")
     st.caption("Use the tabs below to annotate each Region of Interest")
     
-    # Organize flags by category for the multiselect
-    flags_by_category = {}
-    for option in flag_options:
-        category = option.get("category", "Other")
-        if category not in flags_by_category:
-            flags_by_category[category] = []
-        flags_by_category[category].append((option["value"], f"{option['value']} ({category})"))
-    
-    # Create a list of all ROI names for tabs
-    all_roi_names = [row["roi_name"] for row in annotation_data]
-    
     # Create tabs for each ROI at the TOP of the UI
     roi_tabs = st.tabs(all_roi_names)
     
-    # Process each ROI in its own tab
-    for idx, (roi_name, roi_tab) in enumerate(zip(all_roi_names, roi_tabs)):
+    # Process each ROI in its own tab; each tab is a fragment, so a widget change
+    # only reruns the tab it belongs to
+    for roi_name, roi_data, roi_tab in zip(all_roi_names, annotation_data, roi_tabs):
         with roi_tab:
-            # Get the current ROI data
-            roi_data = annotation_data[idx]
-            
             # Create a unique key based on roi_name and image_key
-            roi_key = f"{roi_name}_{os.path.basename(image_key)}_popup_{storage_name}"
-            
-            # Layout for the annotation controls - avoid nesting columns by putting all controls in a single area
-            # Create checkbox for discard with function callback
-            discard_key = f"discard_{roi_key}"
-            st.checkbox(
-                "Discard", 
-                value=roi_data.get('discard', False),
-                key=discard_key,
-                help="Mark this image/ROI as not suitable for analysis",
-                on_change=lambda roi=roi_name, dk=discard_key, as_=annotations_storage, ik=image_key: update_annotation_value(
-                    roi, 
-                    'discard', 
-                    st.session_state[dk],  # Get current value from session state
-                    as_, 
-                    ik,
-                    sync_storages=True  # Sync between temporary and permanent storage
-                )
-            )
-            
-            # Create checkbox for snow presence with function callback
-            snow_key = f"snow_{roi_key}"
-            st.checkbox(
-                "Snow Present", 
-                value=roi_data.get('snow_presence', False),
-                key=snow_key,
-                help="Mark if snow is present in this ROI",
-                on_change=lambda roi=roi_name, sk=snow_key, as_=annotations_storage, ik=image_key: update_annotation_value(
-                    roi, 
-                    'snow_presence', 
-                    st.session_state[sk],  # Get current value from session state
-                    as_, 
-                    ik,
-                    sync_storages=True  # Sync between temporary and permanent storage
-                )
-            )
-            
-            # Add a separator
-            st.markdown("---")
-            
-            # Flatten the options for the multiselect
-            multiselect_options = []
-            for category in sorted(flags_by_category.keys()):
-                multiselect_options.extend(flags_by_category[category])
-            
-            # Get current flags for this ROI
-            current_flags = roi_data.get('flags', [])
-            
-            # Select flags with this multiselect with function callback
-            flags_key = f"flags_{roi_key}"
-            st.multiselect(
-                "Quality Flags",
-                options=[value for value, _ in multiselect_options],
-                format_func=lambda x: next((label for value, label in multiselect_options if value == x), x),
-                default=current_flags,
-                key=flags_key,
-                help="Select quality flags applicable to this ROI",
-                on_change=lambda roi=roi_name, fk=flags_key, as_=annotations_storage, ik=image_key: update_annotation_value(
-                    roi,
-                    'flags',
-                    st.session_state[fk],  # Get current value from session state
-                    as_,
-                    ik,
-                    sync_storages=True  # Sync between temporary and permanent storage
-                )
+            roi_key = f"{roi_name}_{image_basename}_popup_{storage_name}"
+            _render_roi_tab(
+                roi_name,
+                roi_data,
+                roi_key,
+                annotations_storage,
+                image_key,
+                multiselect_values,
+                label_by_value
             )
     
-    # Make sure annotations exist for this image before we try to access them
+    # Store new default annotations once, as the same rows the tabs were built from
     if image_key not in annotations_storage:
-        # Create default annotations
-        create_default_annotations(current_filepath, use_temp_storage=use_temp_storage)
-        print(f"Created default annotations for {os.path.basename(image_key)} in annotation interface")
+        annotations_storage[image_key] = annotation_data
+        logger.debug("Stored default annotations for %s in %s storage", image_basename, storage_name)
     
     # Log the status
-    print(f"Using direct annotation updates in {'temporary' if use_temp_storage else 'permanent'} storage")
+    logger.debug("Using direct annotation updates in %s storage", 'temporary' if use_temp_storage else 'permanent')
     
     # Add a button to copy ROI_00 settings to all other ROIs
     if "ROI_00" in all_roi_names and len(all_roi_names) > 1:
-        copy_key = f"copy_roi00_{os.path.basename(current_filepath)}"
+        copy_key = f"copy_roi00_{image_basename}"
         if st.button("📋 Copy ROI_00 Settings to All ROIs", key=copy_key, use_container_width=True):
             # Ensure annotations exist in both storages
             permanent_storage = st.session_state.image_annotations
@@ -1417,74 +1828,66 @@ def _create_annotation_interface(current_filepath, use_temp_storage=False):
             # Make sure annotations exist in the current storage
             if image_key not in annotations_storage:
                 create_default_annotations(current_filepath, use_temp_storage=use_temp_storage)
-                print(f"Created default annotations for {os.path.basename(image_key)} in copy operation")
+                logger.debug("Created default annotations for %s in copy operation", image_basename)
             
             # Make sure annotations exist in both storages
             if image_key not in permanent_storage:
                 if image_key in temp_storage:
                     # Copy from temp to permanent
-                    import copy
                     permanent_storage[image_key] = copy.deepcopy(temp_storage[image_key])
-                    print(f"Copied annotations from temporary to permanent storage for copy operation")
+                    logger.debug("Copied annotations from temporary to permanent storage for copy operation")
                 else:
                     # Create new annotations
                     create_default_annotations(current_filepath, use_temp_storage=False)
-                    print(f"Created default annotations in permanent storage for copy operation")
+                    logger.debug("Created default annotations in permanent storage for copy operation")
             
             if image_key not in temp_storage:
                 if image_key in permanent_storage:
                     # Copy from permanent to temp
-                    import copy
                     temp_storage[image_key] = copy.deepcopy(permanent_storage[image_key])
-                    print(f"Copied annotations from permanent to temporary storage for copy operation")
+                    logger.debug("Copied annotations from permanent to temporary storage for copy operation")
                 else:
                     # Create new annotations
                     create_default_annotations(current_filepath, use_temp_storage=True)
-                    print(f"Created default annotations in temporary storage for copy operation")
+                    logger.debug("Created default annotations in temporary storage for copy operation")
                 
             # Find ROI_00 data in the current annotations
-            roi00_data = None
-            for anno in annotations_storage[image_key]:
-                if anno["roi_name"] == "ROI_00":
-                    roi00_data = anno
-                    break
+            roi00_data = next((anno for anno in annotations_storage[image_key] if anno["roi_name"] == "ROI_00"), None)
                     
             if roi00_data:
+                # Read the ROI_00 settings once before applying them to every other ROI
+                roi00_discard = roi00_data["discard"]
+                roi00_snow_presence = roi00_data["snow_presence"]
+                roi00_flags = tuple(roi00_data["flags"])
+                
                 # Apply ROI_00 settings to all other ROIs in temporary storage first
-                import copy
                 if image_key in temp_storage:
                     for anno in temp_storage[image_key]:
                         if anno["roi_name"] != "ROI_00":
-                            # Copy values directly
-                            anno["discard"] = roi00_data["discard"]
-                            anno["snow_presence"] = roi00_data["snow_presence"]
-                            anno["flags"] = copy.deepcopy(roi00_data["flags"])  # Deep copy the list
-                            print(f"Updated {anno['roi_name']} with ROI_00 settings in temporary storage")
+                            # Copy values directly (flags are strings, so a shallow list copy suffices)
+                            anno["discard"] = roi00_discard
+                            anno["snow_presence"] = roi00_snow_presence
+                            anno["flags"] = list(roi00_flags)
+                            logger.debug("Updated %s with ROI_00 settings in temporary storage", anno['roi_name'])
                 
-                # Then deep copy from temporary to permanent
+                # Then copy from temporary to permanent; the rows hold only scalars and a
+                # list of flag strings, so copying each row and its flag list is enough
                 if image_key in temp_storage:
-                    permanent_storage[image_key] = copy.deepcopy(temp_storage[image_key])
-                    print(f"Copied updated temporary storage to permanent storage with ROI_00 settings")
-                    
-                # Verify by checking both storages
-                roi_count = 0
-                for storage_name, storage in [("temporary", temp_storage), ("permanent", permanent_storage)]:
-                    if image_key in storage:
-                        for anno in storage[image_key]:
-                            if anno["roi_name"] != "ROI_00":
-                                roi_count += 1
+                    permanent_storage[image_key] = [
+                        {**anno, "flags": list(anno["flags"])} for anno in temp_storage[image_key]
+                    ]
+                    st.session_state.setdefault('dirty_annotation_keys', set()).add(image_key)
+                    logger.debug("Copied updated temporary storage to permanent storage with ROI_00 settings")
                 
                 # Show success message
                 st.success(f"Applied ROI_00 settings to all {len(all_roi_names)-1} ROIs")
-                print(f"Applied ROI_00 settings to all ROIs in both temporary and permanent storage")
+                logger.debug("Applied ROI_00 settings to all ROIs in both temporary and permanent storage")
                 
                 # Rerun to update UI
                 st.rerun()
     
     # Show the full annotation data in an expander
     with st.expander("View Raw Annotation Data"):
-        import yaml
-        
         # Show both temporary and permanent annotations
         temp_storage = st.session_state.temp_annotations if 'temp_annotations' in st.session_state else {}
         permanent_storage = st.session_state.image_annotations if 'image_annotations' in st.session_state else {}
@@ -1515,22 +1918,10 @@ def _create_annotation_interface(current_filepath, use_temp_storage=False):
                 st.info("No annotations in permanent storage")
             else:
                 # Check if permanent annotations are different from temporary
-                import copy
-                temp_copy = copy.deepcopy(temp_annotations) if temp_annotations else []
-                perm_copy = copy.deepcopy(perm_annotations) if perm_annotations else []
-                
-                # Try to normalize formats for comparison
-                for anns in [temp_copy, perm_copy]:
-                    for ann in anns:
-                        # Ensure flags is a sorted list for proper comparison
-                        if 'flags' in ann:
-                            ann['flags'] = sorted([str(flag) for flag in ann.get('flags', [])])
-                
-                # Check if different (accounting for potential order differences)
+                # (accounting for ROI and flag order differences)
                 try:
-                    is_different = yaml.dump(sorted(temp_copy, key=lambda x: x.get('roi_name', ''))) != \
-                                  yaml.dump(sorted(perm_copy, key=lambda x: x.get('roi_name', '')))
-                except:
+                    is_different = annotation_signature(temp_annotations) != annotation_signature(perm_annotations)
+                except Exception:
                     # If comparison fails for any reason, assume they're different
                     is_different = True
                     
@@ -1544,27 +1935,26 @@ def _create_annotation_interface(current_filepath, use_temp_storage=False):
         with storage_tab3:
             # Check if file exists on disk
             annotation_file_path = get_annotation_file_path(current_filepath)
-            if os.path.exists(annotation_file_path):
-                try:
-                    # Load the file from disk
-                    with open(annotation_file_path, 'r') as f:
-                        file_data = yaml.safe_load(f)
+            try:
+                # Load the file from disk
+                with open(annotation_file_path, 'r') as f:
+                    file_data = yaml.load(f, Loader=SafeLoader)
+                
+                if file_data and 'annotations' in file_data:
+                    # Display file metadata
+                    metadata = {k: v for k, v in file_data.items() if k != 'annotations'}
+                    st.subheader("File Metadata")
+                    st.json(metadata)
                     
-                    if file_data and 'annotations' in file_data:
-                        # Display file metadata
-                        metadata = {k: v for k, v in file_data.items() if k != 'annotations'}
-                        st.subheader("File Metadata")
-                        st.json(metadata)
-                        
-                        # Display annotations
-                        st.subheader("File Annotations")
-                        st.code(yaml.dump(file_data['annotations'], default_flow_style=False, sort_keys=False), language="yaml")
-                    else:
-                        st.warning("File exists but contains no annotations data")
-                except Exception as e:
-                    st.error(f"Error reading annotation file: {str(e)}")
-            else:
+                    # Display annotations
+                    st.subheader("File Annotations")
+                    st.code(yaml.dump(file_data['annotations'], default_flow_style=False, sort_keys=False), language="yaml")
+                else:
+                    st.warning("File exists but contains no annotations data")
+            except FileNotFoundError:
                 st.info("No annotation file exists on disk yet. Save your annotations to create it.")
+            except Exception as e:
+                st.error(f"Error reading annotation file: {str(e)}")
     
     # No need to return anything as annotations are directly updated in the storage
     return None
@@ -1622,6 +2012,7 @@ def display_annotation_completion_status(selected_day):
             
             # Create a dataframe and display it
             if status_data:
+                import pandas as pd
                 status_df = pd.DataFrame(status_data)
                 st.dataframe(
                     status_df,
@@ -1636,30 +2027,37 @@ def display_annotation_completion_status(selected_day):
 # This function has been removed and its functionality integrated into the save button
 
 
-def save_all_annotations(force_save=False):
+def save_all_annotations(force_save=False, keys=None):
     """
     Save all image annotations to individual YAML files.
     Only saves when explicitly triggered by "Save Annotations" button.
     
     Args:
         force_save: If True, forces the save operation, used only by the explicit save button
+        keys: Optional iterable of image paths to write. Other images that already have an
+            annotation file are not rewritten but still count towards the day status files.
     """
     # Check if we're currently loading annotations - never save during load
     if st.session_state.get('loading_annotations', False):
-        print("Skipping annotation save: currently loading annotations")
+        logger.debug("Skipping annotation save: currently loading annotations")
         return
     
     # Make sure image_annotations is initialized
     if 'image_annotations' not in st.session_state:
-        print("WARNING: image_annotations not in session state, initializing it now")
+        logger.warning("image_annotations not in session state, initializing it now")
         st.session_state.image_annotations = {}
         # No need to proceed if there are no annotations
         if not force_save:
             return
     
-    # Track saved annotations by day for status updates
-    annotations_by_day = {}  # {day_dir: {img_filename: annotation_data}}
+    # Track saved annotations by day directory for status updates. Days are keyed by
+    # directory, not day of year, since images of other stations or years can have
+    # the same day of year.
+    annotations_by_day = defaultdict(dict)  # {day_dir: {img_filename: annotation_data}}
     saved_count = 0
+    unchanged_count = 0  # images skipped because they match their last save
+    if keys is not None:
+        keys = set(keys)
 
     try:
         # Get the annotation timer to record elapsed times
@@ -1668,43 +2066,82 @@ def save_all_annotations(force_save=False):
         # Pause the timer to capture current elapsed time
         annotation_timer.pause_timer()
         
-        # Process each image's annotations
-        for img_path, annotations in st.session_state.image_annotations.items():
-            if not isinstance(img_path, str) or not os.path.exists(img_path):
-                print(f"Skipping invalid image path: {img_path}")
-                continue
-                
-            # Extract day and directory
-            img_dir = os.path.dirname(img_path)
-            img_filename = os.path.basename(img_path)
-            doy = os.path.basename(img_dir)
-            
-            # Skip if can't determine day
-            if not doy.isdigit():
-                print(f"Skipping image with invalid day: {img_path}, day: {doy}")
+        # Lazily loaded images are unchanged since their file was read, so only the
+        # requested ones are materialized. The others count towards the day status files
+        # with their cached header, unless it has no usable status.
+        annotation_file_meta = st.session_state.setdefault('annotation_file_meta', {})
+        pending_headers = {}  # {img_path: header of its annotation file}
+        materialize_paths = []
+        for img_path, annotation_file_path in st.session_state.get('pending_annotation_files', {}).items():
+            if keys is not None and img_path in keys:
+                materialize_paths.append(img_path)
                 continue
-            
-            # Ensure annotations are in list format (one dict per ROI)
-            annotation_list = []
-            if isinstance(annotations, list):
-                # Already in correct format
-                annotation_list = annotations
-            elif isinstance(annotations, dict):
-                # Convert dict format to list format
+            header = annotation_file_meta.get(annotation_file_path)
+            if header is None:
                 try:
-                    for roi_name, roi_data in annotations.items():
-                        if isinstance(roi_data, dict):
-                            roi_data_copy = roi_data.copy()
-                            roi_data_copy['roi_name'] = roi_name
-                            annotation_list.append(roi_data_copy)
-                    print(f"Converted dict annotations to list format for {img_filename}")
+                    header = read_annotation_header(annotation_file_path)
                 except Exception as e:
-                    print(f"Error converting annotations for {img_filename}: {str(e)}")
-                    continue
+                    logger.error("Error loading existing annotation file %s: %s", annotation_file_path, e)
+                    header = {}
+                if header:
+                    annotation_file_meta[annotation_file_path] = header
+            if header.get('status') in ("completed", "in_progress"):
+                pending_headers[img_path] = header
             else:
-                print(f"Warning: Unexpected annotations format for {img_filename}: {type(annotations)}")
+                materialize_paths.append(img_path)
+        load_pending_annotations(materialize_paths)
+        
+        # Index the valid images by day directory once, with the image count of each day
+        valid_images = []
+        day_image_totals = defaultdict(int)  # {day_dir: number of annotated images}
+        # Image files do not move during a session, so each path is checked on disk once.
+        # New paths are checked against one listing per directory instead of a stat each.
+        existing_image_paths = st.session_state.setdefault('_existing_image_paths', set())
+        directory_listings = {}
+        for img_path in itertools.chain(st.session_state.image_annotations, pending_headers):
+            if img_path in existing_image_paths or not isinstance(img_path, str):
+                continue
+            img_dir, img_filename, _ = get_image_path_parts(img_path)
+            if img_dir not in directory_listings:
+                try:
+                    directory_listings[img_dir] = list_directory_names(img_dir or os.curdir)
+                except OSError:
+                    directory_listings[img_dir] = set()
+            if img_filename in directory_listings[img_dir]:
+                existing_image_paths.add(img_path)
+        
+        for img_path, annotations in st.session_state.image_annotations.items():
+            if img_path not in existing_image_paths:
+                logger.warning("Skipping invalid image path: %s", img_path)
                 continue
             
+            img_dir, img_filename, doy = get_image_path_parts(img_path)
+            # Skip if can't determine day
+            if not _DOY_RE.match(doy):
+                logger.debug("Skipping image with invalid day: %s, day: %s", img_path, doy)
+                continue
+            valid_images.append((img_path, img_dir, img_filename, doy, annotations))
+            day_image_totals[img_dir] += 1
+        
+        pending_by_day = defaultdict(dict)  # {day_dir: {img_filename: header}}
+        for img_path, header in pending_headers.items():
+            if img_path not in existing_image_paths or img_path in st.session_state.image_annotations:
+                continue
+            img_dir, img_filename, doy = get_image_path_parts(img_path)
+            if not _DOY_RE.match(doy):
+                continue
+            pending_by_day[img_dir][img_filename] = header
+            day_image_totals[img_dir] += 1
+        
+        # Process each image's annotations
+        dir_metadata = {}  # {img_dir: (year, station, instrument)}
+        last_saved_signatures = st.session_state.setdefault('last_saved_signatures', {})
+        written_day_dirs = set()
+        # One timestamp for every file written by this save
+        saved_at = datetime.datetime.now().isoformat()
+        # Annotations enter image_annotations in list format (one dict per ROI):
+        # files are normalized when loaded and the UI stores lists
+        for img_path, img_dir, img_filename, doy, annotation_list in valid_images:
             # Get the annotation file path for this image
             annotation_file_path = get_annotation_file_path(img_path)
             
@@ -1712,68 +2149,66 @@ def save_all_annotations(force_save=False):
             # Get overall time for the day and divide by number of images
             current_session_time = annotation_timer.get_elapsed_time_minutes(doy)
             
-            # Count images in this day to divide the time fairly
-            day_image_count = 0
-            for path in st.session_state.image_annotations:
-                if isinstance(path, str) and os.path.exists(path):
-                    path_dir = os.path.dirname(path)
-                    path_doy = os.path.basename(path_dir)
-                    if path_doy == doy:
-                        day_image_count += 1
-            
-            # Divide session time by number of images (minimum 1)
-            image_annotation_time = current_session_time / max(day_image_count, 1)
+            # Divide session time by number of images in this day (minimum 1)
+            image_annotation_time = current_session_time / max(day_image_totals[img_dir], 1)
             
-            # Check for existing annotation file to preserve data
+            # Check for existing annotation file to preserve data (header fields only).
+            # Headers seen by the last load or save are reused instead of re-reading the file.
             existing_annotation_time = 0
             existing_data = {}
-            if os.path.exists(annotation_file_path):
-                try:
-                    with open(annotation_file_path, 'r') as f:
-                        existing_data = yaml.safe_load(f) or {}
-                    
-                    # Get existing annotation time
-                    if "annotation_time_minutes" in existing_data:
-                        existing_annotation_time = existing_data["annotation_time_minutes"]
-                        print(f"Found existing annotation time for {img_filename}: {existing_annotation_time:.2f} minutes")
-                except Exception as e:
-                    print(f"Error loading existing annotation file {annotation_file_path}: {str(e)}")
+            annotation_file_exists = True
+            try:
+                if annotation_file_path not in annotation_file_meta:
+                    annotation_file_meta[annotation_file_path] = read_annotation_header(annotation_file_path)
+                existing_data = annotation_file_meta[annotation_file_path]
+                
+                # Get existing annotation time
+                if "annotation_time_minutes" in existing_data:
+                    existing_annotation_time = existing_data["annotation_time_minutes"]
+                    logger.debug("Found existing annotation time for %s: %.2f minutes", img_filename, existing_annotation_time)
+            except FileNotFoundError:
+                # First save for this image
+                annotation_file_exists = False
+            except Exception as e:
+                logger.error("Error loading existing annotation file %s: %s", annotation_file_path, e)
+            
+            # Only the requested images (and images without a file yet) are written, and
+            # only if their annotations differ from what was last loaded or saved
+            write_file = keys is None or img_path in keys or not annotation_file_exists
+            signature = annotation_signature(annotation_list)
+            if write_file and annotation_file_exists and last_saved_signatures.get(img_path) == signature:
+                write_file = False
+                unchanged_count += 1
             
             # Calculate total annotation time
             total_annotation_time = existing_annotation_time
-            if current_session_time > 0:
+            if write_file and current_session_time > 0:
                 total_annotation_time += image_annotation_time
-                print(f"Added session time for {img_filename}: {image_annotation_time:.2f} minutes. Total: {total_annotation_time:.2f} minutes")
+                logger.debug("Added session time for %s: %.2f minutes. Total: %.2f minutes", img_filename, image_annotation_time, total_annotation_time)
             
-            # Extract metadata from path
+            # Extract metadata from path (once per day directory)
             # Path format: /path/to/base_dir/station/phenocams/products/instrument/L1/year/day/image.jpg
-            year_dir = os.path.dirname(img_dir)
-            year = os.path.basename(year_dir)
-            l1_dir = os.path.dirname(year_dir)
-            instrument_dir = os.path.dirname(l1_dir)
-            instrument = os.path.basename(instrument_dir)
-            products_dir = os.path.dirname(instrument_dir)
-            phenocams_dir = os.path.dirname(products_dir)
-            station_dir = os.path.dirname(phenocams_dir)
-            station = os.path.basename(station_dir)
+            if img_dir not in dir_metadata:
+                year_dir = os.path.dirname(img_dir)
+                l1_dir = os.path.dirname(year_dir)
+                instrument_dir = os.path.dirname(l1_dir)
+                products_dir = os.path.dirname(instrument_dir)
+                phenocams_dir = os.path.dirname(products_dir)
+                station_dir = os.path.dirname(phenocams_dir)
+                dir_metadata[img_dir] = (
+                    os.path.basename(year_dir),
+                    os.path.basename(station_dir),
+                    os.path.basename(instrument_dir)
+                )
+            year, station, instrument = dir_metadata[img_dir]
             
             # Check annotation completion status
-            all_annotated = True
-            for roi in annotation_list:
-                has_annotations = (
-                    roi.get('discard', False) or
-                    roi.get('snow_presence', False) or
-                    len(roi.get('flags', [])) > 0 or
-                    roi.get('not_needed', False)
-                )
-                if not has_annotations:
-                    all_annotated = False
-                    break
+            all_annotated = all(map(_roi_done, annotation_list))
             
             # Create annotation data structure
             annotation_data = {
-                "created": existing_data.get("created", datetime.datetime.now().isoformat()),
-                "last_modified": datetime.datetime.now().isoformat(),
+                "created": existing_data.get("created", saved_at),
+                "last_modified": saved_at,
                 "filename": img_filename,
                 "day_of_year": doy,
                 "year": year,
@@ -1785,139 +2220,110 @@ def save_all_annotations(force_save=False):
             }
             
             # Save individual annotation file
-            save_yaml(annotation_data, annotation_file_path)
-            print(f"Saved annotation file for {img_filename} to {annotation_file_path}")
-            saved_count += 1
+            if write_file:
+                # Flag lists are written inline to keep the files small and quick to parse
+                written = save_yaml(annotation_data, annotation_file_path, fsync=force_save, default_flow_style=None)
+                if written:
+                    # Cache what was written so the next read of the file is not a re-parse
+                    remember_annotation_yaml(annotation_file_path, annotation_data)
+                    last_saved_signatures[img_path] = signature
+                    annotation_file_meta[annotation_file_path] = {
+                        k: v for k, v in annotation_data.items() if k != 'annotations'
+                    }
+                    logger.debug("Saved annotation file for %s to %s", img_filename, annotation_file_path)
+                    saved_count += 1
+                    written_day_dirs.add(img_dir)
+                    st.session_state.setdefault('dirty_annotation_keys', set()).discard(img_path)
+                else:
+                    invalidate_annotation_yaml(annotation_file_path)
             
             # Track for day status updates
-            if doy not in annotations_by_day:
-                annotations_by_day[doy] = {}
-            annotations_by_day[doy][img_filename] = annotation_data
+            annotations_by_day[img_dir][img_filename] = annotation_data
+        
+        # Images that were not materialized count with the header of their file
+        for day_dir, headers in pending_by_day.items():
+            annotations_by_day[day_dir].update(headers)
             
-        # Update day status files
-        for doy, day_annotations in annotations_by_day.items():
+        # Days where no annotation file was written keep their current day status file
+        day_status_tasks = [
+            (os.path.basename(day_dir), day_dir, day_annotations)
+            for day_dir, day_annotations in annotations_by_day.items()
+            if day_dir in written_day_dirs
+        ]
+        
+        # Write the day status files in parallel; this is independent, I/O-bound work
+        # per day, so only the file writes run in the workers and session state is
+        # updated below on this thread. Each worker only touches its own day's entry
+        # in the digest map.
+        day_status_digests = st.session_state.setdefault('day_status_digests', {})
+        def write_day_status(task):
+            doy, day_dir, day_annotations = task
             try:
-                # Find the directory for this day from the first image
-                first_img = list(day_annotations.keys())[0]
-                first_img_data = day_annotations[first_img]
-                
-                # Construct the path to the day directory
-                year = first_img_data["year"]
-                station = first_img_data["station"]
-                instrument = first_img_data["instrument"]
-                
-                # Try to get the day directory from session state
-                day_dir = None
-                if 'scan_info' in st.session_state:
-                    base_dir = st.session_state.scan_info.get('base_dir')
-                    if base_dir:
-                        day_dir = os.path.join(
-                            base_dir,
-                            station,
-                            "phenocams",
-                            "products",
-                            instrument,
-                            "L1",
-                            year,
-                            doy
-                        )
-                
-                # If we can't get it from session state, try to get it from the file path
-                if not day_dir:
-                    for img_path in st.session_state.image_annotations:
-                        if isinstance(img_path, str) and os.path.exists(img_path):
-                            img_dir = os.path.dirname(img_path)
-                            img_doy = os.path.basename(img_dir)
-                            if img_doy == doy:
-                                day_dir = img_dir
-                                break
-                
-                if day_dir and os.path.exists(day_dir):
-                    # Update the day status file
-                    update_day_status_file(day_dir, day_annotations)
-                    
-                    # Update annotation status cache
-                    if 'annotation_status_map' in st.session_state:
-                        try:
-                            # Extract month from day number
-                            date = datetime.datetime.strptime(f"{year}-{doy}", "%Y-%j")
-                            month = date.month
-                            
-                            # Create status key
-                            status_key = f"{station}_{instrument}_{year}_{month}"
-                            
-                            # Update cache entry
-                            if status_key not in st.session_state.annotation_status_map:
-                                st.session_state.annotation_status_map[status_key] = {}
-                            
-                            # Check if all images are fully annotated
-                            day_images = [f for f in os.listdir(day_dir) 
-                                         if f.lower().endswith(('.jpg', '.jpeg', '.png', '.tif', '.tiff'))]
-                            
-                            # For full completion, we need all images to have annotations
-                            all_annotated = len(day_annotations) == len(day_images)
-                            if all_annotated:
-                                # And all images need to be completely annotated
-                                for img_data in day_annotations.values():
-                                    img_status = img_data.get("status", "")
-                                    if img_status != "completed":
-                                        all_annotated = False
-                                        break
-                            
-                            # Set the day status
-                            if all_annotated:
-                                print(f"All images fully annotated for day {doy} - marking as completed")
-                                st.session_state.annotation_status_map[status_key][doy] = 'completed'
-                            else:
-                                print(f"Annotation incomplete for day {doy} - marking as in_progress")
-                                st.session_state.annotation_status_map[status_key][doy] = 'in_progress'
-                                
-                            # Save status to L1 parent folder
-                            from phenotag.ui.components.annotation_status_manager import save_status_to_l1_parent
-                            
-                            # Get base directory
-                            base_dir = None
-                            if 'scan_info' in st.session_state:
-                                base_dir = st.session_state.scan_info.get('base_dir')
-                            else:
-                                # Extract base_dir from the day_dir path
-                                # We need to go up 7 levels: day/year/L1/instrument/products/phenocams/station
-                                path_parts = day_dir.split(os.sep)
-                                base_path_parts = path_parts[:-7]
-                                base_dir = os.sep.join(base_path_parts)
-                            
-                            if base_dir:
-                                # Save the status
-                                current_status = st.session_state.annotation_status_map[status_key][doy]
-                                save_status_to_l1_parent(
-                                    base_dir,
-                                    station,
-                                    instrument,
-                                    year,
-                                    month,
-                                    doy,
-                                    current_status
-                                )
-                                print(f"Saved annotation status to L1 parent folder for day {doy}")
-                                
-                                # Update historical view if needed
-                                if 'historical_year' in st.session_state and 'historical_month' in st.session_state:
-                                    historical_year = st.session_state.historical_year
-                                    historical_month = st.session_state.historical_month
-                                    
-                                    if year == historical_year and month == historical_month:
-                                        # Update historical cache
-                                        hist_status_key = f"{station}_{instrument}_{historical_year}_{historical_month}"
-                                        if hist_status_key not in st.session_state.annotation_status_map:
-                                            st.session_state.annotation_status_map[hist_status_key] = {}
-                                        
-                                        # Use the same status
-                                        st.session_state.annotation_status_map[hist_status_key][doy] = current_status
-                                        print(f"Updated historical status for day {doy} to {current_status}")
-                        except Exception as e:
-                            print(f"Error updating annotation status cache for day {doy}: {str(e)}")
+                image_count = count_day_images(day_dir)
+                # Every image data of a save carries the status worked out for it
+                statuses = {img_name: data['status'] for img_name, data in day_annotations.items()}
+                update_day_status_file(day_dir, day_annotations, expected_count=image_count, statuses=statuses,
+                                       digests=day_status_digests)
+                return image_count
             except Exception as e:
-                print(f"Error updating day status for {doy}: {str(e)}")
+                logger.error("Error updating day status for %s: %s", doy, e)
+                return None
+        
+        day_image_counts = {}  # {day_dir: number of images in the day directory}
+        if day_status_tasks:
+            with ThreadPoolExecutor(max_workers=min(8, len(day_status_tasks))) as executor:
+                image_counts = executor.map(write_day_status, day_status_tasks)
+                day_image_counts = {task[1]: count for task, count in zip(day_status_tasks, image_counts)}
+        
+        # Work out the status of each saved day. The session status cache and the L1
+        # status files are then updated once per month and per status file.
+        status_map_updates = defaultdict(dict)  # {status_key: {doy: status}}
+        l1_status_updates = defaultdict(dict)  # {(base_dir, station, instrument, year): {doy: status}}
+        if 'annotation_status_map' in st.session_state:
+            scan_base_dir = st.session_state.scan_info.get('base_dir') if 'scan_info' in st.session_state else None
+            for doy, day_dir, day_annotations in day_status_tasks:
+                try:
+                    first_img_data = next(iter(day_annotations.values()))
+                    year = first_img_data["year"]
+                    station = first_img_data["station"]
+                    instrument = first_img_data["instrument"]
+                    
+                    # Extract month from day number
+                    month = doy_to_month(year, doy)
+                    
+                    # Check if all images are fully annotated, using the image count
+                    # taken when the day status file was written
+                    image_count = day_image_counts.get(day_dir)
+                    if image_count is None:
+                        continue
+                    
+                    # For full completion, we need all images to have annotations, and
+                    # all images need to be completely annotated
+                    all_annotated = len(day_annotations) == image_count and all(
+                        img_data.get("status", "") == "completed" for img_data in day_annotations.values()
+                    )
+                    current_status = 'completed' if all_annotated else 'in_progress'
+                    logger.debug("Marking day %s as %s", doy, current_status)
+                    status_map_updates[f"{station}_{instrument}_{year}_{month}"][doy] = current_status
+                    
+                    base_dir = scan_base_dir or get_base_dir_from_day_dir(day_dir)
+                    if base_dir:
+                        l1_status_updates[(base_dir, station, instrument, year)][doy] = current_status
+                except Exception as e:
+                    logger.error("Error updating annotation status cache for day %s: %s", doy, e)
+        
+        # Update the annotation status cache. The historical view reads the same
+        # "{station}_{instrument}_{year}_{month}" entries, so it is kept current too.
+        annotation_status_map = st.session_state.get('annotation_status_map')
+        for status_key, day_statuses in status_map_updates.items():
+            annotation_status_map.setdefault(status_key, {}).update(day_statuses)
+        
+        # Save the statuses to the L1 parent folder, one write per status file
+        if l1_status_updates:
+            from phenotag.ui.components.annotation_status_manager import save_statuses_to_l1_parent
+            for (base_dir, station, instrument, year), day_statuses in l1_status_updates.items():
+                save_statuses_to_l1_parent(base_dir, station, instrument, year, day_statuses)
+                logger.debug("Saved annotation status to L1 parent folder for %d days", len(day_statuses))
 
         # Update session state to indicate changes are saved
         if 'unsaved_changes' in st.session_state:
@@ -1932,12 +2338,13 @@ def save_all_annotations(force_save=False):
 
         if saved_count > 0:
             st.toast(f"Saved annotations for {saved_count} images across {len(annotations_by_day)} days!")
+        elif unchanged_count > 0:
+            st.toast(f"Annotations for {unchanged_count} images are already saved.")
         else:
             st.toast("No valid images to save annotations for.")
     except Exception as e:
         st.error(f"Error saving annotations: {str(e)}")
-        import traceback
-        print(f"Detailed error: {traceback.format_exc()}")
+        logger.exception("Error saving annotations: %s", e)
 
 
 def load_day_annotations(selected_day, daily_filepaths):
@@ -1949,32 +2356,34 @@ def load_day_annotations(selected_day, daily_filepaths):
         daily_filepaths (list): List of file paths for the selected day
     """
     if not daily_filepaths:
-        print(f"Warning: No daily_filepaths provided for day {selected_day}")
+        logger.warning("No daily_filepaths provided for day %s", selected_day)
         return
         
     # Set loading flag to prevent concurrent saves while loading
     st.session_state.loading_annotations = True
     
     # Create a placeholder for the logging
-    print(f"===== LOADING ANNOTATIONS FOR DAY {selected_day} =====")
-    print(f"Found {len(daily_filepaths)} image files in the filesystem")
+    logger.debug("===== LOADING ANNOTATIONS FOR DAY %s =====", selected_day)
+    logger.debug("Found %d image files in the filesystem", len(daily_filepaths))
     
     # Create a key to track successful loading for this day
     day_load_key = f"annotations_loaded_day_{selected_day}"
     
-    # Track which images have annotations in memory before loading
-    existing_annotations_before = []
-    if 'image_annotations' in st.session_state:
-        for filepath in st.session_state.image_annotations:
-            img_dir = os.path.dirname(filepath)
-            img_doy = os.path.basename(img_dir)
-            if img_doy == selected_day:
-                existing_annotations_before.append(os.path.basename(filepath))
-    
-    if existing_annotations_before:
-        print(f"Before loading: Found {len(existing_annotations_before)} images with annotations in memory")
-    else:
-        print(f"Before loading: No images with annotations found in memory")
+    # Create mapping of image filenames to paths once; day membership checks below are dict lookups.
+    # The map is kept per day directory and rebuilt when the day's image count changes.
+    day_basename_map = st.session_state.setdefault('day_basename_map', {})
+    map_key = get_image_path_parts(daily_filepaths[0])[0]
+    name_to_path_map = day_basename_map.get(map_key)
+    if name_to_path_map is None or len(name_to_path_map) != len(daily_filepaths):
+        name_to_path_map = {get_image_path_parts(filepath)[1]: filepath for filepath in daily_filepaths}
+        day_basename_map[map_key] = name_to_path_map
+    
+    # Track which images have annotations in memory before loading (diagnostics only)
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    if debug_enabled:
+        image_annotations = st.session_state.get('image_annotations', {})
+        existing_before = sum(1 for filepath in name_to_path_map.values() if filepath in image_annotations)
+        logger.debug("Before loading: Found %d images with annotations in memory", existing_before)
     
     # Create a placeholder for the loading indicator
     with st.spinner(f"Loading annotations for day {selected_day}..."):
@@ -1985,155 +2394,139 @@ def load_day_annotations(selected_day, daily_filepaths):
                 
             # Get the directory where annotations are stored
             if daily_filepaths:
-                img_dir = os.path.dirname(daily_filepaths[0])
+                day_paths = get_day_annotation_paths(selected_day, daily_filepaths[0])
+                img_dir = day_paths['img_dir']
+                
+                # List the day directory once; file existence checks below are set lookups
+                dir_names = list_directory_names(img_dir)
                 
                 # Check if we need to migrate from old day-based format
-                old_format_file = os.path.join(img_dir, f"annotations_{selected_day}.yaml")
-                if os.path.exists(old_format_file):
-                    print(f"Found old-format day annotation file: {old_format_file}")
+                old_format_file = day_paths['old_format_file']
+                if os.path.basename(old_format_file) in dir_names:
+                    logger.info("Found old-format day annotation file: %s", old_format_file)
                     # Check if we already have per-image files
-                    existing_image_annotations = scan_day_annotation_files(img_dir)
+                    existing_image_annotations = scan_day_annotation_files(img_dir, dir_names)
                     if not existing_image_annotations:
-                        print("No per-image annotation files found. Starting migration...")
+                        logger.info("No per-image annotation files found. Starting migration...")
                         # Need to migrate
                         migrated_files = migrate_day_annotations_to_per_image(old_format_file)
-                        print(f"Migration complete. Created {len(migrated_files)} per-image annotation files.")
+                        logger.info("Migration complete. Created %d per-image annotation files.", len(migrated_files))
+                        dir_names = list_directory_names(img_dir)
                         
                         # Rename the old file as backup
                         backup_file = f"{old_format_file}.bak"
                         try:
                             os.rename(old_format_file, backup_file)
-                            print(f"Renamed old annotation file to: {backup_file}")
+                            logger.info("Renamed old annotation file to: %s", backup_file)
                             # Show notification about migration
                             st.toast(f"Migrated annotations to new per-image format for day {selected_day}", icon="🔄")
                         except Exception as rename_error:
-                            print(f"Error renaming old annotation file: {rename_error}")
+                            logger.error("Error renaming old annotation file: %s", rename_error)
                     else:
-                        print(f"Found {len(existing_image_annotations)} existing per-image annotation files. No migration needed.")
+                        logger.debug("Found %d existing per-image annotation files. No migration needed.", len(existing_image_annotations))
                 
                 # Import the annotation timer
                 from phenotag.ui.components.annotation_timer import annotation_timer
                 
-                # Start the timer for this day
-                annotation_timer.start_timer(selected_day)
+                # Start the timer for this day, unless this is a reload of the day that is
+                # already being timed
+                timer_running_for_day = (
+                    st.session_state.get('_last_loaded_day') == selected_day
+                    and st.session_state.get('annotation_timer_current_day') == selected_day
+                    and st.session_state.get('annotation_timer_active', False)
+                )
+                if not timer_running_for_day:
+                    annotation_timer.start_timer(selected_day)
                 
                 # Force clear annotations for this day first to avoid stale data
-                print(f"Clearing existing annotations for day {selected_day}")
-                day_filepaths_to_clear = []
-                for filepath in st.session_state.image_annotations:
-                    img_dir = os.path.dirname(filepath)
-                    img_doy = os.path.basename(img_dir)
-                    if img_doy == selected_day:
-                        day_filepaths_to_clear.append(filepath)
-                
-                for filepath in day_filepaths_to_clear:
-                    if filepath in st.session_state.image_annotations:
-                        del st.session_state.image_annotations[filepath]
-                        print(f"Cleared annotations for {os.path.basename(filepath)}")
+                # (rebuild the dict in one pass rather than deleting key by key)
+                logger.debug("Clearing existing annotations for day %s", selected_day)
+                day_filepaths = set(name_to_path_map.values())
+                previous_annotations = st.session_state.image_annotations
+                st.session_state.image_annotations = {
+                    filepath: annotations
+                    for filepath, annotations in previous_annotations.items()
+                    if filepath not in day_filepaths
+                }
                 
-                print(f"Cleared annotations for {len(day_filepaths_to_clear)} images")
+                cleared_count = len(previous_annotations) - len(st.session_state.image_annotations)
+                logger.debug("Cleared annotations for %d images", cleared_count)
                 
-                # Scan for all per-image annotation files
-                annotation_files = {}
+                # Scan for all per-image annotation files. Only the header fields of each file
+                # are used here; the parsed file is cached and its ROI data is normalized on
+                # first access via get_image_annotations()
                 accumulated_time = 0.0
                 loaded_count = 0
+                pending_annotation_files = {}
                 
-                # Create mapping of image filenames to paths
-                name_to_path_map = {}
-                for filepath in daily_filepaths:
-                    filename = os.path.basename(filepath)
-                    name_to_path_map[filename] = filepath
-                
-                # Check each image path for corresponding annotation file
-                for filepath in daily_filepaths:
-                    annotation_file_path = get_annotation_file_path(filepath)
+                # Check each image path for corresponding annotation file in the directory listing
+                annotation_file_meta = st.session_state.setdefault('annotation_file_meta', {})
+                for filename, filepath in name_to_path_map.items():
+                    if f"{os.path.splitext(filename)[0]}_annotations.yaml" not in dir_names:
+                        # Forget headers of files that were removed outside the app
+                        annotation_file_meta.pop(get_annotation_file_path(filepath), None)
+                        continue
                     
-                    if os.path.exists(annotation_file_path):
-                        try:
-                            # Load the annotation file
-                            with open(annotation_file_path, 'r') as f:
-                                annotation_data = yaml.safe_load(f)
+                    annotation_file_path = get_annotation_file_path(filepath)
+                    try:
+                        header = read_annotation_header(annotation_file_path)
+                        
+                        if not header:
+                            logger.debug("Empty annotation file: %s", annotation_file_path)
+                            continue
+                        annotation_file_meta[annotation_file_path] = header
                             
-                            if not annotation_data:
-                                print(f"Empty annotation file: {annotation_file_path}")
-                                continue
-                                
-                            # Extract and accumulate annotation time
-                            if 'annotation_time_minutes' in annotation_data:
-                                image_time = annotation_data.get('annotation_time_minutes', 0)
-                                accumulated_time += image_time
-                                print(f"Added {image_time:.2f} minutes from {os.path.basename(filepath)}")
+                        # Extract and accumulate annotation time
+                        accumulated_time += header.get('annotation_time_minutes', 0)
+                        
+                        # Register the file for on-demand loading
+                        pending_annotation_files[filepath] = annotation_file_path
+                        loaded_count += 1
                             
-                            # Process annotations for this image
-                            if 'annotations' in annotation_data:
-                                annotations_list = annotation_data['annotations']
-                                
-                                # Normalize annotations to ensure all required fields
-                                processed_annotations = []
-                                for anno in annotations_list:
-                                    # Create a clean copy
-                                    processed_anno = anno.copy()
-                                    
-                                    # Ensure all fields exist
-                                    if 'roi_name' not in processed_anno:
-                                        processed_anno['roi_name'] = "ROI_00"
-                                    if 'discard' not in processed_anno:
-                                        processed_anno['discard'] = False
-                                    if 'snow_presence' not in processed_anno:
-                                        processed_anno['snow_presence'] = False
-                                    if 'flags' not in processed_anno or processed_anno['flags'] is None:
-                                        processed_anno['flags'] = []
-                                    if 'not_needed' not in processed_anno:
-                                        processed_anno['not_needed'] = False
-                                        
-                                    # Make sure flags is a list of strings
-                                    processed_anno['flags'] = [str(flag) for flag in processed_anno['flags']]
-                                    
-                                    # Add to processed list
-                                    processed_annotations.append(processed_anno)
-                                
-                                # Store in session state
-                                st.session_state.image_annotations[filepath] = processed_annotations
-                                loaded_count += 1
-                                print(f"Loaded annotations for {os.path.basename(filepath)}: {len(processed_annotations)} ROIs")
-                            else:
-                                print(f"No annotations data in file: {annotation_file_path}")
-                                
-                        except Exception as load_error:
-                            print(f"Error loading annotation file {annotation_file_path}: {str(load_error)}")
+                    except Exception as load_error:
+                        logger.error("Error loading annotation file %s: %s", annotation_file_path, load_error)
+                
+                # Replace this day's pending files; days loaded earlier keep theirs so
+                # their day status files still count every annotated image
+                pending = st.session_state.setdefault('pending_annotation_files', {})
+                for filepath in day_filepaths:
+                    pending.pop(filepath, None)
+                pending.update(pending_annotation_files)
+                logger.debug("Registered %d annotation files for on-demand loading (%.2f minutes of annotation time)",
+                             loaded_count, accumulated_time)
                 
                 # Set accumulated time for the day
                 current_accumulated = annotation_timer.get_accumulated_time(selected_day)
                 if current_accumulated == 0 and accumulated_time > 0:
                     annotation_timer.set_accumulated_time(selected_day, accumulated_time)
-                    print(f"Set accumulated time to {accumulated_time:.2f} minutes from all image annotations")
+                    logger.debug("Set accumulated time to %.2f minutes from all image annotations", accumulated_time)
                 
                 # Check day status and update completion info
                 # Parse day status file if it exists
-                day_status_file = os.path.join(img_dir, f"day_status_{selected_day}.yaml")
+                day_status_file = day_paths['day_status_file']
                 day_status_data = None
                 
-                if os.path.exists(day_status_file):
+                if os.path.basename(day_status_file) in dir_names:
                     try:
-                        with open(day_status_file, 'r') as f:
-                            day_status_data = yaml.safe_load(f)
-                        print(f"Loaded day status file: {day_status_file}")
+                        day_status_data = load_yaml(day_status_file)
+                        logger.debug("Loaded day status file: %s", day_status_file)
                     except Exception as status_error:
-                        print(f"Error loading day status file: {status_error}")
+                        logger.error("Error loading day status file: %s", status_error)
                 
                 # If no status file, generate one
                 if not day_status_data:
+                    # Completion status needs the ROI data of every annotated image
+                    load_pending_annotations(name_to_path_map.values())
+                    
                     # Gather all loaded annotations
-                    loaded_annotations = {}
-                    for filepath, annotations in st.session_state.image_annotations.items():
-                        img_dir = os.path.dirname(filepath)
-                        img_doy = os.path.basename(img_dir)
-                        if img_doy == selected_day:
-                            filename = os.path.basename(filepath)
-                            loaded_annotations[filename] = {
-                                "annotations": annotations,
-                                "annotation_time_minutes": 0
-                            }
+                    loaded_annotations = {
+                        filename: {
+                            "annotations": st.session_state.image_annotations[filepath],
+                            "annotation_time_minutes": 0
+                        }
+                        for filename, filepath in name_to_path_map.items()
+                        if filepath in st.session_state.image_annotations
+                    }
                     
                     # Generate a new status file
                     if loaded_annotations:
@@ -2141,11 +2534,10 @@ def load_day_annotations(selected_day, daily_filepaths):
                         
                         # Re-read the status file
                         try:
-                            with open(day_status_file, 'r') as f:
-                                day_status_data = yaml.safe_load(f)
-                            print(f"Created and loaded new day status file: {day_status_file}")
+                            day_status_data = load_yaml(day_status_file)
+                            logger.debug("Created and loaded new day status file: %s", day_status_file)
                         except Exception as new_status_error:
-                            print(f"Error loading new day status file: {new_status_error}")
+                            logger.error("Error loading new day status file: %s", new_status_error)
                 
                 # Set completion information in session state
                 if day_status_data:
@@ -2173,32 +2565,30 @@ def load_day_annotations(selected_day, daily_filepaths):
                 # Set flags to indicate successful loading
                 st.session_state.annotations_just_loaded = True
                 st.session_state[day_load_key] = True
+                st.session_state._last_loaded_day = selected_day
             else:
-                print(f"ERROR: daily_filepaths is empty, cannot determine annotations directory")
+                logger.error("daily_filepaths is empty, cannot determine annotations directory")
                 st.session_state[day_load_key] = False
             
-            # Final check to make sure annotations were properly loaded
-            annotations_after_loading = []
-            if 'image_annotations' in st.session_state:
-                for filepath in st.session_state.image_annotations:
-                    img_dir = os.path.dirname(filepath)
-                    img_doy = os.path.basename(img_dir)
-                    if img_doy == selected_day:
-                        annotations_after_loading.append(os.path.basename(filepath))
-            
-            print(f"After loading: Found {len(annotations_after_loading)} images with annotations in memory")
-            if annotations_after_loading:
-                print(f"Annotations loaded: {', '.join(annotations_after_loading)}")
+            # Final check to make sure annotations were properly loaded (diagnostics only)
+            if debug_enabled:
+                image_annotations = st.session_state.get('image_annotations', {})
+                pending = st.session_state.get('pending_annotation_files', {})
+                annotations_after_loading = [
+                    filename for filename, filepath in name_to_path_map.items()
+                    if filepath in image_annotations or filepath in pending
+                ]
+                logger.debug("After loading: Found %d images with annotations available", len(annotations_after_loading))
+                if annotations_after_loading:
+                    logger.debug("Annotations loaded: %s", ', '.join(annotations_after_loading))
         except Exception as e:
-            print(f"Critical error loading annotations: {str(e)}")
+            logger.exception("Critical error loading annotations: %s", e)
             st.error(f"Error loading annotations: {str(e)}")
-            import traceback
-            print(f"Traceback: {traceback.format_exc()}")
             st.session_state[day_load_key] = False
         finally:
             # Always clear the loading flag
             st.session_state.loading_annotations = False
-            print(f"===== COMPLETED LOADING ANNOTATIONS FOR DAY {selected_day} =====")
+            logger.debug("===== COMPLETED LOADING ANNOTATIONS FOR DAY %s =====", selected_day)
     
     # Return success status
     return st.session_state.get(day_load_key, False)
\ No newline at end of file
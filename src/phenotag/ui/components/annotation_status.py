@@ -5,10 +5,15 @@ This module provides functions to check and track the status of annotations
 for different days, instruments, and stations.
 """
 import os
+import logging
 import yaml
 import streamlit as st
 from pathlib import Path
 
+from phenotag.io_tools import SafeLoader
+
+logger = logging.getLogger(__name__)
+
 
 def check_day_annotation_status(base_dir, station_name, instrument_id, year, day):
     """
@@ -49,7 +54,7 @@ def check_day_annotation_status(base_dir, station_name, instrument_id, year, day
                         return 'in_progress'
                     return day_status
         except Exception as e:
-            print(f"Error accessing status cache: {str(e)}")
+            logger.error("Error accessing status cache: %s", e)
     
     # Path to the annotation file
     day_dir = os.path.join(
@@ -72,7 +77,7 @@ def check_day_annotation_status(base_dir, station_name, instrument_id, year, day
     if os.path.exists(day_status_file):
         try:
             with open(day_status_file, 'r') as f:
-                status_data = yaml.safe_load(f)
+                status_data = yaml.load(f, Loader=SafeLoader)
                 
             # Check if all images are annotated
             if status_data and 'completion_percentage' in status_data:
@@ -98,7 +103,7 @@ def check_day_annotation_status(base_dir, station_name, instrument_id, year, day
                     elif any(status == 'in_progress' for status in file_statuses.values()):
                         return 'in_progress'
         except Exception as e:
-            print(f"Error reading day status file: {e}")
+            logger.error("Error reading day status file: %s", e)
     
     # Check if the day directory exists (for nested structure)
     if os.path.exists(day_dir) and os.path.isdir(day_dir):
@@ -111,7 +116,7 @@ def check_day_annotation_status(base_dir, station_name, instrument_id, year, day
                 # At least one per-image file exists, so it's at least in progress
                 return 'in_progress'
         except Exception as e:
-            print(f"Error listing annotation files: {e}")
+            logger.error("Error listing annotation files: %s", e)
 
         # Check legacy day-level annotation file as last resort
         legacy_annotations_file = os.path.join(day_dir, f"annotations_{day}.yaml")
@@ -119,12 +124,12 @@ def check_day_annotation_status(base_dir, station_name, instrument_id, year, day
             try:
                 # Verify contents to make sure it's complete
                 with open(legacy_annotations_file, 'r') as f:
-                    data = yaml.safe_load(f)
+                    data = yaml.load(f, Loader=SafeLoader)
                     # Check if it has annotations
                     if data and 'annotations' in data and data['annotations']:
                         return 'completed'
             except Exception as e:
-                print(f"Error reading legacy annotation file: {e}")
+                logger.error("Error reading legacy annotation file: %s", e)
                 return 'not_annotated'
 
     # For flat file structure, check for annotation file at year level
@@ -134,11 +139,11 @@ def check_day_annotation_status(base_dir, station_name, instrument_id, year, day
     if os.path.exists(flat_annotations_file):
         try:
             with open(flat_annotations_file, 'r') as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=SafeLoader)
                 if data:
                     return 'completed' if data.get('completed', False) else 'in_progress'
         except Exception as e:
-            print(f"Error reading flat annotation file: {e}")
+            logger.error("Error reading flat annotation file: %s", e)
 
     # No annotation files found
     return 'not_annotated'
@@ -5,10 +5,15 @@ This module provides functionality for managing annotation status files at the L
 """
 
 import os
+import logging
 from pathlib import Path
 import yaml
 from datetime import datetime
 
+from phenotag.io_tools import SafeLoader, SafeDumper
+
+logger = logging.getLogger(__name__)
+
 def get_normalized_station_name(station_name):
     """
     Get the normalized version of a station name by looking it up in the stations.yaml config.
@@ -63,6 +68,22 @@ def save_status_to_l1_parent(base_dir, station_name, instrument_id, year, month,
         day (str): Day of year
         status (str): Annotation status ('not_annotated', 'in_progress', or 'completed')
     """
+    return save_statuses_to_l1_parent(base_dir, station_name, instrument_id, year, {day: status})
+
+def save_statuses_to_l1_parent(base_dir, station_name, instrument_id, year, day_statuses):
+    """
+    Save the annotation status of several days to the L1 parent directory.
+    
+    The status file is read and written once for all days.
+    
+    Args:
+        base_dir (str): Base directory for PHENOCAMS_DATA
+        station_name (str): Normalized station name
+        instrument_id (str): Instrument ID
+        year (int): Year
+        day_statuses (dict): Annotation status ('not_annotated', 'in_progress', or
+            'completed') keyed by day of year
+    """
     try:
         # Get the L1 parent path
         l1_parent_path = get_l1_parent_path(base_dir, station_name, instrument_id)
@@ -74,7 +95,7 @@ def save_status_to_l1_parent(base_dir, station_name, instrument_id, year, month,
         # Create or load existing status data
         if os.path.exists(status_file_path):
             with open(status_file_path, "r") as f:
-                status_data = yaml.safe_load(f) or {}
+                status_data = yaml.load(f, Loader=SafeLoader) or {}
         else:
             # Get the normalized station name for metadata
             normalized_name = get_normalized_station_name(station_name)
@@ -95,20 +116,23 @@ def save_status_to_l1_parent(base_dir, station_name, instrument_id, year, month,
         if str(year) not in status_data["annotations"]:
             status_data["annotations"][str(year)] = {}
         
-        # Get existing day data or create new
-        if day in status_data["annotations"][str(year)]:
-            # Preserve existing data and just update what's needed
-            day_data = status_data["annotations"][str(year)][day]
-            
-            # Only update the status field and last_updated
-            day_data["status"] = status
-            day_data["last_updated"] = datetime.now().isoformat()
-        else:
-            # Create new day entry
-            status_data["annotations"][str(year)][day] = {
-                "status": status,
-                "last_updated": datetime.now().isoformat()
-            }
+        year_data = status_data["annotations"][str(year)]
+        now = datetime.now().isoformat()
+        for day, status in day_statuses.items():
+            # Get existing day data or create new
+            if day in year_data:
+                # Preserve existing data and just update what's needed
+                day_data = year_data[day]
+                
+                # Only update the status field and last_updated
+                day_data["status"] = status
+                day_data["last_updated"] = now
+            else:
+                # Create new day entry
+                year_data[day] = {
+                    "status": status,
+                    "last_updated": now
+                }
         
         # Update last modified timestamp in metadata
         status_data["metadata"]["last_updated"] = datetime.now().isoformat()
@@ -127,10 +151,10 @@ def save_status_to_l1_parent(base_dir, station_name, instrument_id, year, month,
         
         # Save the status file
         with open(status_file_path, "w") as f:
-            yaml.dump(status_data, f, default_flow_style=False)
+            yaml.dump(status_data, f, Dumper=SafeDumper, default_flow_style=False)
         
         return True
     
     except Exception as e:
-        print(f"Error saving annotation status: {e}")
+        logger.error("Error saving annotation status: %s", e)
         return False
\ No newline at end of file
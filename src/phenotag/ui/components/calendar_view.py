@@ -4,7 +4,7 @@ Calendar view component for PhenoTag UI.
 This module handles displaying and managing the calendar for day selection.
 """
 import os
-import time
+import logging
 import calendar
 import streamlit as st
 from pathlib import Path
@@ -14,10 +14,13 @@ from phenotag.io_tools import (
     get_days_in_year,
     get_days_in_month, 
     format_month_year,
-    create_placeholder_data
+    create_placeholder_data,
+    load_yaml
 )
 from phenotag.ui.calendar_component import create_calendar, format_day_range
-from phenotag.ui.components.session_state import save_session_config
+from phenotag.ui.components.session_state import save_session_config, reset_image_annotations
+
+logger = logging.getLogger(__name__)
 
 
 def render_year_month_selectors(normalized_name, selected_instrument, image_data):
@@ -81,16 +84,16 @@ def render_year_month_selectors(normalized_name, selected_instrument, image_data
         # Reset selected image index
         if 'selected_image_index' in st.session_state:
             st.session_state.selected_image_index = 0
-            print("Reset selected image index due to year change")
+            logger.debug("Reset selected image index due to year change")
         # Reset current filepath
         if 'current_filepath' in st.session_state:
             st.session_state.current_filepath = None
-            print("Reset current filepath due to year change")
+            logger.debug("Reset current filepath due to year change")
         # Reset image_annotations to ensure we reload them for the new year
         if 'image_annotations' in st.session_state:
             # No auto-save when changing year
             if hasattr(st.session_state, 'image_annotations') and st.session_state.image_annotations:
-                print(f"No auto-save when changing year to {selected_year}")
+                logger.debug("No auto-save when changing year to %s", selected_year)
                 
             # Pause the annotation timer when changing years
             if hasattr(st.session_state, 'annotation_timer_current_day') and st.session_state.annotation_timer_current_day:
@@ -98,12 +101,12 @@ def render_year_month_selectors(normalized_name, selected_instrument, image_data
                 annotation_timer.pause_timer()
                 
             # Now clear the annotations
-            st.session_state.image_annotations = {}
+            reset_image_annotations()
             
             # Clear annotation status cache when changing year
             if 'annotation_status_map' in st.session_state:
                 st.session_state.annotation_status_map = {}
-                print("Cleared annotation status cache due to year change")
+                logger.debug("Cleared annotation status cache due to year change")
         # Save session config when selection changes (UI state, not annotations)
         save_session_config()
         # Trigger a rerun to update the UI
@@ -137,18 +140,18 @@ def render_year_month_selectors(normalized_name, selected_instrument, image_data
         # Reset selected image index
         if 'selected_image_index' in st.session_state:
             st.session_state.selected_image_index = 0
-            print("Reset selected image index due to month change")
+            logger.debug("Reset selected image index due to month change")
         # Reset current filepath
         if 'current_filepath' in st.session_state:
             st.session_state.current_filepath = None
-            print("Reset current filepath due to month change")
+            logger.debug("Reset current filepath due to month change")
         
         # Clear annotations without auto-saving when changing months
         if 'image_annotations' in st.session_state and st.session_state.image_annotations:
             # No auto-save when changing month
-            print(f"No auto-save when changing month to {selected_month_idx}")
-            # Clear annotations 
-            st.session_state.image_annotations = {}
+            logger.debug("No auto-save when changing month to %s", selected_month_idx)
+        # Clear annotations, including files still pending on-demand loading
+        reset_image_annotations()
             
         # Force a refresh of the calendar for the new month if using lazy loading
         if hasattr(st.session_state, 'scan_info') and st.session_state.scan_info.get('lazy_loaded'):
@@ -228,9 +231,7 @@ def render_calendar(normalized_name, selected_instrument, selected_year, selecte
                     
                     # Check if the status file exists
                     if os.path.exists(status_file_path):
-                        import yaml
-                        with open(status_file_path, "r") as f:
-                            status_data = yaml.safe_load(f) or {}
+                        status_data = load_yaml(status_file_path) or {}
                         
                         # Extract statuses for this year/month
                         status_map = {}
@@ -269,12 +270,12 @@ def render_calendar(normalized_name, selected_instrument, selected_year, selecte
                         # If we found statuses, use them
                         if status_map:
                             st.session_state.annotation_status_map[status_key] = status_map
-                            print(f"Loaded annotation status from L1 parent for {len(status_map)} days in {selected_month}/{selected_year}")
+                            logger.debug("Loaded annotation status from L1 parent for %d days in %s/%s", len(status_map), selected_month, selected_year)
                             # No need to check individual files
                             return
                 
                 except Exception as parent_error:
-                    print(f"Error loading from L1 parent: {str(parent_error)}")
+                    logger.error("Error loading from L1 parent: %s", parent_error)
                     # Continue with individual file checking
                 
                 # Create a new status map for this month
@@ -306,9 +307,9 @@ def render_calendar(normalized_name, selected_instrument, selected_year, selecte
                 
                 # Store the map
                 st.session_state.annotation_status_map[status_key] = status_map
-                print(f"Preloaded annotation status for {len(status_map)} days in {selected_month}/{selected_year}")
+                logger.debug("Preloaded annotation status for %d days in %s/%s", len(status_map), selected_month, selected_year)
     except Exception as e:
-        print(f"Error preloading annotation status: {str(e)}")
+        logger.error("Error preloading annotation status: %s", e)
     if not selected_year or not selected_month:
         return []
         
@@ -365,7 +366,7 @@ def render_calendar(normalized_name, selected_instrument, selected_year, selecte
             calendar_progress.progress(40)
 
             # Log available days before filtering
-            print(f"Calendar - Available days before filtering: {all_days}")
+            logger.debug("Calendar - Available days before filtering: %s", all_days)
 
             # Update progress
             calendar_progress.progress(60)
@@ -378,7 +379,7 @@ def render_calendar(normalized_name, selected_instrument, selected_year, selecte
             )
 
             # Log available days after filtering
-            print(f"Calendar - Days in month {selected_month}: {month_filtered_days}")
+            logger.debug("Calendar - Days in month %s: %s", selected_month, month_filtered_days)
 
             available_days = month_filtered_days
 
@@ -407,10 +408,8 @@ def render_calendar(normalized_name, selected_instrument, selected_year, selecte
             for day in available_days:
                 st.session_state.image_data[key][selected_year][day] = {"_placeholder": True}
 
-            # Finish progress with animation
-            for i in range(85, 101, 5):
-                calendar_progress.progress(i)
-                time.sleep(0.02)
+            # Finish progress
+            calendar_progress.progress(100)
 
             # Mark this month as scanned
             st.session_state[calendar_scan_key] = True
@@ -427,7 +426,7 @@ def render_calendar(normalized_name, selected_instrument, selected_year, selecte
                     # Update selection key used by calendar component
                     selection_key = f"calendar_selection_{selected_year}_{selected_month}"
                     st.session_state[selection_key] = [int(first_day)]
-                    print(f"Auto-selected first available day: {first_day}")
+                    logger.debug("Auto-selected first available day: %s", first_day)
             else:
                 st.info(f"No images found for {calendar.month_name[selected_month]} {selected_year}")
 
@@ -451,7 +450,6 @@ def render_calendar(normalized_name, selected_instrument, selected_year, selecte
             # No data yet - automatically trigger a scan by rerunning
             st.info("No data available yet. Scanning for available days...")
             st.session_state[calendar_scan_key] = False  # Reset the scan flag
-            time.sleep(0.5)  # Small delay for UI
             st.rerun()
     else:
         # Use the full image data (original behavior)
@@ -520,7 +518,7 @@ def display_calendar_view(normalized_name, selected_instrument):
                 selection_key = f"calendar_selection_{selected_year}_{selected_month}"
                 st.session_state[selection_key] = [int(first_day)]
                 selected_days = [int(first_day)]
-                print(f"Auto-selected first available day after render: {first_day}")
+                logger.debug("Auto-selected first available day after render: %s", first_day)
 
     # Check if day selection has changed
     day_changed = False
@@ -556,7 +554,7 @@ def display_calendar_view(normalized_name, selected_instrument):
     if day_changed and 'image_annotations' in st.session_state:
         # No auto-save when changing day selection
         if hasattr(st.session_state, 'image_annotations') and st.session_state.image_annotations:
-            print(f"No auto-save when changing day selection")
+            logger.debug("No auto-save when changing day selection")
             
         # Pause the annotation timer when changing days
         if hasattr(st.session_state, 'annotation_timer_current_day') and st.session_state.annotation_timer_current_day:
@@ -564,7 +562,7 @@ def display_calendar_view(normalized_name, selected_instrument):
             annotation_timer.pause_timer()
             
         # Clear the annotations to force reloading
-        st.session_state.image_annotations = {}
+        reset_image_annotations()
             
     # Display selected day range if available
     if selected_days:
@@ -4,6 +4,7 @@ Image display component for PhenoTag.
 This module handles displaying and selecting images with their metadata.
 """
 import os
+import logging
 import datetime
 import pandas as pd
 import streamlit as st
@@ -18,7 +19,7 @@ from phenotag.io_tools import (
 )
 from phenotag.ui.calendar_component import format_day_range
 
-
+logger = logging.getLogger(__name__)
 
 
 def display_image_list(daily_filepaths):
@@ -79,12 +80,16 @@ def display_image_list(daily_filepaths):
     # Check annotation status for each file
     # Make sure image_annotations is initialized
     if 'image_annotations' not in st.session_state:
-        print("WARNING: image_annotations not in session state in display_image_list, initializing it now")
+        logger.warning("image_annotations not in session state in display_image_list, initializing it now")
         st.session_state.image_annotations = {}
     
+    # Annotations of the loaded day may still be pending on-demand loading
+    pending_annotation_files = st.session_state.get('pending_annotation_files', {})
     annotation_status = []
     for filepath in daily_filepaths:
-        annotation_status.append(filepath in st.session_state.image_annotations)
+        annotation_status.append(
+            filepath in st.session_state.image_annotations or filepath in pending_annotation_files
+        )
     
     # Create a list of radio options with formatted display labels
     radio_options = []
@@ -139,20 +144,20 @@ def display_image_list(daily_filepaths):
             if st.session_state.get('selected_image_index') != selected_index:
                 # Update the session state
                 st.session_state.selected_image_index = selected_index
-                print(f"Updated selected_image_index to {selected_index}")
+                logger.debug("Updated selected_image_index to %s", selected_index)
                 
                 # Set current_filepath based on the new selection
                 if 0 <= selected_index < len(daily_filepaths):
                     st.session_state.current_filepath = daily_filepaths[selected_index]
-                    print(f"Set current_filepath to {daily_filepaths[selected_index]}")
+                    logger.debug("Set current_filepath to %s", daily_filepaths[selected_index])
                 else:
                     # Handle case where index is out of range
-                    print(f"Warning: selected_index {selected_index} is out of range for daily_filepaths with length {len(daily_filepaths)}")
+                    logger.warning("selected_index %s is out of range for daily_filepaths with length %d", selected_index, len(daily_filepaths))
                     # Reset to valid index if possible
                     if daily_filepaths:
                         st.session_state.selected_image_index = 0
                         st.session_state.current_filepath = daily_filepaths[0]
-                        print(f"Reset to index 0: {daily_filepaths[0]}")
+                        logger.debug("Reset to index 0: %s", daily_filepaths[0])
                     
                 # Force a rerun to update the UI and annotation panel
                 st.rerun()
@@ -192,22 +197,22 @@ def display_selected_image(event, daily_filepaths):
     # First check if we have a radio button selection in session state
     if 'selected_image_index' in st.session_state and st.session_state.selected_image_index is not None:
         index = st.session_state.selected_image_index
-        print(f"Using index from session state: {index}")
+        logger.debug("Using index from session state: %s", index)
     # Fall back to the event selection if provided (for backward compatibility)
     elif event and hasattr(event, 'selection') and hasattr(event.selection, 'rows') and event.selection.rows:
         try:
             # Convert to integer index (it might be a string from the dataframe)
             index = int(event.selection.rows[0])
-            print(f"Using index from event: {index}")
+            logger.debug("Using index from event: %s", index)
             
             # Also update the session state for persistence
             st.session_state.selected_image_index = index
         except (ValueError, TypeError) as e:
-            print(f"Error processing selection from event: {e}")
+            logger.warning("Error processing selection from event: %s", e)
             st.error(f"Error processing selection from event: {e}")
             index = None
     else:
-        print("No selection found - neither in session state nor in event")
+        logger.debug("No selection found - neither in session state nor in event")
     
     # Process the selection if we have a valid index
     if index is not None:
@@ -234,14 +239,14 @@ def display_selected_image(event, daily_filepaths):
                     
                     # If ROIs don't match current instrument, try to load them
                     if inst_id != roi_inst_id:
-                        print(f"ROIs don't match current instrument: {roi_inst_id} vs {inst_id}")
+                        logger.debug("ROIs don't match current instrument: %s vs %s", roi_inst_id, inst_id)
                         from phenotag.ui.main import load_instrument_rois
                         load_instrument_rois()  # Will load correct ROIs for current instrument
                     
                     if 'instrument_rois' in st.session_state and st.session_state.instrument_rois:
                         # Use the instrument-specific ROIs from the stations configuration
                         # Debug the ROI structure
-                        print(f"Applying ROIs: {list(st.session_state.instrument_rois.keys())}")
+                        logger.debug("Applying ROIs: %s", list(st.session_state.instrument_rois.keys()))
                         
                         # Verify ROIs are for the correct instrument
                         inst_id = st.session_state.get('selected_instrument')
@@ -250,7 +255,7 @@ def display_selected_image(event, daily_filepaths):
                         
                         # Display a warning if ROI instrument doesn't match selected instrument
                         if roi_inst_id != inst_id:
-                            print(f"WARNING: ROI instrument ({roi_inst_id}) doesn't match selected instrument ({inst_id})!")
+                            logger.warning("ROI instrument (%s) doesn't match selected instrument (%s)!", roi_inst_id, inst_id)
                             st.warning(f"ROI overlays are from instrument {roi_inst_id}, but you're viewing {inst_id}. ROIs may not be accurate.")
 
                         # Try the built-in ImageProcessor function first with our improved ROI format
@@ -264,27 +269,27 @@ def display_selected_image(event, daily_filepaths):
                                 first_roi = next(iter(roi_dict.values()))
                                 if 'points' in first_roi and isinstance(first_roi['points'][0], list):
                                     # If points are still lists, convert to tuples
-                                    print("ROIs in YAML format detected, performing conversion")
+                                    logger.debug("ROIs in YAML format detected, performing conversion")
                                     from phenotag.ui.components.roi_utils import deserialize_polygons
                                     roi_dict = deserialize_polygons(roi_dict)
 
                             # Apply ROIs using the built-in method
                             processor.overlay_polygons_from_dict(roi_dict, enable_overlay=True)
-                            print("Successfully applied ROIs using built-in overlay_polygons_from_dict")
+                            logger.debug("Successfully applied ROIs using built-in overlay_polygons_from_dict")
 
                             # Check if image has the overlays
                             img_with_overlay = processor.get_image(with_overlays=True)
                             if img_with_overlay is not None:
-                                print(f"Overlay applied - image shape: {img_with_overlay.shape}")
+                                logger.debug("Overlay applied - image shape: %s", img_with_overlay.shape)
                             else:
-                                print("Warning: overlay image is None, falling back to custom method")
+                                logger.warning("overlay image is None, falling back to custom method")
                                 raise ValueError("Overlay image not created")
                         except Exception as e:
-                            print(f"Error applying ROIs with built-in method: {str(e)}")
+                            logger.error("Error applying ROIs with built-in method: %s", e)
 
                             # Fallback to using our improved custom overlay function
                             try:
-                                print("Using custom overlay_polygons function as fallback")
+                                logger.debug("Using custom overlay_polygons function as fallback")
 
                                 # Get the original image (without overlays)
                                 original_img = processor.get_image(with_overlays=False)
@@ -311,14 +316,14 @@ def display_selected_image(event, daily_filepaths):
 
                                         # Replace the processor's image with our overlaid version
                                         processor.image = img_with_rois.copy()
-                                        print("Successfully applied ROIs using custom overlay_polygons")
+                                        logger.debug("Successfully applied ROIs using custom overlay_polygons")
                                     else:
                                         raise ValueError("Custom overlay returned None")
                                 finally:
                                     # Restore the original cv2.imread function
                                     cv2.imread = original_cv2_imread
                             except Exception as inner_e:
-                                print(f"Error with custom overlay: {str(inner_e)}")
+                                logger.error("Error with custom overlay: %s", inner_e)
                                 st.error(f"All ROI display methods failed. Primary error: {str(e)}. Fallback error: {str(inner_e)}")
                                 # Don't use default ROI to avoid confusion
                                 st.warning("Unable to display instrument ROIs due to format incompatibility.")
@@ -327,14 +332,14 @@ def display_selected_image(event, daily_filepaths):
                         # We don't need to show an info message above the image
                     else:
                         # Try one more time to load ROIs for current instrument
-                        print("No ROIs found, trying to load for current instrument...")
+                        logger.debug("No ROIs found, trying to load for current instrument...")
                         from phenotag.ui.main import load_instrument_rois
                         roi_loaded = load_instrument_rois()
                         
                         # If still no ROIs, create a default ROI
                         if not roi_loaded:
                             processor.create_default_roi()
-                            print("Created default ROI since no instrument ROIs were found")
+                            logger.debug("Created default ROI since no instrument ROIs were found")
                             st.info("Using default ROI since no instrument-specific ROIs were found.")
                         # No informational message required now that ROIs are labeled in the image
 
@@ -363,8 +368,8 @@ def display_selected_image(event, daily_filepaths):
                     # Make sure filepath is stored in session state for other components
                     st.session_state.current_filepath = filepath
                     # Print debugging info
-                    print(f"Selected image: {filepath}")
-                    print(f"Image stored in session state as current_filepath")
+                    logger.debug("Selected image: %s", filepath)
+                    logger.debug("Image stored in session state as current_filepath")
                     
                     
                 else:
@@ -433,6 +438,15 @@ def get_filtered_file_paths(normalized_name, selected_instrument, selected_year,
 
             # Otherwise, just use the single selected day
             elif selected_day:
+                # The day is looked up on every rerun; reuse its file list for as long
+                # as the scanned image data still holds the day. Annotation saves do not
+                # touch image_data, so only a rescan of the data directory drops the list.
+                day_files_cache = st.session_state.setdefault('day_files_cache', {})
+                cache_key = (base_dir, station_name, instrument_id, selected_year, selected_day)
+                cached_filepaths = day_files_cache.get(cache_key)
+                if cached_filepaths and selected_day in image_data.get(selected_year, {}):
+                    return list(cached_filepaths)
+
                 with st.spinner(f"Loading data for day {selected_day}..."):
                     # Only load data for the selected day (memory efficient)
                     day_data = lazy_find_phenocam_images(
@@ -452,6 +466,11 @@ def get_filtered_file_paths(normalized_name, selected_instrument, selected_year,
                             image_data[selected_year] = {}
                         image_data[selected_year][selected_day] = day_data[selected_year][selected_day]
 
+                        if daily_filepaths:
+                            day_files_cache[cache_key] = tuple(daily_filepaths)
+                        else:
+                            day_files_cache.pop(cache_key, None)
+
         # For compatibility with existing data structure (non-lazy loading)
         else:
             # If we have selected days from the calendar, use those
@@ -549,9 +568,9 @@ def display_images(normalized_name, selected_instrument, selected_year=None, sel
                             # Try to load the instrument ROIs silently
                             from phenotag.ui.main import load_instrument_rois  # Import here to avoid circular imports
                             if load_instrument_rois():
-                                print("ROIs loaded automatically when toggle was turned on")
+                                logger.debug("ROIs loaded automatically when toggle was turned on")
                             else:
-                                print("No ROIs found for current instrument when toggle was turned on")
+                                logger.debug("No ROIs found for current instrument when toggle was turned on")
 
                         # Force a rerun to update the UI
                         st.rerun()
@@ -626,14 +645,14 @@ def display_images(normalized_name, selected_instrument, selected_year=None, sel
                         selected_filepath = daily_filepaths[selected_index]
                         # Set the current filepath in session state BEFORE displaying
                         st.session_state.current_filepath = selected_filepath
-                        print(f"Set current_filepath directly from selected_index: {selected_filepath}")
+                        logger.debug("Set current_filepath directly from selected_index: %s", selected_filepath)
                     elif daily_filepaths:
                         # If index is invalid but we have filepaths, reset to the first one
                         selected_index = 0
                         st.session_state.selected_image_index = 0
                         selected_filepath = daily_filepaths[0]
                         st.session_state.current_filepath = selected_filepath
-                        print(f"Reset selected_image_index to 0 and set current_filepath: {selected_filepath}")
+                        logger.debug("Reset selected_image_index to 0 and set current_filepath: %s", selected_filepath)
                     
                     # Now display the image (still using the event for compatibility)
                     displayed_filepath = display_selected_image(event, daily_filepaths)
@@ -641,12 +660,12 @@ def display_images(normalized_name, selected_instrument, selected_year=None, sel
                     # As a fallback, update current filepath in session state from the displayed result
                     if displayed_filepath and displayed_filepath != st.session_state.get('current_filepath'):
                         st.session_state.current_filepath = displayed_filepath
-                        print(f"Updated current_filepath from display result: {displayed_filepath}")
+                        logger.debug("Updated current_filepath from display result: %s", displayed_filepath)
                     elif not displayed_filepath and daily_filepaths:
                         # If no filepath was displayed but we have filepaths, try forcing the first one
                         st.session_state.selected_image_index = 0
                         st.session_state.current_filepath = daily_filepaths[0]
-                        print(f"No filepath displayed, reset to first image: {daily_filepaths[0]}")
+                        logger.debug("No filepath displayed, reset to first image: %s", daily_filepaths[0])
                         # Force a rerun to update the UI
                         st.rerun()
             else:
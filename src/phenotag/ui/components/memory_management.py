@@ -3,6 +3,7 @@ Memory management component for PhenoTag UI.
 
 This module provides utilities to manage memory usage in the application.
 """
+import logging
 import streamlit as st
 import gc
 import os
@@ -10,6 +11,8 @@ import psutil
 import time
 from typing import Optional, Dict, Any, Callable
 
+logger = logging.getLogger(__name__)
+
 # Try to import memory_profiler if available
 try:
     import memory_profiler
@@ -53,8 +56,8 @@ class MemoryManager:
         if len(self.memory_usage_history) > 100:
             self.memory_usage_history = self.memory_usage_history[-100:]
             
-        # Print debug info
-        print(f"[MEMORY] {label}: {memory_mb:.2f} MB")
+        # Log debug info
+        logger.debug("[MEMORY] %s: %.2f MB", label, memory_mb)
         
     def check_memory_threshold(self) -> bool:
         """
@@ -129,7 +132,7 @@ class MemoryManager:
             
             # If memory usage is high, try to free memory
             if memory_status['is_high']:
-                print(f"[MEMORY WARNING] Memory usage is high: {memory_status['current_mb']:.2f} MB")
+                logger.warning("[MEMORY WARNING] Memory usage is high: %.2f MB", memory_status['current_mb'])
                 self.clear_memory()
 
 
@@ -4,13 +4,18 @@ ROI utility functions for PhenoTag UI.
 This module provides functions for working with Regions of Interest (ROIs),
 including serialization, deserialization, and overlay on images.
 """
+import logging
+
 import cv2
 import numpy as np
 
+logger = logging.getLogger(__name__)
+
 
 def serialize_polygons(phenocam_rois):
     """
     Converts a dictionary of polygons to be YAML-friendly by converting tuples to lists.
+    Point coordinates index image pixels, so they are rounded to integers.
 
     Parameters:
         phenocam_rois (dict of dict): Dictionary where keys are ROI names and values are dictionaries representing polygons.
@@ -21,7 +26,7 @@ def serialize_polygons(phenocam_rois):
     yaml_friendly_rois = {}
     for roi, polygon in phenocam_rois.items():
         yaml_friendly_polygon = {
-            'points': [list(point) for point in polygon['points']],
+            'points': [[int(round(c)) for c in point] for point in polygon['points']],
             'color': list(polygon['color']),
             'thickness': polygon['thickness']
         }
@@ -43,23 +48,23 @@ def deserialize_polygons(yaml_friendly_rois):
     original_rois = {}
     
     if not yaml_friendly_rois or not isinstance(yaml_friendly_rois, dict):
-        print(f"Warning: Invalid ROI data format. Expected dict, got {type(yaml_friendly_rois)}")
+        logger.warning("Invalid ROI data format. Expected dict, got %s", type(yaml_friendly_rois))
         return original_rois
     
     for roi_name, roi_data in yaml_friendly_rois.items():
         try:
             # Validate roi_data
             if not isinstance(roi_data, dict):
-                print(f"Warning: ROI data for {roi_name} is not a dictionary. Skipping.")
+                logger.warning("ROI data for %s is not a dictionary. Skipping.", roi_name)
                 continue
                 
             # Check for required keys
             if 'points' not in roi_data:
-                print(f"Warning: ROI data for {roi_name} has no 'points' key. Skipping.")
+                logger.warning("ROI data for %s has no 'points' key. Skipping.", roi_name)
                 continue
                 
             if 'color' not in roi_data:
-                print(f"Warning: ROI data for {roi_name} has no 'color' key. Using default.")
+                logger.warning("ROI data for %s has no 'color' key. Using default.", roi_name)
                 roi_data['color'] = [0, 255, 0]  # Default to green
             
             # Convert points to tuples and ensure they're in the correct format
@@ -69,11 +74,11 @@ def deserialize_polygons(yaml_friendly_rois):
                     # Convert to int to ensure proper coordinate handling
                     points.append((int(point[0]), int(point[1])))
                 else:
-                    print(f"Warning: Invalid point format in ROI {roi_name}: {point}. Skipping point.")
+                    logger.warning("Invalid point format in ROI %s: %s. Skipping point.", roi_name, point)
             
             # Skip ROIs with fewer than 3 points (can't form a polygon)
             if len(points) < 3:
-                print(f"Warning: ROI {roi_name} has fewer than 3 valid points ({len(points)}). Skipping ROI.")
+                logger.warning("ROI %s has fewer than 3 valid points (%d). Skipping ROI.", roi_name, len(points))
                 continue
                 
             # Convert color to tuple
@@ -93,9 +98,9 @@ def deserialize_polygons(yaml_friendly_rois):
                 'alpha': alpha
             }
             
-            print(f"Successfully processed ROI '{roi_name}' with {len(points)} points")
+            logger.debug("Successfully processed ROI '%s' with %d points", roi_name, len(points))
         except Exception as e:
-            print(f"Error processing ROI '{roi_name}': {str(e)}")
+            logger.error("Error processing ROI '%s': %s", roi_name, e)
             # Continue with other ROIs even if one fails
 
     return original_rois
@@ -126,7 +131,7 @@ def overlay_polygons(image_path, phenocam_rois: dict, show_names: bool = True, f
         
     # Get image dimensions to check if ROIs are within bounds
     height, width = img.shape[:2]
-    print(f"Image dimensions: {width} x {height}")
+    logger.debug("Image dimensions: %d x %d", width, height)
     
     # Count how many ROIs are successfully drawn
     successful_rois = 0
@@ -136,7 +141,7 @@ def overlay_polygons(image_path, phenocam_rois: dict, show_names: bool = True, f
         try:
             # Validate roi_data
             if not isinstance(roi_data, dict) or 'points' not in roi_data:
-                print(f"ROI '{roi_name}' has invalid format. Skipping.")
+                logger.warning("ROI '%s' has invalid format. Skipping.", roi_name)
                 continue
                 
             # Extract points from the polygon dictionary
@@ -144,7 +149,7 @@ def overlay_polygons(image_path, phenocam_rois: dict, show_names: bool = True, f
             
             # Check that we have enough points for a polygon
             if len(points) < 3:
-                print(f"ROI '{roi_name}' has fewer than 3 points ({len(points)}). Skipping.")
+                logger.warning("ROI '%s' has fewer than 3 points (%d). Skipping.", roi_name, len(points))
                 continue
                 
             # Check if points are within image boundaries
@@ -155,11 +160,11 @@ def overlay_polygons(image_path, phenocam_rois: dict, show_names: bool = True, f
                     out_of_bounds_points.append((i, point))
             
             if out_of_bounds_points:
-                print(f"ROI '{roi_name}' has {len(out_of_bounds_points)} points outside image boundaries:")
+                logger.debug("ROI '%s' has %d points outside image boundaries:", roi_name, len(out_of_bounds_points))
                 for idx, point in out_of_bounds_points[:3]:  # Show up to 3 examples
-                    print(f"  - Point {idx}: {point} is outside {width}x{height}")
+                    logger.debug("  - Point %s: %s is outside %sx%s", idx, point, width, height)
                 if len(out_of_bounds_points) > 3:
-                    print(f"  - ... and {len(out_of_bounds_points) - 3} more")
+                    logger.debug("  - ... and %d more", len(out_of_bounds_points) - 3)
                     
                 # Clip points to stay within image boundaries
                 clipped_points = []
@@ -167,7 +172,7 @@ def overlay_polygons(image_path, phenocam_rois: dict, show_names: bool = True, f
                     x, y = point
                     clipped_points.append((max(0, min(x, width-1)), max(0, min(y, height-1))))
                 points = clipped_points
-                print(f"Clipped points to stay within image boundaries for ROI '{roi_name}'")
+                logger.debug("Clipped points to stay within image boundaries for ROI '%s'", roi_name)
                 
             # Convert to numpy array for OpenCV
             points_array = np.array(points, dtype=np.int32)
@@ -214,10 +219,10 @@ def overlay_polygons(image_path, phenocam_rois: dict, show_names: bool = True, f
             successful_rois += 1
 
         except Exception as e:
-            print(f"Error processing ROI '{roi_name}': {str(e)}")
+            logger.error("Error processing ROI '%s': %s", roi_name, e)
             # Continue with other ROIs even if one fails
     
-    print(f"Successfully overlaid {successful_rois} out of {total_rois} ROIs")
+    logger.debug("Successfully overlaid %d out of %d ROIs", successful_rois, total_rois)
 
     # Convert the image from BGR to RGB before returning
     img_rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
@@ -5,6 +5,7 @@ This module handles scanning for images and maintaining scan state.
 """
 import os
 import time
+import logging
 import streamlit as st
 
 from phenotag.io_tools import (
@@ -14,6 +15,8 @@ from phenotag.io_tools import (
 )
 from phenotag.ui.components.session_state import save_session_config
 
+logger = logging.getLogger(__name__)
+
 
 def handle_scan(normalized_name, selected_instrument):
     """
@@ -133,7 +136,7 @@ def handle_scan(normalized_name, selected_instrument):
                 # Special handling for refresh mode - merge new data with existing
                 if station_instrument_key in st.session_state.image_data:
                     # Log refresh operation
-                    print(f"Refresh mode: Merging data for {station_instrument_key}")
+                    logger.debug("Refresh mode: Merging data for %s", station_instrument_key)
 
                     # Merge existing data with new discoveries
                     existing_data = st.session_state.image_data[station_instrument_key]
@@ -51,7 +51,23 @@ def initialize_session_state(session_config=None):
         
     # Initialize annotations storage
     if 'image_annotations' not in st.session_state:
-        st.session_state.image_annotations = {}
+        reset_image_annotations()
+
+
+def reset_image_annotations():
+    """
+    Clear the in-memory annotations and the per-image state that goes with them.
+
+    Besides image_annotations this drops the annotation files registered for
+    on-demand loading, their cached headers, the last saved signatures and the
+    unsaved-image set. Otherwise a save after changing station, instrument, year
+    or day would still count images of the previous selection.
+    """
+    st.session_state.image_annotations = {}
+    st.session_state.pending_annotation_files = {}
+    st.session_state.annotation_file_meta = {}
+    st.session_state.last_saved_signatures = {}
+    st.session_state.dirty_annotation_keys = set()
 
 
 def save_session_config():
@@ -5,10 +5,13 @@ This module contains functions to create and manage the sidebar navigation
 and controls.
 """
 import os
+import logging
 import streamlit as st
 
 from phenotag.config import load_config_files
-from phenotag.ui.components.session_state import save_session_config
+from phenotag.ui.components.session_state import save_session_config, reset_image_annotations
+
+logger = logging.getLogger(__name__)
 
 
 def get_phenocam_instruments(station_data):
@@ -92,7 +95,7 @@ def render_sidebar():
         if station_changed and 'image_annotations' in st.session_state:
             # No auto-save when changing station
             if hasattr(st.session_state, 'image_annotations') and st.session_state.image_annotations:
-                print("No auto-save when changing station")
+                logger.debug("No auto-save when changing station")
                 
             # Pause the annotation timer when changing station
             if hasattr(st.session_state, 'annotation_timer_current_day') and st.session_state.annotation_timer_current_day:
@@ -100,32 +103,32 @@ def render_sidebar():
                 annotation_timer.pause_timer()
                 
             # Clear annotations since we're changing station
-            st.session_state.image_annotations = {}
+            reset_image_annotations()
             
             # Clear annotation status cache when changing station
             if 'annotation_status_map' in st.session_state:
                 st.session_state.annotation_status_map = {}
-                print("Cleared annotation status cache due to station change")
+                logger.debug("Cleared annotation status cache due to station change")
                 
             # Reset ROI overlay toggle and clear instrument ROIs when station changes
             if 'show_roi_overlays' in st.session_state:
                 st.session_state.show_roi_overlays = False
-                print("Reset ROI overlay toggle due to station change")
+                logger.debug("Reset ROI overlay toggle due to station change")
             
             # Clear any loaded ROI data
             if 'instrument_rois' in st.session_state:
                 st.session_state.instrument_rois = {}
-                print("Cleared instrument ROIs due to station change")
+                logger.debug("Cleared instrument ROIs due to station change")
                 
             # Reset selected image index
             if 'selected_image_index' in st.session_state:
                 st.session_state.selected_image_index = 0
-                print("Reset selected image index due to station change")
+                logger.debug("Reset selected image index due to station change")
                 
             # Reset current filepath
             if 'current_filepath' in st.session_state:
                 st.session_state.current_filepath = None
-                print("Reset current filepath due to station change")
+                logger.debug("Reset current filepath due to station change")
 
         # Update the selected station
         st.session_state.selected_station = selected_station
@@ -178,7 +181,7 @@ def render_sidebar():
                 if instrument_changed and 'image_annotations' in st.session_state:
                     # No auto-save when changing instrument
                     if hasattr(st.session_state, 'image_annotations') and st.session_state.image_annotations:
-                        print("No auto-save when changing instrument")
+                        logger.debug("No auto-save when changing instrument")
                         
                     # Pause the annotation timer when changing instrument
                     if hasattr(st.session_state, 'annotation_timer_current_day') and st.session_state.annotation_timer_current_day:
@@ -186,32 +189,32 @@ def render_sidebar():
                         annotation_timer.pause_timer()
                         
                     # Clear annotations since we're changing instrument
-                    st.session_state.image_annotations = {}
+                    reset_image_annotations()
                     
                     # Clear annotation status cache when changing instrument
                     if 'annotation_status_map' in st.session_state:
                         st.session_state.annotation_status_map = {}
-                        print("Cleared annotation status cache due to instrument change")
+                        logger.debug("Cleared annotation status cache due to instrument change")
                         
                     # Reset ROI overlay toggle and clear instrument ROIs when instrument changes
                     if 'show_roi_overlays' in st.session_state:
                         st.session_state.show_roi_overlays = False
-                        print("Reset ROI overlay toggle due to instrument change")
+                        logger.debug("Reset ROI overlay toggle due to instrument change")
                     
                     # Clear any loaded ROI data
                     if 'instrument_rois' in st.session_state:
                         st.session_state.instrument_rois = {}
-                        print("Cleared instrument ROIs due to instrument change")
+                        logger.debug("Cleared instrument ROIs due to instrument change")
                         
                     # Reset selected image index
                     if 'selected_image_index' in st.session_state:
                         st.session_state.selected_image_index = 0
-                        print("Reset selected image index due to instrument change")
+                        logger.debug("Reset selected image index due to instrument change")
                         
                     # Reset current filepath
                     if 'current_filepath' in st.session_state:
                         st.session_state.current_filepath = None
-                        print("Reset current filepath due to instrument change")
+                        logger.debug("Reset current filepath due to instrument change")
 
                 st.session_state.selected_instrument = selected_instrument
 
@@ -7,6 +7,7 @@ integrating all UI components into a cohesive interface.
 import streamlit as st
 import os
 import sys
+import logging
 import time
 import datetime
 import calendar
@@ -19,14 +20,37 @@ from phenotag.ui.components.calendar_view import display_calendar_view
 from phenotag.ui.components.image_display import display_images
 from phenotag.ui.components.annotation import (
     load_day_annotations, 
+    get_day_annotation_generation,
     save_all_annotations, 
     create_annotation_summary,
-    display_annotation_completion_status
+    display_annotation_completion_status,
+    doy_to_month,
+    get_image_path_parts
 )
 from phenotag.ui.components.memory_management import memory_manager, memory_dashboard, MemoryTracker
 from phenotag.ui.components.annotation_status import check_day_annotation_status
 from phenotag.ui.components.annotation_timer import annotation_timer
 
+logger = logging.getLogger(__name__)
+
+
+def configure_logging():
+    """
+    Set the level of the phenotag loggers from the PHENOTAG_LOGLEVEL environment variable.
+
+    Defaults to WARNING so that the debug messages emitted on every Streamlit
+    rerun are not formatted or written unless explicitly requested.
+    """
+    level = os.environ.get('PHENOTAG_LOGLEVEL', 'WARNING').upper()
+    try:
+        logging.getLogger('phenotag').setLevel(level)
+    except ValueError:
+        logging.getLogger('phenotag').setLevel(logging.WARNING)
+        logger.warning("Unknown PHENOTAG_LOGLEVEL %r, using WARNING", level)
+
+
+configure_logging()
+
 
 def load_instrument_rois():
     """
@@ -58,7 +82,7 @@ def load_instrument_rois():
     
     # If we still don't have both station name and instrument id, return False
     if not station_name or not instrument_id:
-        print(f"Cannot load ROIs: Missing station name ({station_name}) or instrument ID ({instrument_id})")
+        logger.warning("Cannot load ROIs: Missing station name (%s) or instrument ID (%s)", station_name, instrument_id)
         return False
 
     # Load configuration
@@ -74,10 +98,10 @@ def load_instrument_rois():
 
         # Check if phenocams exists
         if 'phenocams' not in station_data:
-            print(f"ERROR: 'phenocams' key missing in station data")
+            logger.error("'phenocams' key missing in station data")
             return False
         elif 'platforms' not in station_data['phenocams']:
-            print(f"ERROR: 'platforms' key missing in phenocams data")
+            logger.error("'platforms' key missing in phenocams data")
             return False
         else:
             # List available platforms
@@ -108,7 +132,7 @@ def load_instrument_rois():
                                 # Store the processed ROIs in session state
                                 st.session_state.instrument_rois = processed_rois
                             except Exception as e:
-                                print(f"Error processing ROIs: {str(e)}")
+                                logger.error("Error processing ROIs: %s", e)
                                 # Fallback to storing the original format which our custom overlay function can handle
                                 st.session_state.instrument_rois = instrument_config['rois']
 
@@ -118,29 +142,29 @@ def load_instrument_rois():
                             # Get ROI names for display
                             roi_names = list(instrument_config['rois'].keys())
                             rois_found = True
-                            print(f"Successfully loaded ROIs for instrument {instrument_id} in station {station_name}: {roi_names}")
+                            logger.debug("Successfully loaded ROIs for instrument %s in station %s: %s", instrument_id, station_name, roi_names)
                             return True  # Successfully loaded ROIs
 
     # If we get here, no ROIs were found
     if not rois_found:
-        print(f"No ROI definitions found for instrument {instrument_id} in station {station_name}")
+        logger.warning("No ROI definitions found for instrument %s in station %s", instrument_id, station_name)
         
         # Add debug information about the station config
-        print(f"Available stations in config: {list(stations_config.keys())}")
+        logger.debug("Available stations in config: %s", list(stations_config.keys()))
         if station_name in stations_config:
             if 'phenocams' in stations_config[station_name]:
                 if 'platforms' in stations_config[station_name]['phenocams']:
                     platforms = stations_config[station_name]['phenocams']['platforms']
-                    print(f"Available platforms: {list(platforms.keys())}")
+                    logger.debug("Available platforms: %s", list(platforms.keys()))
                     for platform_type, platform_data in platforms.items():
                         if 'instruments' in platform_data:
-                            print(f"Instruments in platform {platform_type}: {list(platform_data['instruments'].keys())}")
+                            logger.debug("Instruments in platform %s: %s", platform_type, list(platform_data['instruments'].keys()))
                 else:
-                    print("No 'platforms' key in phenocams data")
+                    logger.debug("No 'platforms' key in phenocams data")
             else:
-                print("No 'phenocams' key in station data")
+                logger.debug("No 'phenocams' key in station data")
         else:
-            print(f"Station {station_name} not found in config")
+            logger.debug("Station %s not found in config", station_name)
             
         return False
 
@@ -213,7 +237,7 @@ def main():
     # Handle scanning if requested
     if hasattr(st.session_state, 'scan_requested') and st.session_state.scan_requested:
         # No need to explicitly save before scanning - annotations managed by popover
-        print("Scanning for images - annotations are saved when made in the annotation panel")
+        logger.debug("Scanning for images - annotations are saved when made in the annotation panel")
             
         with MemoryTracker("Image Scanning"):
             if handle_scan(normalized_name, selected_instrument):
@@ -245,7 +269,7 @@ def main():
     # Day or year change is now handled by the popover - no need to force save
     if (previous_day is not None and selected_day is not None and previous_day != selected_day) or \
        (previous_year is not None and selected_year is not None and previous_year != selected_year):
-        print(f"Changed from day {previous_day} to {selected_day} or year {previous_year} to {selected_year}")
+        logger.debug("Changed from day %s to %s or year %s to %s", previous_day, selected_day, previous_year, selected_year)
     
     # Store current values as previous for next run
     st.session_state['previous_year'] = selected_year
@@ -263,8 +287,6 @@ def main():
     selection_key = f"{normalized_name}_{selected_instrument}_{selected_year}_{selected_day}"
     annotations_loaded_key = f"annotations_loaded_{selection_key}"
     
-    # Reset the annotations_loaded flag on every run to ensure we always load the latest annotations
-    st.session_state[annotations_loaded_key] = False
     
     # Create three main containers for the layout
     top_container = st.container()
@@ -303,42 +325,41 @@ def main():
                 # Create a loading key that's specific to this day
                 day_load_key = f"annotations_loaded_day_{selected_day}"
                 
+                # Reload only when another selection was loaded last or the day's annotation
+                # files changed on disk; plain reruns and tab switches keep the in-memory data
+                day_dir = get_image_path_parts(daily_filepaths[0])[0] if daily_filepaths else None
+                day_generation = (selection_key, get_day_annotation_generation(day_dir) if day_dir else ())
+                if st.session_state.get('_ann_loaded_generation') != day_generation:
+                    st.session_state[annotations_loaded_key] = False
+                
                 # Check if we need to reload annotations (either not loaded or force reload)
                 if not st.session_state.get(day_load_key, False) or not st.session_state.get(annotations_loaded_key, False):
-                    print(f"Loading annotations for day {selected_day} - this is {'not' if not st.session_state.get(day_load_key, False) else ''} loaded by day key")
-                    print(f"Loading annotations for day {selected_day} - this is {'not' if not st.session_state.get(annotations_loaded_key, False) else ''} loaded by general key")
-                    
-                    # Clear any existing annotations for this day to avoid stale data
-                    if 'image_annotations' in st.session_state:
-                        filepaths_to_clear = []
-                        for filepath in st.session_state.image_annotations:
-                            img_dir = os.path.dirname(filepath)
-                            img_doy = os.path.basename(img_dir)
-                            if img_doy == selected_day:
-                                filepaths_to_clear.append(filepath)
-                        
-                        for filepath in filepaths_to_clear:
-                            if filepath in st.session_state.image_annotations:
-                                del st.session_state.image_annotations[filepath]
+                    logger.debug("Loading annotations for day %s (loaded by day key: %s, by general key: %s)",
+                                 selected_day, st.session_state.get(day_load_key, False),
+                                 st.session_state.get(annotations_loaded_key, False))
                     
-                    # Attempt to load annotations
+                    # Attempt to load annotations; this first drops any annotations of the
+                    # day still in memory, so no stale data survives the reload
                     load_successful = load_day_annotations(selected_day, daily_filepaths)
                     
                     # Mark as loaded in both places if successful
                     if load_successful:
                         st.session_state[annotations_loaded_key] = True
                         st.session_state[day_load_key] = True
+                        # Loading may write the day status file, so stamp the day afterwards
+                        st.session_state['_ann_loaded_generation'] = (
+                            selection_key, get_day_annotation_generation(day_dir) if day_dir else ()
+                        )
                     else:
-                        print(f"WARNING: Failed to load annotations for day {selected_day}")
+                        logger.warning("Failed to load annotations for day %s", selected_day)
                 else:
-                    print(f"Skipping annotation load for day {selected_day} - already loaded")
+                    logger.debug("Skipping annotation load for day %s - already loaded", selected_day)
                 
                 # Mark this day as in_progress in the annotation status cache
                 try:
                     if 'annotation_status_map' in st.session_state:
                         # Extract month from day number
-                        date = datetime.datetime.strptime(f"{selected_year}-{selected_day}", "%Y-%j")
-                        month = date.month
+                        month = doy_to_month(selected_year, selected_day)
                         
                         # Create status key
                         status_key = f"{normalized_name}_{selected_instrument}_{selected_year}_{month}"
@@ -355,9 +376,9 @@ def main():
                         else:
                             st.session_state.annotation_status_map[status_key][selected_day] = 'in_progress'
                             
-                        print(f"Updated status cache for current day {selected_day}")
+                        logger.debug("Updated status cache for current day %s", selected_day)
                 except Exception as e:
-                    print(f"Error updating status cache for current tab: {str(e)}")
+                    logger.error("Error updating status cache for current tab: %s", e)
     
     with center_container:
         with MemoryTracker("Image Display"):
@@ -377,12 +398,12 @@ def main():
     with MemoryTracker("Load ROIs"):
         if selected_instrument and 'instrument_rois' not in st.session_state:
             # Try to load ROIs before showing annotation panel
-            print("Explicitly loading ROIs before annotation panel display")
+            logger.debug("Explicitly loading ROIs before annotation panel display")
             load_instrument_rois()
         
-        # Print info about ROIs
+        # Log info about ROIs
         if 'instrument_rois' in st.session_state:
-            print(f"ROIs available for annotation: {list(st.session_state.instrument_rois.keys())}")
+            logger.debug("ROIs available for annotation: %s", list(st.session_state.instrument_rois.keys()))
     
     # Store important data in session state
     if selected_instrument:
@@ -13,7 +13,19 @@ import datetime
 from unittest.mock import patch, MagicMock, Mock
 
 import streamlit as st
-from phenotag.ui.components.annotation import load_day_annotations, save_all_annotations
+from phenotag.ui.components.annotation import (
+    load_day_annotations,
+    save_all_annotations,
+    read_annotation_yaml,
+    read_annotation_header,
+    get_image_annotations,
+    scan_day_annotation_files,
+    annotation_signature,
+    invalidate_annotation_yaml,
+    get_flag_display_options,
+    update_day_status_file,
+    migrate_day_annotations_to_per_image,
+)
 
 
 def test_loading_state_flag():
@@ -58,13 +70,13 @@ def test_prevent_save_during_load():
     """Test that save operations are prevented during loading."""
     # Setup session state with loading_annotations flag set to True
     with patch('streamlit.session_state', {'loading_annotations': True}) as mock_session_state:
-        # Mock print to capture output
-        with patch('builtins.print') as mock_print:
+        # Mock the module logger to capture output
+        with patch('phenotag.ui.components.annotation.logger') as mock_logger:
             # Call save_all_annotations
             save_all_annotations()
             
             # Verify that save was skipped
-            mock_print.assert_called_with("Skipping annotation save: currently loading annotations")
+            mock_logger.debug.assert_called_with("Skipping annotation save: currently loading annotations")
 
 
 def test_save_with_force_save():
@@ -151,7 +163,478 @@ def test_load_marks_just_loaded_flag():
                                     mock_session_state.__setitem__.assert_any_call('annotations_just_loaded', True)
 
 
+def test_read_annotation_yaml_reuses_unchanged_file():
+    """Test that parsed annotation files are reused until the file changes on disk."""
+    with patch('streamlit.session_state', {}):
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            annotation_file = os.path.join(tmpdirname, "image_annotations.yaml")
+            with open(annotation_file, 'w') as f:
+                yaml.dump({'annotations': []}, f)
+
+            first = read_annotation_yaml(annotation_file)
+            second = read_annotation_yaml(annotation_file)
+            assert first is second
+
+            # Rewriting the file changes its size, so the cache must miss
+            with open(annotation_file, 'w') as f:
+                yaml.dump({'annotations': [{'roi_name': 'ROI_01'}]}, f)
+
+            third = read_annotation_yaml(annotation_file)
+            assert third == {'annotations': [{'roi_name': 'ROI_01'}]}
+
+            # Invalidation forces a re-parse even when the stamp is unchanged
+            invalidate_annotation_yaml(annotation_file)
+            assert read_annotation_yaml(annotation_file) is not third
+
+
+def test_read_annotation_header_stops_before_annotations():
+    """Test that the header reader returns the top-level metadata without the ROI list."""
+    with patch('streamlit.session_state', {}):
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            annotation_file = os.path.join(tmpdirname, "image_annotations.yaml")
+            with open(annotation_file, 'w') as f:
+                yaml.dump({
+                    'created': '2025-04-01T08:09:49',
+                    'annotation_time_minutes': 2.5,
+                    'status': 'completed',
+                    'annotations': [{'roi_name': 'ROI_00', 'flags': ['fog']}]
+                }, f, sort_keys=False)
+
+            header = read_annotation_header(annotation_file)
+
+            assert header == {
+                'created': '2025-04-01T08:09:49',
+                'annotation_time_minutes': 2.5,
+                'status': 'completed'
+            }
+
+
+class _AttrDict(dict):
+    """Minimal stand-in for st.session_state supporting both item and attribute access."""
+    __setattr__ = dict.__setitem__
+
+    def __getattr__(self, key):
+        try:
+            return self[key]
+        except KeyError:
+            raise AttributeError(key) from None
+
+
+def test_get_image_annotations_materializes_pending_file():
+    """Test that registered annotation files are parsed and normalized on first access."""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        image_path = os.path.join(tmpdirname, "image.jpg")
+        annotation_file = os.path.join(tmpdirname, "image_annotations.yaml")
+        with open(annotation_file, 'w') as f:
+            yaml.dump({'annotations': [{'roi_name': 'ROI_01', 'flags': None}]}, f)
+
+        session_state = _AttrDict(
+            image_annotations={},
+            pending_annotation_files={image_path: annotation_file}
+        )
+        with patch('streamlit.session_state', session_state):
+            annotations = get_image_annotations(image_path)
+
+        assert annotations == [{
+            'roi_name': 'ROI_01',
+            'flags': [],
+            'discard': False,
+            'snow_presence': False,
+            'not_needed': False
+        }]
+        assert session_state.image_annotations[image_path] is annotations
+        assert image_path not in session_state.pending_annotation_files
+
+
+@pytest.fixture
+def day_dir(tmp_path):
+    """A day directory laid out as station/phenocams/products/INST/L1/2024/123."""
+    path = tmp_path / "station" / "phenocams" / "products" / "INST" / "L1" / "2024" / "123"
+    path.mkdir(parents=True)
+    return str(path)
+
+
+def _create_images(day_dir, *names):
+    """Create empty image files in a day directory and return their paths."""
+    image_paths = []
+    for name in names:
+        image_path = os.path.join(day_dir, name)
+        open(image_path, 'w').close()
+        image_paths.append(image_path)
+    return image_paths
+
+
+def _save_annotations(session_state, **kwargs):
+    """Run save_all_annotations against a stub session with the UI calls and timer patched out.
+
+    Returns the st.toast mock of the save.
+    """
+    with patch('streamlit.session_state', session_state), \
+         patch('streamlit.success'), patch('streamlit.error'), patch('streamlit.toast') as mock_toast, \
+         patch('phenotag.ui.components.annotation_timer.annotation_timer') as mock_timer:
+        mock_timer.get_elapsed_time_minutes.return_value = 0.0
+        save_all_annotations(**kwargs)
+    return mock_toast
+
+
+def _load_day(session_state, selected_day, daily_filepaths):
+    """Run load_day_annotations against a stub session with the UI calls and timer patched out."""
+    with patch('streamlit.session_state', session_state), \
+         patch('streamlit.spinner'), patch('streamlit.toast'), \
+         patch('phenotag.ui.components.annotation_timer.annotation_timer') as mock_timer:
+        mock_timer.get_accumulated_time.return_value = 0.0
+        load_day_annotations(selected_day, daily_filepaths)
+
+
+def test_save_all_annotations_writes_only_requested_keys(day_dir):
+    """Test that a keyed save rewrites only the requested images but keeps the day status complete."""
+    image_paths = _create_images(day_dir, "a.jpg", "b.jpg")
+
+    # b.jpg already has an annotation file on disk
+    untouched_file = os.path.join(day_dir, "b_annotations.yaml")
+    with open(untouched_file, 'w') as f:
+        yaml.dump({'created': 'before', 'annotations': []}, f)
+    untouched_mtime = os.stat(untouched_file).st_mtime_ns
+
+    roi = {'roi_name': 'ROI_00', 'discard': True, 'snow_presence': False, 'flags': [], 'not_needed': False}
+    session_state = _AttrDict(
+        loading_annotations=False,
+        image_annotations={path: [dict(roi)] for path in image_paths},
+    )
+    _save_annotations(session_state, force_save=True, keys=[image_paths[0]])
+
+    assert os.path.exists(os.path.join(day_dir, "a_annotations.yaml"))
+    assert os.stat(untouched_file).st_mtime_ns == untouched_mtime
+    with open(os.path.join(day_dir, "day_status_123.yaml")) as f:
+        day_status = yaml.safe_load(f)
+    assert day_status['annotated_image_count'] == 2
+
+
+def test_save_all_annotations_keeps_same_doy_of_other_station_apart(day_dir, tmp_path):
+    """Test that pending images of another station with the same day of year stay out of this day's status."""
+    image_path, = _create_images(day_dir, "a.jpg")
+    other_day_dir = tmp_path / "other" / "phenocams" / "products" / "INST" / "L1" / "2024" / "123"
+    other_day_dir.mkdir(parents=True)
+    other_path, = _create_images(str(other_day_dir), "z.jpg")
+    other_file = os.path.join(str(other_day_dir), "z_annotations.yaml")
+    with open(other_file, 'w') as f:
+        yaml.dump({'year': '2024', 'station': 'other', 'instrument': 'INST', 'status': 'completed',
+                   'annotations': [{'roi_name': 'ROI_00', 'discard': True}]}, f, sort_keys=False)
+
+    roi = {'roi_name': 'ROI_00', 'discard': True, 'snow_presence': False, 'flags': [], 'not_needed': False}
+    session_state = _AttrDict(
+        loading_annotations=False,
+        image_annotations={image_path: [roi]},
+        pending_annotation_files={other_path: other_file},
+    )
+    _save_annotations(session_state, force_save=True, keys=[image_path])
+
+    with open(os.path.join(day_dir, "day_status_123.yaml")) as f:
+        day_status = yaml.safe_load(f)
+    assert day_status['file_status'] == {'a.jpg': 'completed'}
+    assert not os.path.exists(os.path.join(str(other_day_dir), "day_status_123.yaml"))
+
+
+def test_save_all_annotations_uses_headers_of_pending_images(day_dir):
+    """Test that a save counts lazily loaded images by their file header without parsing them."""
+    image_paths = _create_images(day_dir, "a.jpg", "b.jpg")
+
+    pending_file = os.path.join(day_dir, "b_annotations.yaml")
+    with open(pending_file, 'w') as f:
+        yaml.dump({'year': '2024', 'station': 'station', 'instrument': 'INST', 'status': 'completed',
+                   'annotations': [{'roi_name': 'ROI_00', 'discard': True}]}, f, sort_keys=False)
+
+    roi = {'roi_name': 'ROI_00', 'discard': True, 'snow_presence': False, 'flags': [], 'not_needed': False}
+    session_state = _AttrDict(
+        loading_annotations=False,
+        image_annotations={image_paths[0]: [roi]},
+        pending_annotation_files={image_paths[1]: pending_file},
+    )
+    _save_annotations(session_state, force_save=True, keys=[image_paths[0]])
+
+    assert image_paths[1] not in session_state.image_annotations
+    assert session_state.pending_annotation_files == {image_paths[1]: pending_file}
+    with open(os.path.join(day_dir, "day_status_123.yaml")) as f:
+        day_status = yaml.safe_load(f)
+    assert day_status['annotated_image_count'] == 2
+    assert day_status['file_status']['b.jpg'] == 'completed'
+
+
+def test_save_all_annotations_skips_unchanged_images(day_dir):
+    """Test that an image whose annotations match the last save is not rewritten."""
+    image_path, = _create_images(day_dir, "a.jpg")
+    annotation_file = os.path.join(day_dir, "a_annotations.yaml")
+
+    roi = {'roi_name': 'ROI_00', 'discard': False, 'snow_presence': False, 'flags': [], 'not_needed': False}
+    session_state = _AttrDict(
+        loading_annotations=False,
+        image_annotations={image_path: [roi]},
+    )
+    _save_annotations(session_state, force_save=True)
+    first_mtime = os.stat(annotation_file).st_mtime_ns
+    mock_toast = _save_annotations(session_state, force_save=True)
+    assert os.stat(annotation_file).st_mtime_ns == first_mtime
+    mock_toast.assert_called_once_with("Annotations for 1 images are already saved.")
+
+    roi['discard'] = True
+    _save_annotations(session_state, force_save=True)
+
+    with open(annotation_file) as f:
+        assert yaml.safe_load(f)['annotations'][0]['discard'] is True
+
+
+def test_saved_edit_reaches_yaml_for_a_fresh_session(day_dir):
+    """Test that an edit saved in one session is in the YAML file a new session loads."""
+    image_path, = _create_images(day_dir, "a.jpg")
+    annotation_file = os.path.join(day_dir, "a_annotations.yaml")
+
+    roi = {'roi_name': 'ROI_00', 'discard': False, 'snow_presence': False, 'flags': [], 'not_needed': False}
+    session_state = _AttrDict(
+        loading_annotations=False,
+        image_annotations={image_path: [roi]},
+    )
+    _save_annotations(session_state, force_save=True)
+    roi['discard'] = True
+    _save_annotations(session_state, force_save=True)
+
+    with open(annotation_file) as f:
+        assert yaml.safe_load(f)['annotations'][0]['discard'] is True
+
+    fresh_session_state = _AttrDict(loading_annotations=False)
+    _load_day(fresh_session_state, "123", [image_path])
+    with patch('streamlit.session_state', fresh_session_state):
+        assert get_image_annotations(image_path)[0]['discard'] is True
+
+
+def test_save_after_loading_another_day_counts_earlier_day(day_dir):
+    """Test that loading a second day keeps the first day's lazily loaded images for its status."""
+    other_day_dir = os.path.join(os.path.dirname(day_dir), "124")
+    os.makedirs(other_day_dir)
+    first_day_paths = _create_images(day_dir, "a.jpg", "b.jpg")
+    other_day_paths = _create_images(other_day_dir, "c.jpg")
+
+    roi = {'roi_name': 'ROI_00', 'discard': True, 'snow_presence': False, 'flags': [], 'not_needed': False}
+    for image_path in first_day_paths + other_day_paths:
+        img_dir, img_name = os.path.split(image_path)
+        with open(os.path.join(img_dir, img_name.replace(".jpg", "_annotations.yaml")), 'w') as f:
+            yaml.dump({'year': '2024', 'station': 'station', 'instrument': 'INST', 'status': 'completed',
+                       'annotations': [roi]}, f, sort_keys=False)
+    for img_dir, image_paths in [(day_dir, first_day_paths), (other_day_dir, other_day_paths)]:
+        images_data = {os.path.basename(path): {'status': 'completed'} for path in image_paths}
+        update_day_status_file(img_dir, images_data, expected_count=len(image_paths))
+
+    session_state = _AttrDict(loading_annotations=False)
+    _load_day(session_state, "123", first_day_paths)
+    with patch('streamlit.session_state', session_state):
+        get_image_annotations(first_day_paths[0])[0]['snow_presence'] = True
+    _load_day(session_state, "124", other_day_paths)
+    _save_annotations(session_state, force_save=True, keys=[first_day_paths[0]])
+
+    with open(os.path.join(day_dir, "day_status_123.yaml")) as f:
+        day_status = yaml.safe_load(f)
+    assert day_status['annotated_image_count'] == 2
+    assert day_status['completion_percentage'] == 100.0
+    assert day_status['file_status'] == {'a.jpg': 'completed', 'b.jpg': 'completed'}
+
+
+def test_save_caches_written_annotation_file(day_dir):
+    """Test that a file written by a save is read back from the cache, not re-parsed."""
+    image_path, = _create_images(day_dir, "a.jpg")
+    annotation_file = os.path.join(day_dir, "a_annotations.yaml")
+
+    roi = {'roi_name': 'ROI_00', 'discard': True, 'snow_presence': False, 'flags': ['fog'], 'not_needed': False}
+    session_state = _AttrDict(
+        loading_annotations=False,
+        image_annotations={image_path: [roi]},
+    )
+    _save_annotations(session_state, force_save=True)
+
+    # Later edits in memory must not leak into the cached file contents
+    roi['flags'].append('clouds')
+    with patch('streamlit.session_state', session_state), patch('yaml.load') as mock_load:
+        data = read_annotation_yaml(annotation_file)
+        mock_load.assert_not_called()
+
+    assert data['annotations'][0]['flags'] == ['fog']
+
+
+def test_get_image_annotations_converts_legacy_dict_format():
+    """Test that annotations stored as a dict keyed by ROI name are converted to a list on load."""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        image_path = os.path.join(tmpdirname, "image.jpg")
+        annotation_file = os.path.join(tmpdirname, "image_annotations.yaml")
+        with open(annotation_file, 'w') as f:
+            yaml.dump({'annotations': {'ROI_01': {'discard': True}}}, f)
+
+        session_state = _AttrDict(
+            image_annotations={},
+            pending_annotation_files={image_path: annotation_file}
+        )
+        with patch('streamlit.session_state', session_state):
+            annotations = get_image_annotations(image_path)
+
+        assert annotations == [{
+            'roi_name': 'ROI_01',
+            'discard': True,
+            'snow_presence': False,
+            'flags': [],
+            'not_needed': False
+        }]
+
+
+def test_get_image_annotations_drops_duplicate_flags():
+    """Test that repeated flags in a file are loaded once, in their stored order."""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        image_path = os.path.join(tmpdirname, "image.jpg")
+        annotation_file = os.path.join(tmpdirname, "image_annotations.yaml")
+        with open(annotation_file, 'w') as f:
+            yaml.dump({'annotations': [{'roi_name': 'ROI_00', 'flags': ['snow', 'fog', 'snow']}]}, f)
+
+        session_state = _AttrDict(
+            image_annotations={},
+            pending_annotation_files={image_path: annotation_file}
+        )
+        with patch('streamlit.session_state', session_state):
+            annotations = get_image_annotations(image_path)
+
+        assert annotations[0]['flags'] == ['snow', 'fog']
+
+
+def test_get_image_annotations_does_not_share_cached_rois():
+    """Test that editing loaded annotations leaves the parsed file cache untouched."""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        image_path = os.path.join(tmpdirname, "image.jpg")
+        annotation_file = os.path.join(tmpdirname, "image_annotations.yaml")
+        with open(annotation_file, 'w') as f:
+            yaml.dump({'annotations': [{'roi_name': 'ROI_00', 'discard': False, 'flags': []}]}, f)
+
+        session_state = _AttrDict(
+            image_annotations={},
+            pending_annotation_files={image_path: annotation_file}
+        )
+        with patch('streamlit.session_state', session_state):
+            annotations = get_image_annotations(image_path)
+            annotations[0]['discard'] = True
+            annotations[0]['flags'].append('fog')
+
+            cached = read_annotation_yaml(annotation_file)
+
+        assert cached['annotations'][0]['discard'] is False
+        assert cached['annotations'][0]['flags'] == []
+
+
+def test_scan_day_annotation_files_matches_images():
+    """Test that annotation files are matched to image files from one directory listing."""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        for name in ["a.jpg", "a_annotations.yaml", "b.png", "b_annotations.yaml",
+                     "orphan_annotations.yaml", "c.jpg", "day_status_123.yaml"]:
+            open(os.path.join(tmpdirname, name), 'w').close()
+
+        annotation_files = scan_day_annotation_files(tmpdirname)
+
+        assert annotation_files == {
+            "a.jpg": os.path.join(tmpdirname, "a_annotations.yaml"),
+            "b.png": os.path.join(tmpdirname, "b_annotations.yaml"),
+        }
+
+
+def test_annotation_signature_ignores_order():
+    """Test that the change-detection signature ignores ROI and flag order."""
+    first = [
+        {'roi_name': 'ROI_00', 'discard': False, 'snow_presence': False, 'flags': ['fog', 'clouds'], 'not_needed': False},
+        {'roi_name': 'ROI_01', 'discard': True, 'snow_presence': False, 'flags': [], 'not_needed': False},
+    ]
+    second = [
+        {'roi_name': 'ROI_01', 'discard': True, 'snow_presence': False, 'flags': [], 'not_needed': False},
+        {'roi_name': 'ROI_00', 'discard': False, 'snow_presence': False, 'flags': ['clouds', 'fog'], 'not_needed': False},
+    ]
+
+    assert annotation_signature(first) == annotation_signature(second)
+
+    second[0]['discard'] = False
+    assert annotation_signature(first) != annotation_signature(second)
+
+
+def test_flag_display_options_label_every_value():
+    """Test that flag values are grouped by category and each has a display label."""
+    flag_options = [
+        {"value": "fog", "category": "Weather"},
+        {"value": "lens_water_drops", "category": "Lens"},
+        {"value": "snow", "category": "Weather"},
+        {"value": "unsorted"},
+    ]
+    get_flag_display_options.clear()
+    try:
+        with patch('phenotag.ui.components.annotation.get_cached_flag_options', return_value=flag_options):
+            multiselect_values, label_by_value = get_flag_display_options()
+    finally:
+        get_flag_display_options.clear()
+
+    assert multiselect_values == ["lens_water_drops", "unsorted", "fog", "snow"]
+    assert label_by_value["fog"] == "fog (Weather)"
+    assert label_by_value["unsorted"] == "unsorted (Other)"
+    assert set(label_by_value) == set(multiselect_values)
+
+
+def test_update_day_status_file_reuses_image_status(day_dir):
+    """Test that statuses passed by the caller are used and missing ones are derived from the ROIs."""
+    images_data = {
+        "a.jpg": {"annotations": [{"roi_name": "ROI_00", "flags": []}]},
+        "b.jpg": {"annotations": [{"roi_name": "ROI_00", "flags": ["fog"]}]},
+        "c.jpg": {"annotations": [{"roi_name": "ROI_00", "flags": []}]},
+    }
+
+    assert update_day_status_file(day_dir, images_data, expected_count=3, statuses={"a.jpg": "completed"})
+
+    with open(os.path.join(day_dir, "day_status_123.yaml")) as f:
+        status = yaml.safe_load(f)
+    assert status["file_status"] == {
+        "a.jpg": "completed",
+        "b.jpg": "completed",
+        "c.jpg": "in_progress",
+    }
+    assert status["completion_percentage"] == 100.0
+
+
+def test_update_day_status_file_skips_unchanged_status(day_dir):
+    """Test that a day status file is only rewritten when its status changes."""
+    images_data = {"a.jpg": {"annotations": [{"roi_name": "ROI_00", "flags": ["fog"]}]}}
+    status_file = os.path.join(day_dir, "day_status_123.yaml")
+    digests = {}
+
+    assert update_day_status_file(day_dir, images_data, expected_count=2, digests=digests)
+    assert status_file in digests
+
+    with patch('phenotag.ui.components.annotation.save_yaml') as mock_save:
+        assert update_day_status_file(day_dir, images_data, expected_count=2, digests=digests)
+        mock_save.assert_not_called()
+
+    images_data["b.jpg"] = {"annotations": [{"roi_name": "ROI_00", "flags": []}]}
+    assert update_day_status_file(day_dir, images_data, expected_count=2, digests=digests)
+    with open(status_file) as f:
+        assert yaml.safe_load(f)["annotated_image_count"] == 2
+
+
+def test_migrated_day_status_checks_legacy_rois(day_dir):
+    """Test that a migrated image with every ROI annotated is completed in the day status."""
+    old_format_file = os.path.join(day_dir, "annotations_123.yaml")
+    with open(old_format_file, 'w') as f:
+        yaml.dump({
+            'year': '2024', 'station': 'station', 'instrument': 'INST', 'day_of_year': '123',
+            'annotations': {
+                'a.jpg': [{'roi_name': 'ROI_00', 'flags': ['fog']}, {'roi_name': 'ROI_01', 'discard': True}],
+                'b.jpg': [{'roi_name': 'ROI_00', 'flags': []}],
+            },
+        }, f)
+
+    assert len(migrate_day_annotations_to_per_image(old_format_file)) == 2
+
+    with open(os.path.join(day_dir, "day_status_123.yaml")) as f:
+        status = yaml.safe_load(f)
+    assert status["file_status"] == {"a.jpg": "completed", "b.jpg": "in_progress"}
+
+
 if __name__ == "__main__":
     # Run the tests (uncomment to run standalone)
     # pytest.main(["-xvs", __file__])
-    pass
\ No newline at end of file
+    pass
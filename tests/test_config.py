@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+import unittest
+from phenotag.config import load_config_files
+
+
+class TestLoadConfigFiles(unittest.TestCase):
+    def test_callers_get_independent_copies(self):
+        """Test that modifying a returned config does not change later results."""
+        config = load_config_files()
+        config['flags']['added_by_test'] = {}
+        config['stations'].clear()
+
+        fresh = load_config_files()
+        self.assertNotIn('added_by_test', fresh['flags'])
+        self.assertTrue(fresh['stations'])
+
+
+if __name__ == '__main__':
+    unittest.main()
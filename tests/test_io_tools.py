@@ -5,7 +5,7 @@ import tempfile
 import yaml
 import requests
 from unittest.mock import patch, mock_open
-from phenotag.io_tools import load_yaml
+from phenotag.io_tools import load_yaml, save_yaml
 
 
 class TestLoadYaml(unittest.TestCase):
@@ -92,5 +92,27 @@ class TestLoadYaml(unittest.TestCase):
             load_yaml('http://example.com/invalid.yaml')
 
 
+class TestSaveYaml(unittest.TestCase):
+    def test_save_yaml_with_fsync(self):
+        """Test that a synced save replaces the file and leaves no temporary file."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            target = Path(temp_dir) / 'data.yaml'
+            target.write_text('old: 1\n')
+
+            self.assertTrue(save_yaml({'new': 2}, target, fsync=True))
+            self.assertEqual(load_yaml(target), {'new': 2})
+            self.assertFalse(target.with_name('data.yaml.tmp').exists())
+
+    def test_save_yaml_failure_keeps_original(self):
+        """Test that a failed save leaves the existing file untouched."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            target = Path(temp_dir) / 'data.yaml'
+            target.write_text('old: 1\n')
+
+            self.assertFalse(save_yaml({'bad': object()}, target))
+            self.assertEqual(load_yaml(target), {'old': 1})
+            self.assertFalse(target.with_name('data.yaml.tmp').exists())
+
+
 if __name__ == '__main__':
-    unittest.main() 
\ No newline at end of file
+    unittest.main() 